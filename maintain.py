@@ -12,6 +12,8 @@ Usage (from repo root):
   python maintain.py
   python maintain.py --dry-run --verbose
   python maintain.py --strict
+  python maintain.py --watch
+  python maintain.py --state-db
 
 Exit codes:
 - 0: OK
@@ -26,10 +28,16 @@ import argparse
 import json
 import platform
 import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from tools.hash_cache import HashCache
+    from tools.repo_scan import RepoIndex
+    from tools.state_store import StateStore
 
 
 def _utc_now_iso() -> str:
@@ -74,6 +82,10 @@ class _ImageApprovalSelection:
 
 
 def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    # Reuse the tools' own validators so bad values fail here, not mid-run.
+    import tools.convert_assets_to_markdown as convert_assets_to_markdown
+    import tools.validate_notes_repo as validate_notes_repo
+
     p = argparse.ArgumentParser(description="Maintain the notes repo (docs + validation) in one command.")
     p.add_argument("--repo-root", default=None, help="Repo root path (default: directory containing this file)")
     p.add_argument("--dry-run", action="store_true", help="Compute changes but do not write any files")
@@ -94,6 +106,12 @@ def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="When converting assets, overwrite existing generated Markdown outputs",
     )
+    p.add_argument(
+        "--convert-jobs",
+        type=convert_assets_to_markdown._positive_int,
+        default=None,
+        help="When converting assets, number of concurrent pandoc conversions (default: CPU count)",
+    )
     p.add_argument(
         "--pandoc-path",
         default=None,
@@ -104,6 +122,22 @@ def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="When converting assets, prepend YAML front-matter to generated Markdown",
     )
+    p.add_argument(
+        "--validate-jobs",
+        type=validate_notes_repo._positive_int,
+        default=1,
+        help="Number of worker processes for compliance validation (default: 1, in-process)",
+    )
+    p.add_argument(
+        "--state-db",
+        nargs="?",
+        const="reports/_state.sqlite3",
+        default=None,
+        help=(
+            "Keep digests, findings, the approval mirror and the conversion ledger in a SQLite "
+            "state store (default path: reports/_state.sqlite3); JSON/Markdown reports are still written"
+        ),
+    )
     p.add_argument("--skip-docs", action="store_true", help="Skip documentation generation")
     p.add_argument("--skip-validate", action="store_true", help="Skip compliance validation")
 
@@ -131,6 +165,25 @@ def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default="Reviewed (maintain.py)",
         help="Note to store in approved_artifacts.json when approving images",
     )
+    p.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "After a full run, keep watching notes/ and the other content roots; on each change, "
+            "re-validate (only changed files are rescanned) and regenerate docs when files are added or removed"
+        ),
+    )
+    p.add_argument(
+        "--watch-poll",
+        action="store_true",
+        help="With --watch, use stat polling instead of inotify",
+    )
+    p.add_argument(
+        "--watch-debounce",
+        type=float,
+        default=0.25,
+        help="With --watch, seconds of quiet before a batch of changes is processed (default: 0.25)",
+    )
     return p.parse_args(argv)
 
 
@@ -148,8 +201,11 @@ def _load_unapproved_images_from_compliance_report(*, repo_root: Path, report_pa
 
     We define "new" images as those that the validator flagged as:
       severity=WARNING and message="Image file present; manual privacy review required."
+    Notebook image outputs appear as virtual paths (nb.ipynb#cellN-outputM.png).
     """
 
+    from tools.notebook_outputs import split_virtual_path
+
     if not report_path.exists() or not report_path.is_file():
         return []
 
@@ -175,13 +231,14 @@ def _load_unapproved_images_from_compliance_report(*, repo_root: Path, report_pa
         if not isinstance(path, str) or not path:
             continue
 
-        # Ensure it's actually an image path.
-        if not path.lower().endswith((".png", ".jpg", ".jpeg", ".gif", ".webp")):
+        # Ensure it's actually an image path (notebook outputs may be any image/* type).
+        virtual = split_virtual_path(path)
+        if not virtual and not path.lower().endswith((".png", ".jpg", ".jpeg", ".gif", ".webp")):
             continue
 
-        # Ensure it still exists.
+        # Ensure it still exists (notebook outputs: their notebook).
         try:
-            if not (repo_root / path).exists():
+            if not (repo_root / (virtual[0] if virtual else path)).exists():
                 continue
         except OSError:
             continue
@@ -199,6 +256,22 @@ def _load_unapproved_images_from_compliance_report(*, repo_root: Path, report_pa
     return out
 
 
+def _load_unapproved_images_from_state_store(*, repo_root: Path, state_store: "StateStore") -> List[str]:
+    """Same selection as the compliance-report loader, as one indexed query."""
+
+    from tools.notebook_outputs import split_virtual_path
+
+    out: List[str] = []
+    for path in state_store.finding_paths(rule="image", severity="WARN"):
+        virtual = split_virtual_path(path)
+        try:
+            if (repo_root / (virtual[0] if virtual else path)).exists():
+                out.append(path)
+        except OSError:
+            continue
+    return out
+
+
 def _effective_image_approval(ns: argparse.Namespace) -> _ImageApprovalSelection:
     if bool(getattr(ns, "approve_all_new_images", False)):
         return _ImageApprovalSelection(mode="approve-all", note=str(ns.image_approval_note))
@@ -235,7 +308,15 @@ def _approve_images(
     note: str,
     dry_run: bool,
     verbose: bool,
+    hash_cache: Optional["HashCache"] = None,
+    state_store: Optional["StateStore"] = None,
 ) -> Dict[str, Any]:
+    """Approve images in-process with one batched manifest update.
+
+    Digests the validator already computed are reused from the shared hash
+    cache; only unseen files are hashed (on a thread pool).
+    """
+
     details: Dict[str, Any] = {
         "count": len(image_paths),
         "note": note,
@@ -251,52 +332,159 @@ def _approve_images(
         return details
 
     import tools.approve_artifacts as approve_artifacts
+    from tools.hash_cache import HashCache
 
-    args: List[str] = ["--repo-root", repo_root.as_posix(), "--category", "image", "--note", note]
-    for p in image_paths:
-        args.extend(["--path", p])
-
-    rc = approve_artifacts.main(args)
-    details["exit_code"] = rc
+    cache = hash_cache if hash_cache is not None else HashCache.for_repo(repo_root)
+    try:
+        approve_artifacts.approve_paths(
+            repo_root,
+            image_paths,
+            hash_cache=cache,
+            category="image",
+            note=note,
+            state_store=state_store,
+        )
+    except ValueError as e:
+        details["exit_code"] = 2
+        details["error"] = str(e)
+        return details
+    if hash_cache is None:
+        cache.save()
+    details["exit_code"] = 0
     return details
 
 
-def _iter_docx_missing_md(notes_root: Path) -> List[Path]:
+def _iter_docx_missing_md(notes_root: Path, *, index: "RepoIndex") -> List[Path]:
     """Find DOCX files under notes/ that are missing a sibling .md output.
 
     - Ignores Word lock/temp files (prefix '~$').
     - Output convention matches tools/convert_assets_to_markdown.py default (sibling .md).
+    - Answers from the shared repo index (no extra tree walk or stat calls).
     """
 
     missing: List[Path] = []
-    try:
-        candidates = notes_root.rglob("*.docx")
-    except Exception:
-        return missing
-
-    for docx in candidates:
-        try:
-            if not docx.is_file():
-                continue
-        except OSError:
-            continue
-
+    for entry in index.iter_suffixes([".docx"], under=notes_root) or []:
         # Word lock/temp file
-        if docx.name.startswith("~$"):
+        if entry.name.startswith("~$"):
             continue
 
-        md = docx.with_suffix(".md")
-        try:
-            if not md.exists():
-                missing.append(docx)
-        except OSError:
-            missing.append(docx)
+        if not index.has_file(entry.path.with_suffix(".md")):
+            missing.append(entry.path)
 
     return missing
 
 
+def _index_is_stale(index: "RepoIndex", path: Path) -> bool:
+    """True if ``path`` differs from what the index recorded.
+
+    Files this process wrote were refreshed in the index when written, so
+    their own change events compare equal and are ignored.
+    """
+
+    rel = index.relpath(path)
+    if not rel:
+        return False
+    try:
+        st = path.stat()
+    except OSError:
+        return index.get(path) is not None or rel in index.dirs
+    if path.is_dir():
+        return rel not in index.dirs
+    entry = index.get(path)
+    return entry is None or (entry.size, entry.mtime_ns, entry.stat.st_ino) != (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def _watch(ns: argparse.Namespace, argv: Optional[List[str]]) -> int:
+    """Full maintenance run, then incremental re-runs on filesystem changes."""
+
+    if ns.dry_run:
+        print("[maintain] ERROR: --watch cannot be combined with --dry-run")
+        return 3
+
+    once_argv = [a for a in (sys.argv[1:] if argv is None else argv) if a != "--watch"]
+    rc = main(once_argv)
+
+    import tools.generate_repo_docs as generate_repo_docs
+    import tools.validate_notes_repo as validate_notes_repo
+    from tools.hash_cache import HashCache
+    from tools.repo_scan import scan_repo
+    from tools.state_store import StateStore
+    from tools.watch_repo import describe, open_watcher
+
+    repo_root = Path(ns.repo_root).expanduser().resolve() if ns.repo_root else Path(__file__).resolve().parent
+    reports_dir = repo_root / "reports"
+
+    # Long-lived state: the index is patched from events instead of rescanned.
+    index = scan_repo(repo_root)
+    state_store = StateStore(repo_root / ns.state_db) if ns.state_db else None
+    hash_cache = HashCache.from_store(state_store, root=repo_root) if state_store else HashCache.for_repo(repo_root)
+    findings_cache = validate_notes_repo.FindingsCache.load(reports_dir / validate_notes_repo.FINDINGS_CACHE_NAME)
+
+    content_roots = sorted(validate_notes_repo.CONTENT_ROOTS | validate_notes_repo.EXPORT_ROOTS)
+    watcher = open_watcher(
+        [repo_root],
+        recursive_roots=[repo_root / r for r in content_roots],
+        force_polling=bool(ns.watch_poll),
+    )
+    print(f"[maintain] watching {', '.join(content_roots)} ({describe(watcher)}); press Ctrl+C to stop")
+
+    try:
+        while True:
+            batch = watcher.wait(debounce=ns.watch_debounce)
+            if batch.overflow:
+                print(f"[maintain] change events were lost; rescanning ({describe(watcher)})")
+                index = scan_repo(repo_root)
+                changed = [repo_root]
+                structural = True
+            else:
+                changed = sorted(p for p in batch.paths if _index_is_stale(index, p))
+                if not changed:
+                    continue
+                structural = any(index.get(p) is None or not p.is_file() for p in changed)
+                index.update(changed)
+
+            started = time.monotonic()
+            if structural and not ns.skip_docs:
+                generate_repo_docs.run(
+                    repo_root,
+                    dry_run=False,
+                    verbose=bool(ns.verbose),
+                    scaffold_week_readmes=bool(ns.scaffold_week_readmes),
+                    index=index,
+                    hash_cache=hash_cache,
+                )
+            if not ns.skip_validate:
+                findings = validate_notes_repo.validate_repo(
+                    repo_root, hash_cache=hash_cache, index=index, findings_cache=findings_cache
+                )
+                validate_notes_repo.write_reports(repo_root, findings, reports_dir)
+                if state_store is not None:
+                    state_store.replace_findings(findings)
+                errors = sum(1 for f in findings if f.severity == "ERROR")
+                warns = sum(1 for f in findings if f.severity == "WARN")
+                rc = 2 if errors else (1 if ns.strict and warns else 0)
+                status = f"ERROR={errors} WARN={warns}"
+            else:
+                status = "validation skipped"
+            print(
+                f"[maintain] {len(changed)} change(s){' (docs regenerated)' if structural and not ns.skip_docs else ''}: "
+                f"{status} ({time.monotonic() - started:.2f}s)"
+            )
+    except KeyboardInterrupt:
+        print("\n[maintain] watch stopped")
+    finally:
+        watcher.close()
+        hash_cache.save()
+        findings_cache.save()
+        if state_store is not None:
+            state_store.close()
+    return rc
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ns = _parse_args(argv)
+    if ns.watch:
+        return _watch(ns, argv)
 
     repo_root = Path(ns.repo_root).expanduser().resolve() if ns.repo_root else Path(__file__).resolve().parent
     reports_dir = repo_root / "reports"
@@ -331,6 +519,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     def step(name: str, status: str, details: Dict[str, Any]) -> None:
         run_payload["steps"].append({"name": name, "status": status, "details": details})
 
+    state_store: Optional["StateStore"] = None
     try:
         if not repo_root.exists():
             raise FileNotFoundError(f"Repo root does not exist: {repo_root}")
@@ -341,9 +530,21 @@ def main(argv: Optional[List[str]] = None) -> int:
             print("[maintain] repo_root=(omitted)")
             print(f"[maintain] dry_run={ns.dry_run} strict={ns.strict}")
 
+        from tools.hash_cache import HashCache
+        from tools.repo_scan import scan_repo
+        from tools.state_store import StateStore
+
+        # One tree walk and one hash cache (and optional state store) shared by every step below.
+        index = scan_repo(repo_root)
+        if ns.state_db and not ns.dry_run:
+            state_store = StateStore(repo_root / ns.state_db)
+            hash_cache = HashCache.from_store(state_store, root=repo_root)
+        else:
+            hash_cache = HashCache.for_repo(repo_root)
+
         # 1) Optional/auto asset conversion (dry-run -> preflight -> execution)
         notes_root = repo_root / "notes"
-        docx_missing_md = _iter_docx_missing_md(notes_root)
+        docx_missing_md = _iter_docx_missing_md(notes_root, index=index)
         auto_convert = bool(docx_missing_md) and (not ns.convert_assets)
         should_convert = bool(ns.convert_assets) or auto_convert
 
@@ -352,49 +553,56 @@ def main(argv: Optional[List[str]] = None) -> int:
         else:
             import tools.convert_assets_to_markdown as convert_assets_to_markdown
 
-            base_args: List[str] = ["--repo-root", repo_root.as_posix()]
-            if ns.verbose:
-                base_args.append("--verbose")
-            if ns.pandoc_path:
-                base_args.extend(["--pandoc-path", str(ns.pandoc_path)])
-            if ns.front_matter:
-                base_args.append("--front-matter")
-            # Safety default for public notes: generated Markdown should not contain emails.
-            base_args.append("--redact-emails")
-            if ns.convert_force:
-                base_args.append("--force")
+            # Resolve pandoc once (path, version, output formats), then discover the
+            # work once; preflight and execution run against the same plan object.
+            toolchain = convert_assets_to_markdown.resolve_pandoc(ns.pandoc_path)
+            options = convert_assets_to_markdown.ConversionOptions(
+                front_matter=bool(ns.front_matter),
+                # Safety default for public notes: generated Markdown should not contain emails.
+                redact_emails=True,
+                force=bool(ns.convert_force),
+                pandoc_path=ns.pandoc_path,
+                jobs=ns.convert_jobs,
+                verbose=bool(ns.verbose),
+            )
 
             convert_details: Dict[str, Any] = {
                 "mode": "explicit" if ns.convert_assets else "auto_missing_docx_md",
                 "missing_docx_md": len(docx_missing_md),
+                "pandoc_version": toolchain.version if toolchain else None,
             }
 
-            # 1a) Dry-run plan (always safe/no-write)
-            rc_plan = convert_assets_to_markdown.main([*base_args, "--dry-run"])
-            step("convert_plan", "OK" if rc_plan == 0 else "ERROR", {**convert_details, "exit_code": rc_plan})
-            if rc_plan != 0:
-                run_payload["status"] = "FAIL"
-                run_payload["exit_code"] = 3 if rc_plan == 3 else rc_plan
-                _write_json(reports_dir / "maintenance_run.json", run_payload, dry_run=ns.dry_run)
-                _write_text(reports_dir / "maintenance_run.md", _render_run_md(run_payload), dry_run=ns.dry_run)
-                return run_payload["exit_code"]
+            # 1a) Plan (always safe/no-write)
+            plan = convert_assets_to_markdown.plan_conversions(
+                repo_root,
+                options=options,
+                index=index,
+                hash_cache=hash_cache,
+                toolchain=toolchain,
+                state_store=state_store,
+            )
+            plan.report()
+            step("convert_plan", "OK", {**convert_details, **plan.summary()})
 
             # 1b) Preflight validation (tooling prerequisites)
-            rc_pre = convert_assets_to_markdown.main([*base_args, "--preflight"])
-            if rc_pre != 0 and auto_convert:
+            pre_ok, pre_msg = plan.preflight()
+            if not pre_ok:
+                print(f"[convert] ERROR: {pre_msg}")
+            if not pre_ok and auto_convert:
                 # If auto-triggered, do not fail the whole wrapper just because pandoc isn't installed.
                 # Record it and continue with docs/validation.
                 step(
                     "convert_preflight",
                     "SKIPPED",
-                    {**convert_details, "exit_code": rc_pre, "reason": "preflight failed (likely pandoc missing)"},
+                    {**convert_details, "exit_code": 2, "reason": "preflight failed (likely pandoc missing)"},
                 )
                 step("convert_execute", "SKIPPED", {**convert_details, "reason": "preflight failed"})
             else:
+                rc_pre = 0 if pre_ok else 2
                 step("convert_preflight", "OK" if rc_pre == 0 else "ERROR", {**convert_details, "exit_code": rc_pre})
                 if rc_pre != 0:
                     run_payload["status"] = "FAIL"
-                    run_payload["exit_code"] = 3 if rc_pre == 3 else rc_pre
+                    run_payload["exit_code"] = rc_pre
                     _write_json(reports_dir / "maintenance_run.json", run_payload, dry_run=ns.dry_run)
                     _write_text(reports_dir / "maintenance_run.md", _render_run_md(run_payload), dry_run=ns.dry_run)
                     return run_payload["exit_code"]
@@ -403,11 +611,24 @@ def main(argv: Optional[List[str]] = None) -> int:
                 if ns.dry_run:
                     step("convert_execute", "SKIPPED", {**convert_details, "reason": "wrapper dry-run"})
                 else:
-                    rc_exec = convert_assets_to_markdown.main(base_args)
-                    step("convert_execute", "OK" if rc_exec == 0 else "ERROR", {**convert_details, "exit_code": rc_exec})
+                    result = plan.execute()
+                    rc_exec = result.exit_code
+                    # Refresh just the Markdown, media dirs and ledger the conversion wrote.
+                    index.update(result.outputs)
+                    step(
+                        "convert_execute",
+                        "OK" if rc_exec == 0 else "ERROR",
+                        {
+                            **convert_details,
+                            "exit_code": rc_exec,
+                            "attempted": result.attempted,
+                            "converted": result.ok,
+                            "errors": result.errors,
+                        },
+                    )
                     if rc_exec != 0:
                         run_payload["status"] = "FAIL"
-                        run_payload["exit_code"] = 3 if rc_exec == 3 else rc_exec
+                        run_payload["exit_code"] = rc_exec
                         _write_json(reports_dir / "maintenance_run.json", run_payload, dry_run=ns.dry_run)
                         _write_text(reports_dir / "maintenance_run.md", _render_run_md(run_payload), dry_run=ns.dry_run)
                         return run_payload["exit_code"]
@@ -417,10 +638,7 @@ def main(argv: Optional[List[str]] = None) -> int:
                         still_missing: List[str] = []
                         for docx in docx_missing_md:
                             md = docx.with_suffix(".md")
-                            try:
-                                if not md.exists():
-                                    still_missing.append(_safe_relpath(md, repo_root))
-                            except OSError:
+                            if not index.has_file(md):
                                 still_missing.append(_safe_relpath(md, repo_root))
 
                         if still_missing:
@@ -446,6 +664,8 @@ def main(argv: Optional[List[str]] = None) -> int:
                 dry_run=ns.dry_run,
                 verbose=ns.verbose,
                 scaffold_week_readmes=ns.scaffold_week_readmes,
+                index=index,
+                hash_cache=hash_cache,
             )
 
             docs_details: Dict[str, Any] = {"exit_code": rc_docs}
@@ -455,7 +675,7 @@ def main(argv: Optional[List[str]] = None) -> int:
                     reports_dir / "repo_health_report.md",
                     reports_dir / "repo_inventory.json",
                     reports_dir / "repo_change_report.md",
-                    reports_dir / "_repo_docs_state.json",
+                    reports_dir / "_repo_docs_state.bin",
                 ]
                 missing = _missing_paths(expected_docs_outputs)
                 if missing:
@@ -481,7 +701,9 @@ def main(argv: Optional[List[str]] = None) -> int:
             val_args: List[str] = ["--path", repo_root.as_posix(), "--report-dir", "reports"]
             if ns.strict:
                 val_args.append("--strict")
-            rc_val = validate_notes_repo.main(val_args)
+            if ns.validate_jobs > 1:
+                val_args += ["--jobs", str(ns.validate_jobs)]
+            rc_val = validate_notes_repo.main(val_args, index=index, hash_cache=hash_cache, state_store=state_store)
 
             validate_details: Dict[str, Any] = {"exit_code": rc_val}
             if rc_val in (0, 1) and not ns.dry_run:
@@ -511,11 +733,16 @@ def main(argv: Optional[List[str]] = None) -> int:
         if ns.dry_run or ns.skip_validate:
             step("image_approval", "SKIPPED", {"reason": "dry-run or validation skipped"})
         else:
-            report_json = reports_dir / "compliance_report.json"
-            unapproved_images = _load_unapproved_images_from_compliance_report(
-                repo_root=repo_root,
-                report_path=report_json,
-            )
+            if state_store is not None:
+                unapproved_images = _load_unapproved_images_from_state_store(
+                    repo_root=repo_root, state_store=state_store
+                )
+            else:
+                report_json = reports_dir / "compliance_report.json"
+                unapproved_images = _load_unapproved_images_from_compliance_report(
+                    repo_root=repo_root,
+                    report_path=report_json,
+                )
 
             if not unapproved_images:
                 step("image_approval", "SKIPPED", {"reason": "no new images"})
@@ -575,6 +802,8 @@ def main(argv: Optional[List[str]] = None) -> int:
                             note=image_sel.note,
                             dry_run=False,
                             verbose=bool(ns.verbose),
+                            hash_cache=hash_cache,
+                            state_store=state_store,
                         )
                         step("image_approval", "OK" if details.get("exit_code", 0) == 0 else "ERROR", {"mode": mode, **details})
                         if details.get("exit_code", 0) != 0:
@@ -591,7 +820,12 @@ def main(argv: Optional[List[str]] = None) -> int:
                             val_args2: List[str] = ["--path", repo_root.as_posix(), "--report-dir", "reports"]
                             if ns.strict:
                                 val_args2.append("--strict")
-                            rc_val2 = validate_notes_repo.main(val_args2)
+                            if ns.validate_jobs > 1:
+                                val_args2 += ["--jobs", str(ns.validate_jobs)]
+                            # Same tree as the first pass; only the approval manifest changed.
+                            rc_val2 = validate_notes_repo.main(
+                                val_args2, index=index, hash_cache=hash_cache, state_store=state_store
+                            )
                             step("validate_after_approval", "OK" if rc_val2 == 0 else ("WARN" if rc_val2 == 1 else "ERROR"), {"exit_code": rc_val2})
                             rc_val = rc_val2
                     else:
@@ -602,6 +836,8 @@ def main(argv: Optional[List[str]] = None) -> int:
                         else:
                             step("image_approval", "SKIPPED", {"reason": "no images approved"})
 
+        hash_cache.save(dry_run=ns.dry_run)
+
         run_payload["status"] = "OK" if rc_val == 0 else ("WARN" if rc_val == 1 else "FAIL")
         run_payload["exit_code"] = rc_val
 
@@ -629,6 +865,9 @@ def main(argv: Optional[List[str]] = None) -> int:
             raise
         print(f"[maintain] ERROR: {type(e).__name__}: {e}")
         return 3
+    finally:
+        if state_store is not None:
+            state_store.close()
 
 
 def _render_run_md(payload: Dict[str, Any]) -> str:
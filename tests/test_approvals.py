@@ -0,0 +1,96 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+class TestApprovalJournal(unittest.TestCase):
+    def test_approvals_append_to_journal_and_compact_into_snapshot(self) -> None:
+        import tools.approve_artifacts as approve_artifacts
+        from tools.approvals import journal_path, load_approval_manifest
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "notes").mkdir()
+            (root / "notes" / "a.png").write_bytes(b"a")
+            (root / "notes" / "b.png").write_bytes(b"b")
+            manifest = root / "approved_artifacts.json"
+            snapshot = {"version": 1, "approved": {"notes/old.png": {"sha256": "00", "category": "image"}}}
+            manifest.write_text(json.dumps(snapshot), encoding="utf-8")
+
+            argv = ["--repo-root", str(root)]
+            self.assertEqual(approve_artifacts.main(argv + ["--path", "notes/a.png", "--path", "notes/b.png"]), 0)
+            self.assertEqual(approve_artifacts.main(argv + ["--remove", "--path", "notes/b.png"]), 0)
+
+            # The snapshot is untouched; readers see snapshot + journal.
+            self.assertEqual(json.loads(manifest.read_text(encoding="utf-8")), snapshot)
+            self.assertEqual(len(journal_path(manifest).read_text(encoding="utf-8").splitlines()), 3)
+            merged = load_approval_manifest(manifest)["approved"]
+            self.assertEqual(sorted(merged), ["notes/a.png", "notes/old.png"])
+
+            # A torn final line (interrupted append) is ignored.
+            with journal_path(manifest).open("a", encoding="utf-8") as f:
+                f.write('{"op": "appr')
+            self.assertEqual(load_approval_manifest(manifest)["approved"], merged)
+
+            self.assertEqual(approve_artifacts.main(argv + ["--compact"]), 0)
+            self.assertFalse(journal_path(manifest).exists())
+            self.assertEqual(json.loads(manifest.read_text(encoding="utf-8"))["approved"], merged)
+
+    def test_journal_is_compacted_past_the_size_threshold(self) -> None:
+        import tools.approve_artifacts as approve_artifacts
+        from tools.approvals import journal_path
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "a.png").write_bytes(b"a")
+            with mock.patch.object(approve_artifacts, "COMPACT_JOURNAL_BYTES", 1):
+                self.assertEqual(approve_artifacts.main(["--repo-root", str(root), "--path", "a.png"]), 0)
+
+            manifest = root / "approved_artifacts.json"
+            self.assertFalse(journal_path(manifest).exists())
+            self.assertEqual(list(json.loads(manifest.read_text(encoding="utf-8"))["approved"]), ["a.png"])
+
+    def test_approve_paths_reuses_known_digests_and_appends_once(self) -> None:
+        import hashlib
+
+        import tools.approve_artifacts as approve_artifacts
+        from tools.approvals import journal_path, load_approval_manifest
+        from tools.approve_artifacts import approve_paths
+        from tools.hash_cache import HashCache
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            for name in ("a.png", "b.png", "c.png"):
+                (root / name).write_bytes(name.encode())
+            cache = HashCache(root=root)
+            cache.sha256(root / "a.png")  # already hashed by the validator
+            misses = cache.misses
+
+            with mock.patch.object(
+                approve_artifacts, "append_approval_changes", wraps=approve_artifacts.append_approval_changes
+            ) as append:
+                changes = approve_paths(
+                    root,
+                    ["a.png", "b.png", "c.png", "b.png"],
+                    hash_cache=cache,
+                    note="Reviewed",
+                    known_hashes={"c.png": "f" * 64},
+                    jobs=2,
+                )
+            self.assertEqual(append.call_count, 1)
+
+            self.assertEqual([rel for rel, _entry in changes], ["a.png", "b.png", "c.png"])
+            self.assertEqual(cache.misses - misses, 1)  # only b.png was read
+            merged = load_approval_manifest(root / "approved_artifacts.json")["approved"]
+            self.assertEqual(merged["b.png"]["sha256"], hashlib.sha256(b"b.png").hexdigest())
+            self.assertEqual(merged["c.png"]["sha256"], "f" * 64)
+            self.assertEqual(len(journal_path(root / "approved_artifacts.json").read_text(encoding="utf-8").splitlines()), 3)
+
+            with self.assertRaises(ValueError):
+                approve_paths(root, ["missing.png"], hash_cache=cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
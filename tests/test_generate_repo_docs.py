@@ -0,0 +1,183 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+def _make_repo(root: Path) -> None:
+    for name in ("README.md", "COMPLIANCE.md", "LICENSE.md", "CODE_OF_CONDUCT.md", "CONTRIBUTING.md"):
+        (root / name).write_text(f"# {name}\n", encoding="utf-8")
+    week = root / "notes" / "Term" / "COURSE" / "Week01"
+    week.mkdir(parents=True)
+    (week / "notes.md").write_text("# Week 1\n", encoding="utf-8")
+    (week / "plot.png").write_bytes(b"png")
+
+
+class TestGenerateRepoDocs(unittest.TestCase):
+    def _run(self, root: Path) -> dict:
+        from tools.generate_repo_docs import run
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(run(root, dry_run=False, verbose=False), 0)
+        return json.loads((root / "reports" / "repo_inventory.json").read_text(encoding="utf-8"))
+
+    def test_manifest_diff_is_stat_first(self) -> None:
+        import tools.hash_cache as hash_cache_mod
+        from tools.docs_state import DocsState
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+            self._run(root)
+            (root / "reports" / "_hash_cache.json").unlink()
+
+            # No stat change: nothing is hashed, even with a cold hash cache.
+            with mock.patch.object(hash_cache_mod, "sha256_file", side_effect=AssertionError("hashed")):
+                from tools.generate_repo_docs import run
+
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.assertEqual(run(root, dry_run=False, verbose=False), 0)
+
+            # Touched but identical: rehashed, not reported as modified.
+            notes = root / "notes" / "Term" / "COURSE" / "Week01" / "notes.md"
+            st = notes.stat()
+            os.utime(notes, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            (root / "notes" / "Term" / "COURSE" / "Week01" / "new.md").write_text("# New\n", encoding="utf-8")
+            inventory = self._run(root)
+            self.assertEqual(inventory["changes"]["modified"], [])
+            self.assertEqual(inventory["changes"]["added"], ["notes/Term/COURSE/Week01/new.md"])
+
+            notes.write_text("# Week 1 (edited)\n", encoding="utf-8")
+            inventory = self._run(root)
+            self.assertEqual(inventory["changes"]["modified"], ["notes/Term/COURSE/Week01/notes.md"])
+
+            state = DocsState.load(root / "reports" / "_repo_docs_state.bin")
+            self.assertIn("README.md", state)
+            self.assertNotIn("notes/INDEX.md", state)
+
+    def test_touched_identical_file_persists_its_new_stat(self) -> None:
+        import tools.hash_cache as hash_cache_mod
+        from tools.docs_state import DocsState
+        from tools.generate_repo_docs import run
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+            self._run(root)
+            state_path = root / "reports" / "_repo_docs_state.bin"
+            generated_at = DocsState.load(state_path).generated_at
+
+            notes = root / "notes" / "Term" / "COURSE" / "Week01" / "notes.md"
+            st = notes.stat()
+            os.utime(notes, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(run(root, dry_run=False, verbose=False), 0)
+
+            state = DocsState.load(state_path)
+            self.assertEqual(state["notes/Term/COURSE/Week01/notes.md"]["mtime_ns"], notes.stat().st_mtime_ns)
+            self.assertEqual(state.generated_at, generated_at)
+
+            # The next run is stat-only again, even with a cold hash cache, and
+            # decodes the previous state once instead of looking up each path.
+            (root / "reports" / "_hash_cache.json").unlink()
+            with mock.patch.object(hash_cache_mod, "sha256_file", side_effect=AssertionError("hashed")), \
+                    mock.patch.object(DocsState, "_find", side_effect=AssertionError("per-file lookup")):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.assertEqual(run(root, dry_run=False, verbose=False), 0)
+
+    def test_notes_model_drives_index_health_and_scaffolding(self) -> None:
+        from tools.generate_repo_docs import run
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+            course = root / "notes" / "Term" / "COURSE"
+            (course / "Week01" / "sub").mkdir()
+            (course / "Week01" / "sub" / "deep.md").write_text("# Deep\n", encoding="utf-8")
+            (course / "Week02").mkdir()
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(run(root, dry_run=False, verbose=False, scaffold_week_readmes=True), 0)
+            inventory = json.loads((root / "reports" / "repo_inventory.json").read_text(encoding="utf-8"))
+
+            weeks = inventory["notes_tree"]["terms"]["Term"]["courses"]["COURSE"]["weeks"]
+            self.assertEqual(list(weeks), ["Week01", "Week02"])
+            self.assertEqual(weeks["Week01"]["md_count"], 3)  # notes.md, sub/deep.md, scaffolded README
+            self.assertEqual(weeks["Week02"]["readme"], "notes/Term/COURSE/Week02/README.md")
+            health = inventory["notes_health"]
+            self.assertEqual((health["week_count"], health["weeks_missing_readme_count"]), (2, 0))
+            self.assertEqual(health["notes_asset_suffix_counts"], {".png": 1})
+            self.assertIn("(Term/COURSE/Week02/README.md)", (root / "notes" / "INDEX.md").read_text(encoding="utf-8"))
+
+    def test_index_rerenders_only_changed_courses(self) -> None:
+        import tools.generate_repo_docs as gen
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+            other = root / "notes" / "Term" / "OTHER" / "Week01"
+            other.mkdir(parents=True)
+            (other / "README.md").write_text("# Other\n", encoding="utf-8")
+            self._run(root)
+
+            (other / "extra.md").write_text("# Extra\n", encoding="utf-8")
+            (root / "notes" / "Term2" / "NEW" / "Week01").mkdir(parents=True)
+            with mock.patch.object(gen, "_render_course_fragment", wraps=gen._render_course_fragment) as render:
+                self._run(root)
+            self.assertEqual(sorted(c.args[0] for c in render.call_args_list), ["NEW", "OTHER"])
+
+            def body(text: str) -> str:
+                return "\n".join(line for line in text.splitlines() if not line.startswith("Last updated"))
+
+            spliced = (root / "notes" / "INDEX.md").read_text(encoding="utf-8")
+            tree = gen._build_notes_model(gen.scan_repo(root), root / "notes").tree
+            self.assertEqual(body(spliced), body(gen._render_notes_index_md(root, tree)))
+
+
+class TestDocsState(unittest.TestCase):
+    def test_round_trip_and_lookup(self) -> None:
+        from tools.docs_state import DocsState, DocsStateError, encode_docs_state
+
+        files = {
+            "b.md": {"size": 3, "mtime_ns": 7, "sha256": "ab" * 32},
+            "notes/Über/é.md": {"size": 1, "mtime_ns": 2, "sha256": None, "tree_sha256": "cd" * 32},
+            "a.md": {"size": 0, "mtime_ns": 1, "sha256": None},
+        }
+        state = DocsState(encode_docs_state(files, generated_at="2026-01-01T00:00:00Z"))
+        self.assertEqual(state.generated_at, "2026-01-01T00:00:00Z")
+        self.assertEqual(list(state), sorted(files))
+        self.assertEqual(dict(state.items()), files)
+        self.assertEqual(state.to_dict(), files)
+        self.assertNotIn("c.md", state)
+        with self.assertRaises(KeyError):
+            state["c.md"]
+        with self.assertRaises(DocsStateError):
+            DocsState(b"JUNK" + bytes(12))
+
+    def test_legacy_json_state_is_migrated(self) -> None:
+        from tools.docs_state import DocsState
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+            (root / "reports").mkdir()
+            legacy = {"version": 1, "generated_at": "x", "files": {"README.md": {"size": 1, "mtime_ns": 1, "sha256": None}}}
+            (root / "reports" / "_repo_docs_state.json").write_text(json.dumps(legacy), encoding="utf-8")
+            self._run_docs(root)
+            state = DocsState.load(root / "reports" / "_repo_docs_state.bin")
+            self.assertIn("README.md", state)
+            self.assertIsNotNone(state["README.md"]["sha256"])
+
+    def _run_docs(self, root: Path) -> None:
+        from tools.generate_repo_docs import run
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(run(root, dry_run=False, verbose=False), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TestHashCache(unittest.TestCase):
+    def test_warm_lookup_is_stat_only_and_persists(self) -> None:
+        from tools.hash_cache import HashCache, default_cache_path
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            img = root / "notes" / "a.png"
+            img.parent.mkdir(parents=True)
+            img.write_bytes(b"fake image bytes")
+
+            cache = HashCache.for_repo(root)
+            digest = cache.sha256(img)
+            self.assertEqual(digest, hashlib.sha256(b"fake image bytes").hexdigest())
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+            cache.save()
+            self.assertTrue(default_cache_path(root).exists())
+
+            warm = HashCache.for_repo(root)
+            self.assertEqual(warm.sha256(img), digest)
+            self.assertEqual((warm.hits, warm.misses), (1, 0))
+
+    def test_stat_change_forces_rehash(self) -> None:
+        from tools.hash_cache import HashCache
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            f = root / "a.png"
+            f.write_bytes(b"one")
+
+            cache = HashCache(root=root)
+            first = cache.sha256(f)
+
+            f.write_bytes(b"two!")
+            st = f.stat()
+            os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+            second = cache.sha256(f)
+            self.assertNotEqual(first, second)
+            self.assertEqual(second, hashlib.sha256(b"two!").hexdigest())
+            self.assertEqual(cache.misses, 2)
+
+    def test_save_drops_entries_for_deleted_files(self) -> None:
+        from tools.hash_cache import HashCache
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            keep = root / "keep.png"
+            gone = root / "gone.png"
+            keep.write_bytes(b"k")
+            gone.write_bytes(b"g")
+
+            cache = HashCache.for_repo(root)
+            cache.sha256(keep)
+            cache.sha256(gone)
+            cache.save()
+
+            gone.unlink()
+            reloaded = HashCache.for_repo(root)
+            reloaded.save()
+
+            again = HashCache.for_repo(root)
+            self.assertIn("keep.png", again._entries)
+            self.assertNotIn("gone.png", again._entries)
+
+    def test_tree_hash_is_parallel_safe_and_cached_next_to_sha256(self) -> None:
+        from tools.hash_cache import HashCache, tree_sha256_file
+        from tools.state_store import StateStore
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            big = root / "lecture.pdf"
+            big.write_bytes(os.urandom(10_000))
+
+            serial = tree_sha256_file(big, block_size=1024, jobs=1)
+            self.assertEqual(tree_sha256_file(big, block_size=1024, jobs=4), serial)
+            self.assertNotEqual(tree_sha256_file(big, block_size=2048, jobs=4), serial)
+
+            with StateStore(root / "state.sqlite3") as store:
+                cache = HashCache.from_store(store, root=root)
+                digest = cache.sha256(big)
+                tree = cache.tree_sha256(big)
+                cache.save()
+
+                warm = HashCache.from_store(store, root=root)
+                self.assertEqual((warm.sha256(big), warm.tree_sha256(big)), (digest, tree))
+                self.assertEqual((warm.hits, warm.misses), (2, 0))
+
+            with big.open("r+b") as f:
+                f.seek(5000)
+                f.write(b"x")
+            self.assertNotEqual(HashCache(root=root).tree_sha256(big), tree)
+
+
+if __name__ == "__main__":
+    unittest.main()
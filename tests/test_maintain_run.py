@@ -0,0 +1,64 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+
+def _make_repo(root: Path) -> None:
+    for name in ("README.md", "COMPLIANCE.md", "LICENSE.md", "CODE_OF_CONDUCT.md", "CONTRIBUTING.md"):
+        (root / name).write_text(f"# {name}\n", encoding="utf-8")
+    week = root / "notes" / "Term" / "COURSE" / "Week01"
+    week.mkdir(parents=True)
+    (week / "notes.md").write_text("# Week 1\n\nSome notes.\n", encoding="utf-8")
+
+
+class TestMaintainRun(unittest.TestCase):
+    def test_full_run_on_minimal_repo(self) -> None:
+        import maintain as maintain_mod
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                rc = maintain_mod.main(["--repo-root", str(root), "--image-approval", "off"])
+            self.assertEqual(rc, 0)
+
+            run = json.loads((root / "reports" / "maintenance_run.json").read_text(encoding="utf-8"))
+            steps = {s["name"]: s["status"] for s in run["steps"]}
+            self.assertEqual(run["status"], "OK")
+            self.assertEqual(steps.get("docs"), "OK")
+            self.assertEqual(steps.get("validate"), "OK")
+            self.assertTrue((root / "notes" / "INDEX.md").exists())
+            self.assertTrue((root / "reports" / "compliance_report.json").exists())
+
+    def test_state_db_run_keeps_state_in_sqlite(self) -> None:
+        import maintain as maintain_mod
+        from tools.state_store import StateStore
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+            (root / "notes" / "Term" / "COURSE" / "Week01" / "plot.png").write_bytes(b"png")
+
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                rc = maintain_mod.main(["--repo-root", str(root), "--image-approval", "list", "--state-db"])
+            self.assertEqual(rc, 0)
+            self.assertIn("- notes/Term/COURSE/Week01/plot.png", out.getvalue())
+            # Reports remain as exports; the digest cache moved into the store.
+            self.assertTrue((root / "reports" / "compliance_report.json").exists())
+            self.assertFalse((root / "reports" / "_hash_cache.json").exists())
+
+            with StateStore(root / "reports" / "_state.sqlite3") as store:
+                self.assertIn("notes/Term/COURSE/Week01/plot.png", store.load_fingerprints())
+                self.assertEqual(
+                    maintain_mod._load_unapproved_images_from_state_store(repo_root=root, state_store=store),
+                    ["notes/Term/COURSE/Week01/plot.png"],
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import ctypes
+import errno
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TestRepoScan(unittest.TestCase):
+    def test_scan_indexes_files_and_prunes_vcs_dirs(self) -> None:
+        from tools.repo_scan import scan_repo
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "notes" / "T" / "C" / "Week01").mkdir(parents=True)
+            (root / "notes" / "T" / "C" / "Week01" / "a.PNG").write_bytes(b"x")
+            (root / "README.md").write_text("# hi\n", encoding="utf-8")
+            (root / ".git").mkdir()
+            (root / ".git" / "HEAD").write_text("ref\n", encoding="utf-8")
+
+            index = scan_repo(root)
+
+            self.assertEqual([e.rel for e in index.files], ["README.md", "notes/T/C/Week01/a.PNG"])
+            img = index.get(root / "notes" / "T" / "C" / "Week01" / "a.PNG")
+            assert img is not None
+            self.assertEqual(img.suffix, ".png")
+            self.assertEqual(img.root, "notes")
+            self.assertEqual(img.size, 1)
+            self.assertIn("notes/T/C/Week01", index.dirs)
+            self.assertNotIn(".git", index.dirs)
+
+    def test_update_tracks_written_and_removed_files(self) -> None:
+        from tools.repo_scan import scan_repo
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            old = root / "notes" / "old.md"
+            old.parent.mkdir(parents=True)
+            old.write_text("old\n", encoding="utf-8")
+            index = scan_repo(root)
+
+            new = root / "notes" / "new.md"
+            new.write_text("new\n", encoding="utf-8")
+            old.unlink()
+            index.update([new, old])
+
+            self.assertEqual([e.rel for e in index.files_under(root / "notes") or []], ["notes/new.md"])
+            self.assertIsNone(index.files_under(Path(td).parent / "elsewhere"))
+
+    def test_update_refreshes_moved_directories(self) -> None:
+        from tools.repo_scan import scan_repo
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            week = root / "notes" / "Week01"
+            week.mkdir(parents=True)
+            (week / "a.md").write_text("a\n", encoding="utf-8")
+            index = scan_repo(root)
+
+            moved = root / "notes" / "Week02"
+            week.rename(moved)
+            index.update([week, moved])
+
+            self.assertEqual([e.rel for e in index.files], ["notes/Week02/a.md"])
+            self.assertNotIn("notes/Week01", index.dirs)
+
+    def test_polling_watcher_reports_changes(self) -> None:
+        from tools.watch_repo import PollingWatcher
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "notes").mkdir()
+            watcher = PollingWatcher([root], recursive_roots=[root / "notes"], poll_interval=0.01)
+            self.assertFalse(watcher.wait(timeout=0.05, debounce=0.01))
+
+            target = root / "notes" / "a.md"
+            target.write_text("a\n", encoding="utf-8")
+            batch = watcher.wait(timeout=1.0, debounce=0.01)
+            self.assertEqual(batch.paths, {target})
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+    def test_inotify_watcher_falls_back_to_polling_when_out_of_watches(self) -> None:
+        from tools.watch_repo import InotifyWatcher, describe
+
+        def out_of_watches(_fd: int, _path: bytes, _mask: int) -> int:
+            ctypes.set_errno(errno.ENOSPC)
+            return -1
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "notes").mkdir()
+            watcher = InotifyWatcher([root], recursive_roots=[root / "notes"], poll_interval=0.01)
+            try:
+                watcher._add_watch = out_of_watches
+                (root / "notes" / "Week01").mkdir()
+                self.assertTrue(watcher.wait(timeout=1.0, debounce=0.01).overflow)
+                self.assertEqual(describe(watcher), "polling")
+
+                target = root / "notes" / "Week01" / "a.md"
+                target.write_text("a\n", encoding="utf-8")
+                self.assertEqual(watcher.wait(timeout=1.0, debounce=0.01).paths, {target})
+            finally:
+                watcher.close()
+
+    def test_maintain_missing_md_detection_uses_index(self) -> None:
+        import maintain as maintain_mod
+        from tools.repo_scan import scan_repo
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            week = root / "notes" / "T" / "C" / "Week01" / "docx"
+            week.mkdir(parents=True)
+            (week / "done.docx").write_bytes(b"PK")
+            (week / "done.md").write_text("x\n", encoding="utf-8")
+            (week / "todo.docx").write_bytes(b"PK")
+            (week / "~$todo.docx").write_bytes(b"lock")
+
+            got = maintain_mod._iter_docx_missing_md(root / "notes", index=scan_repo(root))
+            self.assertEqual(got, [week / "todo.docx"])
+
+
+if __name__ == "__main__":
+    unittest.main()
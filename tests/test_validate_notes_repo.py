@@ -0,0 +1,276 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+
+def _make_repo(root: Path) -> None:
+    week = root / "notes" / "Semester" / "COURSE" / "Week01"
+    week.mkdir(parents=True)
+    # Assembled at runtime so the repo validator does not flag this file.
+    email = "someone" + "@" + "example.com"
+    phone = "555-123-" + "4567"
+    (week / "a.md").write_text(f"Midterm review. Contact {email} or {phone}.\n", encoding="utf-8")
+    (week / "b.md").write_text("Answer key attached.\n", encoding="utf-8")
+    (week / "plot.png").write_bytes(b"fake png")
+    (week / "slides.pptx").write_bytes(b"fake pptx")
+    (root / "README.md").write_text("# Notes\n", encoding="utf-8")
+
+
+class TestValidateNotesRepo(unittest.TestCase):
+    def test_parallel_findings_match_sequential_and_are_sorted(self) -> None:
+        from tools.hash_cache import HashCache
+        from tools.validate_notes_repo import validate_repo
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+
+            sequential = validate_repo(root, approvals={}, hash_cache=HashCache(root=root))
+            cache = HashCache(root=root)
+            parallel = validate_repo(root, approvals={}, hash_cache=cache, jobs=3)
+
+            self.assertEqual(parallel, sequential)
+            self.assertEqual(parallel, sorted(parallel, key=lambda f: (f.path, f.rule)))
+            rules = [(f.path, f.rule) for f in parallel if f.path.endswith("/a.md")]
+            self.assertEqual([r for _p, r in rules], ["email", "exam_content", "phone"])
+
+            # Digests computed in workers are recorded in the caller's cache.
+            self.assertEqual(cache.misses, 2)
+            warm = validate_repo(root, approvals={}, hash_cache=cache, jobs=3)
+            self.assertEqual(warm, sequential)
+            self.assertEqual(cache.hits, 2)
+
+    def test_findings_cache_reuses_unchanged_files_and_tracks_rules(self) -> None:
+        import re
+
+        import tools.validate_notes_repo as v
+        from tools.hash_cache import HashCache
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+            cache_path = root / "reports" / v.FINDINGS_CACHE_NAME
+            hashes = HashCache(root=root)
+
+            cold = v.FindingsCache.load(cache_path)
+            first = v.validate_repo(root, approvals={}, hash_cache=hashes, findings_cache=cold)
+            cold.save()
+            self.assertEqual(cold.hits, 0)
+
+            warm = v.FindingsCache.load(cache_path)
+            self.assertEqual(v.validate_repo(root, approvals={}, hash_cache=hashes, findings_cache=warm), first)
+            self.assertEqual((warm.hits, warm.misses), (3, 0))  # README.md, a.md, b.md
+
+            b = root / "notes" / "Semester" / "COURSE" / "Week01" / "b.md"
+            b.write_text("Plain notes.\n", encoding="utf-8")
+            warm.save()
+            edited = v.FindingsCache.load(cache_path)
+            got = v.validate_repo(root, approvals={}, hash_cache=hashes, findings_cache=edited)
+            self.assertNotIn("answer_key", [f.rule for f in got])
+            self.assertEqual(edited.hits, 2)
+
+            edited.save()
+            original = list(v.PATTERNS)
+            try:
+                v.PATTERNS.append(("plain", "WARN", re.compile(r"plain", re.I), "Plain.", "Hint."))
+                changed = v.FindingsCache.load(cache_path)
+                got = v.validate_repo(root, approvals={}, hash_cache=hashes, findings_cache=changed)
+            finally:
+                v.PATTERNS[:] = original
+            self.assertEqual(changed.hits, 0)
+            self.assertIn("plain", [f.rule for f in got])
+
+    def test_combined_regex_attributes_each_rule_in_one_pass(self) -> None:
+        import tools.validate_notes_repo as v
+
+        phone = "(212) 555-" + "0199"
+        text = f"SOLUTIONS MANUAL below. Call {phone}. Gradebook export."
+        combined = v.combined_text_regex(True)
+        self.assertEqual(
+            [m.lastgroup for m in combined.finditer(text)],
+            ["answer_key", "phone", "student_record"],
+        )
+
+        findings: list = []
+        v.validate_text_file(Path("."), Path("notes/x.md"), text, findings, apply_integrity_patterns=False)
+        self.assertEqual([f.rule for f in findings], ["phone"])
+        self.assertIn("***-***-0199", findings[0].message)
+
+    def test_all_matches_reports_every_hit_with_line_and_col(self) -> None:
+        import tools.validate_notes_repo as v
+
+        at = "@"
+        text = f"intro\nmail a{at}example.com and b{at}example.org\n\n  c{at}example.net\n"
+        findings: list = []
+        v.validate_text_file(Path("."), Path("notes/x.md"), text, findings, apply_integrity_patterns=False, all_matches=True)
+        self.assertEqual([(f.rule, f.line, f.col) for f in findings], [("email", 2, 6), ("email", 2, 24), ("email", 4, 3)])
+
+        first: list = []
+        v.validate_text_file(Path("."), Path("notes/x.md"), text, first, apply_integrity_patterns=False)
+        self.assertEqual([(f.line, f.col) for f in first], [(2, 6)])
+
+    def test_streamed_file_scan_matches_whole_text_scan(self) -> None:
+        from unittest import mock
+
+        import tools.validate_notes_repo as v
+
+        at = "@"
+        text = "x" * 50 + f"\r\nMidterm: mail jo{at}example.com\n" + "y" * 37 + f" k{at}example.org answer\nkey\n"
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            f = root / "notes" / "big.md"
+            f.parent.mkdir()
+            f.write_bytes(text.encode("utf-8"))
+
+            expected: list = []
+            v.validate_text_file(
+                root, f, f.read_text(encoding="utf-8"), expected, apply_integrity_patterns=True, all_matches=True
+            )
+            with mock.patch.object(v, "SCAN_WINDOW_CHARS", 7), mock.patch.object(v, "SCAN_OVERLAP_CHARS", 32):
+                got: list = []
+                self.assertTrue(v.validate_text_path(root, f, got, apply_integrity_patterns=True, all_matches=True))
+
+            self.assertEqual(got, expected)
+            self.assertEqual([(x.rule, x.line, x.col) for x in got if x.rule == "email"], [("email", 2, 15), ("email", 3, 39)])
+
+    def test_notebook_scans_text_parts_and_routes_images_to_approval(self) -> None:
+        import maintain as maintain_mod
+        import tools.approve_artifacts as approve_artifacts
+        from tools.validate_notes_repo import main, validate_repo
+
+        email = "lab" + "@" + "example.com"
+        # Valid base64 whose text looks like a phone number to a raw-text scan.
+        png_b64 = "AA+/" + "212555" + "0199" + "+/"
+        nb = {
+            "nbformat": 4,
+            "cells": [
+                {
+                    "cell_type": "code",
+                    "source": ["print('hi')\n", f"# contact {email}\n"],
+                    "outputs": [
+                        {"output_type": "stream", "name": "stdout", "text": ["ok\n"]},
+                        {"output_type": "display_data", "data": {"image/png": png_b64, "text/plain": "<Figure>"}},
+                    ],
+                }
+            ],
+        }
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            nb_path = root / "notes" / "lab.ipynb"
+            nb_path.parent.mkdir(parents=True)
+            nb_path.write_text(json.dumps(nb), encoding="utf-8")
+
+            got = [(f.path, f.rule, f.severity, f.line) for f in validate_repo(root, approvals={}) if "lab.ipynb" in f.path]
+            self.assertEqual(
+                got,
+                [
+                    ("notes/lab.ipynb#cell1", "email", "ERROR", 2),
+                    ("notes/lab.ipynb#cell1-output2.png", "image", "WARN", None),
+                ],
+            )
+
+            self.assertEqual(main(["--path", str(root)]), 2)
+            virtual = "notes/lab.ipynb#cell1-output2.png"
+            self.assertEqual(
+                maintain_mod._load_unapproved_images_from_compliance_report(
+                    repo_root=root, report_path=root / "reports" / "compliance_report.json"
+                ),
+                [virtual],
+            )
+
+            self.assertEqual(approve_artifacts.main(["--repo-root", str(root), "--path", virtual]), 0)
+            after = [f for f in validate_repo(root) if f.path == virtual]
+            self.assertEqual([f.severity for f in after], ["INFO"])
+
+    def test_notebook_metadata_svg_and_other_image_types_are_checked(self) -> None:
+        import tools.approve_artifacts as approve_artifacts
+        from tools.validate_notes_repo import validate_repo
+
+        email = "author" + "@" + "example.com"
+        nb = {
+            "nbformat": 4,
+            "metadata": {"authors": [{"name": "A. Author", "email": email}]},
+            "cells": [
+                {
+                    "cell_type": "code",
+                    "metadata": {"tags": [f"owner:{email}"]},
+                    "source": "plot()",
+                    "outputs": [
+                        {"output_type": "display_data", "data": {"image/svg+xml": [f"<svg><text>{email}</text></svg>"]}},
+                        {"output_type": "display_data", "data": {"image/bmp": "Qk0="}},
+                    ],
+                }
+            ],
+        }
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            nb_path = root / "notes" / "lab.ipynb"
+            nb_path.parent.mkdir(parents=True)
+            nb_path.write_text(json.dumps(nb), encoding="utf-8")
+
+            got = [(f.path, f.rule, f.severity) for f in validate_repo(root, approvals={}) if "lab.ipynb" in f.path]
+            self.assertCountEqual(
+                got,
+                [
+                    ("notes/lab.ipynb#metadata", "email", "ERROR"),
+                    ("notes/lab.ipynb#cell1-output2.bmp", "image", "WARN"),
+                ],
+            )
+            all_found = [f.path for f in validate_repo(root, approvals={}, all_matches=True) if f.rule == "email"]
+            self.assertCountEqual(
+                all_found,
+                ["notes/lab.ipynb#metadata", "notes/lab.ipynb#cell1-metadata", "notes/lab.ipynb#cell1-output1"],
+            )
+
+            virtual = "notes/lab.ipynb#cell1-output2.bmp"
+            self.assertEqual(approve_artifacts.main(["--repo-root", str(root), "--path", virtual]), 0)
+            self.assertEqual([f.severity for f in validate_repo(root) if f.path == virtual], ["INFO"])
+
+    def test_overlapping_hits_of_different_rules_are_all_reported(self) -> None:
+        import tools.validate_notes_repo as v
+
+        at = "@"
+        cases = [
+            (f"pid{at}example.com", ["email", "student_record"]),
+            (f"{'919555' + '1234'}{at}example.com", ["email", "phone"]),
+        ]
+        for text, rules in cases:
+            for all_matches in (False, True):
+                findings: list = []
+                v.validate_text_file(
+                    Path("."), Path("notes/x.md"), text, findings, apply_integrity_patterns=True, all_matches=all_matches
+                )
+                self.assertEqual([(f.rule, f.col) for f in findings], [(rule, 1) for rule in rules])
+
+    def test_moved_image_is_approved_by_content_and_carried_forward(self) -> None:
+        import tools.approve_artifacts as approve_artifacts
+        from tools.approvals import load_approval_manifest
+        from tools.validate_notes_repo import validate_repo
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _make_repo(root)
+            week = root / "notes" / "Semester" / "COURSE" / "Week01"
+            old_rel = "notes/Semester/COURSE/Week01/plot.png"
+            self.assertEqual(approve_artifacts.main(["--repo-root", str(root), "--path", old_rel]), 0)
+
+            moved = root / "notes" / "Semester" / "COURSE" / "Week02" / "plot.png"
+            moved.parent.mkdir()
+            (week / "plot.png").rename(moved)
+            (root / "notes" / "copy.png").write_bytes(b"fake png")
+
+            images = {f.path: f for f in validate_repo(root) if f.rule == "image"}
+            self.assertEqual({f.severity for f in images.values()}, {"INFO"})
+            self.assertIn(old_rel, images["notes/copy.png"].message)
+
+            self.assertEqual(approve_artifacts.main(["--repo-root", str(root), "--carry-forward"]), 0)
+            approved = load_approval_manifest(root / "approved_artifacts.json")["approved"]
+            self.assertEqual(sorted(approved), ["notes/Semester/COURSE/Week02/plot.png", "notes/copy.png"])
+            self.assertEqual(approved["notes/copy.png"]["carried_from"], old_rel)
+            messages = {f.message for f in validate_repo(root) if f.rule == "image"}
+            self.assertEqual(messages, {"Image present and approved (pinned by SHA256)."})
+
+
+if __name__ == "__main__":
+    unittest.main()
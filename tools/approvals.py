@@ -0,0 +1,220 @@
+"""approvals.py
+
+Approval manifest (approved_artifacts.json) loading and lookup, shared by
+the validator and the approval helper.
+
+Approvals are keyed by repo-relative POSIX path and pinned by SHA256.
+``ApprovalIndex`` adds a reverse index (sha256 -> approved paths) built once
+at load time, so an approved image that was moved or duplicated is
+recognized by its content without re-approval.
+
+Storage is a snapshot plus an append-only journal:
+
+- ``approved_artifacts.json``: the compacted snapshot (sorted, indented).
+- ``approved_artifacts.journal.jsonl``: one JSON record per line,
+  ``{"op": "approve", "path": ..., "entry": {...}}`` or
+  ``{"op": "remove", "path": ...}``, replayed over the snapshot on load.
+
+Approving or removing entries appends to the journal (one write, independent
+of manifest size). ``compact_approvals`` folds the journal into the snapshot;
+approve_artifacts.py does so automatically once the journal passes
+``COMPACT_JOURNAL_BYTES``. Replay is idempotent, so a crash between writing
+the snapshot and deleting the journal is harmless; a torn final line is
+ignored.
+
+Standard-library only.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+
+DEFAULT_MANIFEST = "approved_artifacts.json"
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+# Journal size at which approve_artifacts.py compacts into the snapshot.
+COMPACT_JOURNAL_BYTES = 1024 * 1024
+
+# (repo-relative path, entry) to approve, or (path, None) to remove.
+ApprovalChange = Tuple[str, Optional[Dict[str, Any]]]
+
+
+def journal_path(manifest_path: Path) -> Path:
+    return manifest_path.with_name(manifest_path.stem + JOURNAL_SUFFIX)
+
+
+def _replay_journal(path: Path, approved: Dict[str, Any]) -> int:
+    """Apply journal records to ``approved`` in order; returns records applied."""
+
+    try:
+        f = path.open("r", encoding="utf-8")
+    except OSError:
+        return 0
+    applied = 0
+    with f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue  # torn write; later records are still applied
+            if not isinstance(rec, dict) or not isinstance(rec.get("path"), str):
+                continue
+            op = rec.get("op")
+            if op == "approve" and isinstance(rec.get("entry"), dict):
+                approved[rec["path"]] = rec["entry"]
+            elif op == "remove":
+                approved.pop(rec["path"], None)
+            else:
+                continue
+            applied += 1
+    return applied
+
+
+def _load_snapshot(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {"version": 1, "approved": {}}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {"version": 1, "approved": {}}
+
+    if not isinstance(data, dict):
+        return {"version": 1, "approved": {}}
+
+    approved = data.get("approved")
+    if not isinstance(approved, dict):
+        approved = {}
+    return {"version": int(data.get("version", 1) or 1), "approved": approved}
+
+
+def load_approval_manifest(path: Path) -> Dict[str, Any]:
+    """Load a manifest snapshot plus its journal; missing or malformed files yield an empty one.
+
+    Format:
+      {
+        "version": 1,
+        "approved": {
+          "notes/.../image.png": {
+            "sha256": "...",
+            "category": "image",
+            "approved_utc": "...",
+            "notes": "..." (optional),
+            "carried_from": "..." (optional; set by --carry-forward)
+          }
+        }
+      }
+    """
+
+    manifest = _load_snapshot(path)
+    _replay_journal(journal_path(path), manifest["approved"])
+    return manifest
+
+
+def write_approval_manifest(path: Path, payload: Dict[str, Any]) -> None:
+    """Atomically replace the snapshot (sorted, indented JSON)."""
+
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8", newline="\n")
+    os.replace(tmp, path)
+
+
+def append_approval_changes(manifest_path: Path, changes: Iterable[ApprovalChange]) -> int:
+    """Append changes to the journal in a single write; returns the journal size in bytes."""
+
+    lines: List[str] = []
+    for rel, entry in changes:
+        rec: Dict[str, Any] = {"op": "remove", "path": rel}
+        if entry is not None:
+            rec = {"op": "approve", "path": rel, "entry": entry}
+        lines.append(json.dumps(rec, sort_keys=True) + "\n")
+    jp = journal_path(manifest_path)
+    with jp.open("a", encoding="utf-8", newline="\n") as f:
+        if lines:
+            f.write("".join(lines))
+        return f.tell()
+
+
+def compact_approvals(manifest_path: Path) -> int:
+    """Fold the journal into the snapshot and delete it; returns records folded."""
+
+    jp = journal_path(manifest_path)
+    manifest = _load_snapshot(manifest_path)
+    folded = _replay_journal(jp, manifest["approved"])
+    if folded:
+        write_approval_manifest(manifest_path, manifest)
+    try:
+        jp.unlink()
+    except FileNotFoundError:
+        pass
+    return folded
+
+
+def entry_sha256(entry: Any) -> Optional[str]:
+    if not isinstance(entry, dict):
+        return None
+    sha = entry.get("sha256")
+    if not sha or not isinstance(sha, str):
+        return None
+    return sha.lower()
+
+
+class ApprovalIndex:
+    """Approved entries by path, plus a sha256 -> paths reverse index."""
+
+    def __init__(self, approved: Optional[Mapping[str, Any]] = None) -> None:
+        self.approved: Dict[str, Any] = dict(approved or {})
+        self._by_sha: Dict[str, List[str]] = {}
+        for rel in sorted(self.approved):
+            sha = entry_sha256(self.approved[rel])
+            if sha:
+                self._by_sha.setdefault(sha, []).append(rel)
+
+    @classmethod
+    def coerce(cls, approvals: Union[Mapping[str, Any], "ApprovalIndex"]) -> "ApprovalIndex":
+        return approvals if isinstance(approvals, ApprovalIndex) else cls(approvals)
+
+    def __len__(self) -> int:
+        return len(self.approved)
+
+    def __contains__(self, rel: object) -> bool:
+        return rel in self.approved
+
+    def get(self, rel: str) -> Any:
+        return self.approved.get(rel)
+
+    def paths_for_sha(self, sha256: str) -> List[str]:
+        """Approved paths pinned to ``sha256`` (sorted)."""
+
+        return list(self._by_sha.get(sha256.lower(), ()))
+
+    def match(self, rel: str, sha256: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return (approved_path, reason_if_not).
+
+        ``approved_path`` is ``rel`` itself when its own entry matches, or
+        another approved path with the same content (a moved or duplicated
+        file); None when neither applies.
+        """
+
+        entry = self.approved.get(rel)
+        reason: Optional[str]
+        if entry is None:
+            reason = "not listed"
+        elif not isinstance(entry, dict):
+            reason = "invalid entry"
+        else:
+            expected = entry_sha256(entry)
+            if expected is None:
+                reason = "missing sha256"
+            elif expected == sha256.lower():
+                return rel, None
+            else:
+                reason = "sha256 mismatch"
+
+        others = self._by_sha.get(sha256.lower())
+        if others:
+            return others[0], None
+        return None, reason
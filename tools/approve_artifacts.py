@@ -13,28 +13,78 @@ Usage
   python tools/approve_artifacts.py --category image --path notes/.../image.png --note "Reviewed"
     python tools/approve_artifacts.py --category image --all-images --under notes --note "Reviewed"
   python tools/approve_artifacts.py --remove --path notes/.../image.png
+  python tools/approve_artifacts.py --path "notes/.../lab.ipynb#cell3-output1.png"
   python tools/approve_artifacts.py --list
+  python tools/approve_artifacts.py --carry-forward --under notes
+  python tools/approve_artifacts.py --compact
+
+In-process callers (maintain.py) use ``approve_paths``: digests are reused
+from the caller's hash cache, the rest are computed on a thread pool, and all
+changes are committed with one journal append.
 
 Interactive (new/unapproved images)
     python tools/approve_artifacts.py --interactive
     python tools/approve_artifacts.py --list-new-images
     python tools/approve_artifacts.py --approve-all-new-images --note "Reviewed"
 
+Notebook image outputs are approved by their virtual path
+(<notebook>.ipynb#cell<N>-output<M>.<ext>, as reported by the validator) and
+pinned by the SHA256 of the decoded image.
+
+Manifest storage
+- Changes are appended to approved_artifacts.journal.jsonl (one write per
+  run, independent of manifest size) and folded into approved_artifacts.json
+  automatically once the journal grows past 1 MiB, or on --compact. Both
+  files are tracked; readers replay the journal over the snapshot.
+
+Moved/duplicated images
+- The validator already accepts an image whose SHA256 matches any approved
+  entry. --carry-forward pins such images under their current path (copying
+  the original category/notes, recording carried_from) and drops entries
+  whose file no longer exists once their content has been carried.
+
 Standard-library only.
 """
 
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-
-DEFAULT_MANIFEST = "approved_artifacts.json"
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    from tools.approvals import (
+        COMPACT_JOURNAL_BYTES,
+        DEFAULT_MANIFEST,
+        ApprovalChange,
+        ApprovalIndex,
+        append_approval_changes,
+        compact_approvals,
+        load_approval_manifest,
+    )
+    from tools.hash_cache import HashCache, sha256_file
+    from tools.notebook_outputs import notebook_image_hashes, split_virtual_path
+    from tools.repo_scan import scan_repo
+    from tools.state_store import StateStore
+except ImportError:  # executed as a script: python tools/approve_artifacts.py
+    from approvals import (
+        COMPACT_JOURNAL_BYTES,
+        DEFAULT_MANIFEST,
+        ApprovalChange,
+        ApprovalIndex,
+        append_approval_changes,
+        compact_approvals,
+        load_approval_manifest,
+    )
+    from hash_cache import HashCache, sha256_file
+    from notebook_outputs import notebook_image_hashes, split_virtual_path
+    from repo_scan import scan_repo
+    from state_store import StateStore
 
 
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
@@ -72,11 +122,14 @@ def _load_unapproved_images_from_compliance_report(*, repo_root: Path, report_pa
         if not isinstance(path, str) or not path:
             continue
 
-        if not path.lower().endswith(tuple(IMAGE_EXTENSIONS)):
+        # Notebook outputs (nb.ipynb#cellN-outputM.png, any image/* type)
+        # exist when their notebook does.
+        virtual = split_virtual_path(path)
+        if not virtual and not path.lower().endswith(tuple(IMAGE_EXTENSIONS)):
             continue
 
         try:
-            if not (repo_root / path).exists():
+            if not (repo_root / (virtual[0] if virtual else path)).exists():
                 continue
         except OSError:
             continue
@@ -118,17 +171,6 @@ def _utc_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def _sha256_file(path: Path, *, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def _safe_relpath(repo_root: Path, path: Path) -> str:
     try:
         return path.relative_to(repo_root).as_posix()
@@ -137,26 +179,17 @@ def _safe_relpath(repo_root: Path, path: Path) -> str:
         return path.as_posix().replace("\\", "/")
 
 
-def _load_manifest(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {"version": 1, "approved": {}}
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {"version": 1, "approved": {}}
-
-    if not isinstance(data, dict):
-        return {"version": 1, "approved": {}}
-
-    approved = data.get("approved")
-    if not isinstance(approved, dict):
-        approved = {}
-
-    return {"version": int(data.get("version", 1) or 1), "approved": approved}
-
-
-def _write_manifest(path: Path, payload: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8", newline="\n")
+def _commit_changes(
+    manifest_path: Path, changes: List[ApprovalChange], *, state_store: Optional[StateStore] = None
+) -> None:
+    if not changes:
+        return
+    if state_store is not None:
+        state_store.apply_approval_changes(changes)
+    size = append_approval_changes(manifest_path, changes)
+    if size >= COMPACT_JOURNAL_BYTES:
+        folded = compact_approvals(manifest_path)
+        print(f"[approve] compacted {folded} journal record(s) into {manifest_path.name}")
 
 
 def _iter_files_under(repo_root: Path, under: Path) -> List[Path]:
@@ -166,6 +199,155 @@ def _iter_files_under(repo_root: Path, under: Path) -> List[Path]:
     return [p for p in base.rglob("*") if p.is_file()]
 
 
+def _path_exists(repo_root: Path, rel: str) -> bool:
+    virtual = split_virtual_path(rel)
+    try:
+        return (repo_root / (virtual[0] if virtual else rel)).is_file()
+    except OSError:
+        return False
+
+
+def carry_forward_approvals(
+    repo_root: Path,
+    approved: Dict[str, Any],
+    *,
+    under: Path,
+    hash_cache: HashCache,
+) -> List[ApprovalChange]:
+    """Pin images under ``under`` whose content is already approved elsewhere.
+
+    Mutates ``approved`` and returns the changes to journal: new entries
+    carry ``carried_from``. Source entries whose file no longer exists (the
+    image was moved) are removed once carried; entries for files that still
+    exist are kept.
+    """
+
+    index = ApprovalIndex(approved)
+    base = under if under.is_absolute() else repo_root / under
+    carried: List[Tuple[str, str]] = []
+    changes: List[ApprovalChange] = []
+    for entry in scan_repo(base).files:
+        if entry.suffix not in IMAGE_EXTENSIONS:
+            continue
+        rel = _safe_relpath(repo_root, entry.path)
+        try:
+            sha = hash_cache.sha256(entry.path, st=entry.stat)
+        except OSError:
+            continue
+        source, _reason = index.match(rel, sha)
+        if source is None or source == rel:
+            continue
+        carried_entry = dict(index.get(source))
+        carried_entry["carried_from"] = source
+        approved[rel] = carried_entry
+        carried.append((source, rel))
+        changes.append((rel, carried_entry))
+
+    for source in sorted({src for src, _dst in carried}):
+        if source in approved and not _path_exists(repo_root, source):
+            approved.pop(source, None)
+            changes.append((source, None))
+    return changes
+
+
+def approve_paths(
+    repo_root: Path,
+    paths: Iterable[str],
+    *,
+    hash_cache: HashCache,
+    category: str = "image",
+    note: Optional[str] = None,
+    remove: bool = False,
+    known_hashes: Optional[Mapping[str, str]] = None,
+    manifest: str = DEFAULT_MANIFEST,
+    state_store: Optional[StateStore] = None,
+    jobs: Optional[int] = None,
+) -> List[ApprovalChange]:
+    """Approve (or ``remove``) repo-relative paths with a single manifest update.
+
+    Digests come from ``known_hashes`` (repo-relative path -> sha256), then
+    from ``hash_cache`` (stat only); the remaining files, and each notebook
+    with requested image outputs (parsed once), are hashed concurrently on
+    ``jobs`` threads (hashlib releases the GIL). New file digests are
+    recorded in ``hash_cache``; saving it is the caller's job. Raises
+    ValueError for paths that are not files or notebook image outputs.
+    """
+
+    # (rel, absolute file, stat, notebook fragment or None), de-duplicated in order.
+    targets: List[Tuple[str, Path, os.stat_result, Optional[str]]] = []
+    seen: set[str] = set()
+    for raw in paths:
+        virtual = split_virtual_path(raw.replace("\\", "/"))
+        p = (repo_root / (virtual[0] if virtual else raw)).resolve()
+        try:
+            st = p.stat()
+        except OSError:
+            st = None
+        if st is None or not p.is_file():
+            raise ValueError(f"Not a file: {raw}")
+        rel = _safe_relpath(repo_root, p)
+        if virtual:
+            rel = f"{rel}#{virtual[1]}"
+        if rel not in seen:
+            seen.add(rel)
+            targets.append((rel, p, st, virtual[1] if virtual else None))
+
+    if remove:
+        changes: List[ApprovalChange] = [(rel, None) for rel, _p, _st, _fragment in targets]
+        _commit_changes(repo_root / manifest, changes, state_store=state_store)
+        return changes
+
+    known = dict(known_hashes or {})
+    digests: Dict[str, str] = {}
+    pending_files: Dict[Path, os.stat_result] = {}
+    pending_notebooks: set[Path] = set()
+    for rel, p, st, fragment in targets:
+        if rel in known:
+            digests[rel] = known[rel]
+        elif fragment is not None:
+            pending_notebooks.add(p)
+        else:
+            cached = hash_cache.lookup(p, st=st)
+            if cached is None:
+                pending_files[p] = st
+            else:
+                digests[rel] = cached
+
+    file_hashes: Dict[Path, str] = {}
+    notebook_hashes: Dict[Path, Dict[str, str]] = {}
+    if pending_files or pending_notebooks:
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="approve") as pool:
+            files = sorted(pending_files)
+            notebooks = sorted(pending_notebooks)
+            file_hashes = dict(zip(files, pool.map(sha256_file, files)))
+            notebook_hashes = dict(zip(notebooks, pool.map(notebook_image_hashes, notebooks)))
+    for p, digest in file_hashes.items():
+        hash_cache.record(p, st=pending_files[p], sha256=digest)
+
+    now = _utc_now()
+    changes = []
+    for rel, p, _st, fragment in targets:
+        sha = digests.get(rel)
+        if sha is None:
+            sha = file_hashes[p] if fragment is None else notebook_hashes[p].get(fragment)
+        if sha is None:
+            raise ValueError(f"Not a notebook image output: {rel}")
+        entry: Dict[str, Any] = {"sha256": sha, "category": category, "approved_utc": now}
+        if note:
+            entry["notes"] = note
+        changes.append((rel, entry))
+
+    _commit_changes(repo_root / manifest, changes, state_store=state_store)
+    return changes
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return n
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Approve high-risk artifacts by pinning them in approved_artifacts.json")
     ap.add_argument("--repo-root", default=None, help="Repo root (default: parent of this tools/ directory)")
@@ -190,6 +372,23 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
     ap.add_argument("--remove", action="store_true", help="Remove approval entries for the given paths")
     ap.add_argument("--list", action="store_true", help="List approved entries (paths only)")
+    ap.add_argument(
+        "--state-db",
+        default=None,
+        help="SQLite state store (relative to repo root): reuse its digests and mirror approval changes into it",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Threads used to hash files that are not in the digest cache (default: Python's thread pool default)",
+    )
+    ap.add_argument("--compact", action="store_true", help="Fold the approval journal into the manifest and exit")
+    ap.add_argument(
+        "--carry-forward",
+        action="store_true",
+        help="Pin images under --under (default: notes/) whose SHA256 is already approved under another path",
+    )
 
     ap.add_argument(
         "--compliance-report",
@@ -220,14 +419,55 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
 
     manifest_path = repo_root / args.manifest
-    manifest = _load_manifest(manifest_path)
-    approved: Dict[str, Any] = dict(manifest.get("approved") or {})
+
+    if args.compact:
+        folded = compact_approvals(manifest_path)
+        print(f"[approve] compacted {folded} journal record(s) into {manifest_path.name}")
+        return 0
 
     if args.list:
-        for k in sorted(approved.keys()):
+        for k in sorted(load_approval_manifest(manifest_path)["approved"]):
             print(k)
         return 0
 
+    state_store = StateStore(repo_root / args.state_db) if args.state_db else None
+    try:
+        return _apply(args, ap, repo_root, manifest_path, state_store)
+    finally:
+        if state_store is not None:
+            state_store.close()
+
+
+def _apply(
+    args: argparse.Namespace,
+    ap: argparse.ArgumentParser,
+    repo_root: Path,
+    manifest_path: Path,
+    state_store: Optional[StateStore],
+) -> int:
+    def open_hash_cache() -> HashCache:
+        if state_store is not None:
+            return HashCache.from_store(state_store, root=repo_root)
+        return HashCache.for_repo(repo_root)
+
+    if args.carry_forward:
+        hash_cache = open_hash_cache()
+        approved: Dict[str, Any] = dict(load_approval_manifest(manifest_path)["approved"])
+        changes = carry_forward_approvals(
+            repo_root,
+            approved,
+            under=Path(args.under) if args.under else Path("notes"),
+            hash_cache=hash_cache,
+        )
+        for rel, carried_entry in changes:
+            if carried_entry is None:
+                print(f"[approve] dropped moved entry: {rel}")
+            else:
+                print(f"[approve] carried approval: {carried_entry['carried_from']} -> {rel}")
+        _commit_changes(manifest_path, changes, state_store=state_store)
+        hash_cache.save()
+        return 0
+
     # New/unapproved image workflow (driven by latest compliance report)
     if args.list_new_images or args.approve_all_new_images or args.interactive:
         report_path = (repo_root / str(args.compliance_report)).resolve()
@@ -300,38 +540,23 @@ def main(argv: Optional[List[str]] = None) -> int:
     if not explicit_paths:
         ap.error("--path is required unless --list is used (or use --all-images)")
 
-    changed = False
-
-    for raw in explicit_paths:
-        p = (repo_root / raw).resolve()
-        if not p.exists() or not p.is_file():
-            raise SystemExit(f"Not a file: {raw}")
-
-        rel = _safe_relpath(repo_root, p)
-
-        if args.remove:
-            if rel in approved:
-                approved.pop(rel, None)
-                changed = True
-            continue
-
-        sha = _sha256_file(p)
-        entry: Dict[str, Any] = {
-            "sha256": sha,
-            "category": args.category,
-            "approved_utc": _utc_now(),
-        }
-        if args.note:
-            entry["notes"] = args.note
-
-        approved[rel] = entry
-        changed = True
-
-    if changed:
-        out = dict(manifest)
-        out["approved"] = approved
-        _write_manifest(manifest_path, out)
-
+    # Changes are journaled, so approving does not need to load the manifest.
+    hash_cache = open_hash_cache()
+    try:
+        approve_paths(
+            repo_root,
+            explicit_paths,
+            hash_cache=hash_cache,
+            category=args.category,
+            note=args.note,
+            remove=args.remove,
+            manifest=args.manifest,
+            state_store=state_store,
+            jobs=args.jobs,
+        )
+    except ValueError as e:
+        raise SystemExit(str(e))
+    hash_cache.save()
     return 0
 
 
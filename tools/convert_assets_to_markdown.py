@@ -21,7 +21,18 @@ Preferred engine
 
 Safety
 - Does NOT delete sources.
-- Skips existing outputs by default.
+- Skips up-to-date outputs by default.
+
+Incremental conversion
+- A ledger (reports/_convert_state.json) records, per converted DOCX, the
+  source SHA256, the pandoc version and the converter options.
+- A DOCX is reconverted when its output is missing, or when any of those
+  recorded values changed. Everything else is skipped.
+- Outputs that exist but have no ledger entry (converted before the ledger
+  existed) are left alone; run once with --force to start tracking them.
+- With --state-db the ledger is kept in the SQLite state store's
+  ``conversions`` table (tools/state_store.py); the JSON ledger is still
+  written as an export and seeds an empty store.
 
 Typical usage (from repo root)
 - Plan what would be converted:
@@ -30,6 +41,9 @@ Typical usage (from repo root)
 - Convert all DOCX under notes/ (requires pandoc installed):
     python tools/convert_assets_to_markdown.py --verbose
 
+- Limit concurrent pandoc processes (default: CPU count):
+    python tools/convert_assets_to_markdown.py --force --jobs 4
+
 Exit codes
 - 0: success (including "nothing to do")
 - 2: missing required external tool for requested conversion
@@ -40,32 +54,54 @@ from __future__ import annotations
 
 import argparse
 import datetime as _dt
+import functools
+import io
+import json
 import os
 import re
 import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    from tools.hash_cache import HashCache
+    from tools.repo_scan import RepoIndex, scan_repo
+    from tools.state_store import StateStore
+except ImportError:  # executed as a script: python tools/convert_assets_to_markdown.py
+    from hash_cache import HashCache
+    from repo_scan import RepoIndex, scan_repo
+    from state_store import StateStore
 
 
 DEFAULT_NOTES_DIR_NAME = "notes"
 DEFAULT_MEDIA_DIR_NAME = "generated_media"
+DEFAULT_LEDGER_NAME = "_convert_state.json"
 
 
 def _utc_now_iso() -> str:
     return _dt.datetime.now(tz=_dt.timezone.utc).isoformat(timespec="seconds")
 
 
-def _iter_files(root: Path, *, suffixes: Sequence[str]) -> Iterable[Path]:
-    sufset = {s.lower() for s in suffixes}
-    for p in root.rglob("*"):
-        if not p.is_file():
-            continue
+def _iter_files(root: Path, *, suffixes: Sequence[str], index: Optional[RepoIndex] = None) -> Iterable[Path]:
+    # Reuse the caller's scan when it covers root; otherwise scan root once.
+    entries = index.iter_suffixes(suffixes, under=root) if index is not None else None
+    if entries is None:
+        entries = scan_repo(root).iter_suffixes(suffixes) or []
+    for e in entries:
         # Skip Word lock/temp files (e.g., "~$lecture.docx"). These are not real documents.
-        if p.name.startswith("~$"):
+        if e.name.startswith("~$"):
             continue
-        if p.suffix.lower() in sufset:
-            yield p
+        yield e.path
+
+
+def _output_exists(dst: Path, *, index: Optional[RepoIndex]) -> bool:
+    if index is not None and index.relpath(dst) is not None:
+        return index.has_file(dst)
+    return dst.exists()
 
 
 def _safe_relpath(path: Path, repo_root: Path) -> str:
@@ -143,6 +179,115 @@ def _detect_pandoc(explicit: Optional[str] = None) -> Optional[str]:
     return None
 
 
+@dataclass(frozen=True)
+class PandocToolchain:
+    """A resolved pandoc executable plus what it reported about itself."""
+
+    path: str
+    version: Optional[str]  # first line of `pandoc --version`, e.g. "pandoc 3.1.9"
+    output_formats: FrozenSet[str]
+
+    def markdown_writer(self) -> str:
+        # gfm arrived in pandoc 2.0; older builds only know markdown_github.
+        if not self.output_formats or "gfm" in self.output_formats:
+            return "gfm"
+        return "markdown_github"
+
+
+def _query_pandoc(pandoc: str, flag: str) -> Optional[str]:
+    try:
+        rc, out, _err = _run([pandoc, flag], cwd=None, verbose=False)
+    except OSError:
+        return None
+    if rc != 0 or not out.strip():
+        return None
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_pandoc_cached(explicit: Optional[str], env_pandoc: str, env_path: str) -> Optional[PandocToolchain]:
+    # env values are part of the cache key so a changed environment re-resolves.
+    pandoc = _detect_pandoc(explicit)
+    if not pandoc:
+        return None
+    version_out = _query_pandoc(pandoc, "--version")
+    formats_out = _query_pandoc(pandoc, "--list-output-formats")
+    return PandocToolchain(
+        path=pandoc,
+        version=version_out.strip().splitlines()[0].strip() if version_out else None,
+        output_formats=frozenset(line.strip() for line in (formats_out or "").splitlines() if line.strip()),
+    )
+
+
+def resolve_pandoc(explicit: Optional[str] = None) -> Optional[PandocToolchain]:
+    """Resolve pandoc once per process (discovery + version + output formats).
+
+    Repeated calls with the same explicit path and environment return the
+    cached toolchain, so preflight, planning and every conversion share one
+    lookup. Returns None when pandoc cannot be found.
+    """
+
+    return _resolve_pandoc_cached(
+        explicit,
+        os.environ.get("PANDOC_PATH", ""),
+        os.environ.get("PATH", ""),
+    )
+
+
+def _load_ledger(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {"version": 1, "generated_at": None, "documents": {}}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        # Corrupt ledger should never block; everything tracked becomes stale.
+        return {"version": 1, "generated_at": None, "documents": {}}
+    docs = data.get("documents") if isinstance(data, dict) else None
+    if not isinstance(docs, dict):
+        docs = {}
+    return {"version": 1, "generated_at": data.get("generated_at"), "documents": docs}
+
+
+def _save_ledger(path: Path, ledger: Dict[str, Any], *, dry_run: bool) -> None:
+    out = dict(ledger)
+    out["generated_at"] = _utc_now_iso()
+    _write_text(path, json.dumps(out, indent=2, sort_keys=True) + "\n", dry_run=dry_run)
+
+
+def _stale_reason(
+    *,
+    entry: Optional[Dict[str, Any]],
+    output_exists: bool,
+    dst_rel: str,
+    src_sha256: str,
+    pandoc_version: Optional[str],
+    options: Dict[str, Any],
+    force: bool,
+) -> Optional[str]:
+    """Return why a DOCX needs (re)conversion, or None if its output is current.
+
+    An unknown pandoc version (pandoc not installed, e.g. during --dry-run)
+    is not treated as a change.
+    """
+
+    if force:
+        return "forced"
+    if not output_exists:
+        return "missing output"
+    if entry is None:
+        # Pre-ledger output: keep legacy "skip existing" behavior.
+        return None
+    if entry.get("sha256") != src_sha256:
+        return "source changed"
+    if entry.get("options") != options:
+        return "options changed"
+    if entry.get("output") != dst_rel:
+        return "output moved"
+    if pandoc_version is not None and entry.get("pandoc_version") != pandoc_version:
+        return "pandoc version changed"
+    return None
+
+
 def _render_front_matter(src_rel: str, engine: str) -> str:
     # Keep it minimal and YAML-safe.
     lines = [
@@ -157,26 +302,69 @@ def _render_front_matter(src_rel: str, engine: str) -> str:
     return "\n".join(lines)
 
 
-def _normalize_md(md_text: str) -> str:
-    # Best-effort cleanup without changing meaning.
-    # - Normalize newlines
-    # - Trim trailing whitespace
-    md_text = md_text.replace("\r\n", "\n").replace("\r", "\n")
-    md_text = "\n".join(line.rstrip() for line in md_text.split("\n"))
+# A line transform receives one line (newline already stripped, trailing
+# whitespace trimmed) and returns the replacement line. Transforms run in order
+# inside the single post-processing pass, so adding a redaction does not add
+# another pass over the document.
+LineTransform = Callable[[str], str]
+
+
+def transform_key(transform: LineTransform) -> str:
+    """Ledger identity of an extra transform: ``module.qualname`` plus its version.
+
+    A transform may set a ``transform_version`` attribute; bump it when its
+    behaviour changes so tracked documents are reconverted. Anonymous
+    callables (lambdas, closures, partials) cannot be told apart by name, so
+    they must carry a ``transform_version``.
+    """
+
+    module = getattr(transform, "__module__", None)
+    qualname = getattr(transform, "__qualname__", None)
+    version = getattr(transform, "transform_version", None)
+    named = bool(module and qualname) and "<lambda>" not in qualname and "<locals>" not in qualname
+    if not named and version is None:
+        raise ValueError(
+            f"Extra transform {transform!r} has no stable name; use a module-level function "
+            "or set a transform_version attribute."
+        )
+    key = f"{module}.{qualname}" if module and qualname else type(transform).__qualname__
+    return key if version is None else f"{key}@{version}"
+
+
+def _postprocess_md(md_text: str, transforms: Sequence[LineTransform] = ()) -> str:
+    """Fused, line-oriented Markdown post-processor.
+
+    In one traversal of the text:
+    - normalize newlines (CRLF/CR -> LF)
+    - trim trailing whitespace
+    - apply each transform in order
+    and finally ensure the file ends with a single newline.
+    """
+
+    out: List[str] = []
+    # newline=None gives universal-newline iteration (\r\n, \r and \n only).
+    for line in io.StringIO(md_text, newline=None):
+        line = line.rstrip()
+        for transform in transforms:
+            line = transform(line)
+        out.append(line)
 
     # Ensure file ends with single newline.
-    return md_text.rstrip() + "\n"
+    while out and not out[-1]:
+        out.pop()
+    return "\n".join(out) + "\n"
 
 
 _IMG_SRC_RE = re.compile(r'(<img\s+[^>]*?\bsrc=")([^"]+)(")', re.IGNORECASE)
 
 
-def _rewrite_absolute_img_src(md_text: str, *, dst: Path, repo_root: Path) -> str:
-    """Rewrite absolute img src paths into paths relative to the generated .md file.
+def _img_src_rewriter(*, dst: Path, repo_root: Path) -> LineTransform:
+    """Build a transform that rewrites absolute img src paths relative to ``dst``.
 
     Pandoc sometimes emits HTML <img> tags with Windows-absolute paths (e.g.
     C:\\Users\\...\\generated_media\\...\\image1.png). Those paths both leak local
-    machine details and break rendering on GitHub.
+    machine details and break rendering on GitHub. With --wrap=none pandoc
+    keeps each tag on one line, so a per-line rewrite sees whole tags.
     """
 
     repo_root_resolved = repo_root.resolve()
@@ -211,7 +399,12 @@ def _rewrite_absolute_img_src(md_text: str, *, dst: Path, repo_root: Path) -> st
         prefix, src, suffix = m.group(1), m.group(2), m.group(3)
         return prefix + _to_rel(src) + suffix
 
-    return _IMG_SRC_RE.sub(_repl, md_text)
+    def rewrite_img_src(line: str) -> str:
+        if "<" not in line:
+            return line
+        return _IMG_SRC_RE.sub(_repl, line)
+
+    return rewrite_img_src
 
 
 _EMAIL_RE = re.compile(
@@ -219,7 +412,7 @@ _EMAIL_RE = re.compile(
 )
 
 
-def _redact_emails(md_text: str) -> str:
+def redact_emails(line: str) -> str:
     """Redact email addresses from generated Markdown.
 
     This is a safety/compliance measure for a public notes repo template.
@@ -227,12 +420,18 @@ def _redact_emails(md_text: str) -> str:
     embedded in source documents.
     """
 
-    return _EMAIL_RE.sub("[REDACTED_EMAIL]", md_text)
+    if "@" not in line:
+        return line
+    return _EMAIL_RE.sub("[REDACTED_EMAIL]", line)
 
 
-def _run(cmd: List[str], *, cwd: Optional[Path], verbose: bool) -> Tuple[int, str, str]:
+def _run(cmd: List[str], *, cwd: Optional[Path], verbose: bool, log: Optional[List[str]] = None) -> Tuple[int, str, str]:
     if verbose:
-        print("[convert] run:", " ".join(cmd))
+        line = "[convert] run: " + " ".join(cmd)
+        if log is not None:
+            log.append(line)
+        else:
+            print(line)
 
     p = subprocess.run(
         cmd,
@@ -249,38 +448,43 @@ def _run(cmd: List[str], *, cwd: Optional[Path], verbose: bool) -> Tuple[int, st
 def _convert_docx_to_md_with_pandoc(
     *,
     src: Path,
-    dst: Path,
     extract_media_dir: Path,
     wrap_none: bool,
     gfm: bool,
-    pandoc_path: Optional[str],
+    toolchain: Optional[PandocToolchain],
     verbose: bool,
-) -> Tuple[bool, str]:
-    pandoc = _detect_pandoc(pandoc_path)
-    if not pandoc:
-        return False, "Pandoc not found. Provide --pandoc-path (or set PANDOC_PATH) to convert DOCX -> Markdown."
+    log: Optional[List[str]] = None,
+) -> Tuple[bool, str, str]:
+    """Run pandoc with Markdown on stdout.
+
+    Returns (ok, message, markdown). Nothing is written to the output path
+    here; the caller post-processes in memory and writes the final file once.
+    Extracted media are still written by pandoc (--extract-media).
+    """
+
+    if toolchain is None:
+        return False, "Pandoc not found. Provide --pandoc-path (or set PANDOC_PATH) to convert DOCX -> Markdown.", ""
 
-    dst.parent.mkdir(parents=True, exist_ok=True)
     extract_media_dir.mkdir(parents=True, exist_ok=True)
 
+    # No -o: without an output filename pandoc cannot infer the writer, so
+    # always name it explicitly.
     cmd: List[str] = [
-        pandoc,
+        toolchain.path,
         str(src),
-        "-o",
-        str(dst),
+        "-t",
+        toolchain.markdown_writer() if gfm else "markdown",
         "--extract-media",
         str(extract_media_dir),
     ]
-    if gfm:
-        cmd.extend(["-t", "gfm"])
     if wrap_none:
         cmd.extend(["--wrap=none"])
 
-    rc, _out, err = _run(cmd, cwd=None, verbose=verbose)
+    rc, out, err = _run(cmd, cwd=None, verbose=verbose, log=log)
     if rc != 0:
-        return False, f"pandoc failed (exit {rc}): {err.strip()}"
+        return False, f"pandoc failed (exit {rc}): {err.strip()}", ""
 
-    return True, "ok"
+    return True, "ok", out
 
 
 def _write_text(path: Path, content: str, *, dry_run: bool) -> None:
@@ -290,6 +494,26 @@ def _write_text(path: Path, content: str, *, dry_run: bool) -> None:
     path.write_text(content, encoding="utf-8", newline="\n")
 
 
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write via a temp file in the same directory + os.replace.
+
+    Readers never observe a partially written or half-processed file.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def _default_dst_for_src(src: Path, *, mode: str) -> Path:
     """Determine output location.
 
@@ -310,50 +534,54 @@ def _default_media_dir_for_src(src: Path, *, media_dir_name: str) -> Path:
     return src.parent / media_dir_name / src.stem
 
 
-def _find_related_asset(
-    *,
-    src: Path,
-    notes_root: Path,
-    target_suffix: str,
-) -> Optional[Path]:
-    """Find a best-effort related file (same stem) near src.
-
-    This is intentionally conservative and local:
-    - Prefer same directory
-    - Then walk up toward notes_root, checking:
-      - <dir>/<stem><suffix>
-      - <dir>/docx/<stem><suffix>
+class _RelatedAssetIndex:
+    """Per-run lookup of files under notes_root by file name.
+
+    Built once from the scan so resolving a related PDF for each converted
+    document is a dict lookup plus a walk over in-memory directory sets, with
+    no stat calls.
     """
 
-    stem = src.stem
-    suffix = target_suffix.lower()
-
-    def _try_dir(d: Path) -> Optional[Path]:
-        candidates = [
-            d / f"{stem}{suffix}",
-            d / "docx" / f"{stem}{suffix}",
-        ]
-        for c in candidates:
-            try:
-                if c.exists() and c.is_file():
-                    return c
-            except OSError:
-                continue
-        return None
+    def __init__(self, notes_root: Path, paths: Iterable[Path]) -> None:
+        self.notes_root = notes_root
+        self._dirs_by_name: Dict[str, Set[Path]] = {}
+        for p in paths:
+            self._dirs_by_name.setdefault(p.name, set()).add(p.parent)
+
+    @classmethod
+    def from_index(cls, notes_root: Path, index: RepoIndex, *, suffixes: Sequence[str]) -> "_RelatedAssetIndex":
+        entries = index.iter_suffixes(suffixes, under=notes_root) or []
+        return cls(notes_root, (e.path for e in entries))
+
+    def find(self, *, src: Path, target_suffix: str) -> Optional[Path]:
+        """Find a best-effort related file (same stem) near src.
+
+        This is intentionally conservative and local:
+        - Prefer same directory
+        - Then walk up toward notes_root, checking:
+          - <dir>/<stem><suffix>
+          - <dir>/docx/<stem><suffix>
+        """
+
+        name = f"{src.stem}{target_suffix.lower()}"
+        dirs = self._dirs_by_name.get(name)
+        if not dirs:
+            return None
 
-    cur = src.parent
-    while True:
-        hit = _try_dir(cur)
-        if hit:
-            return hit
+        cur = src.parent
+        while True:
+            if cur in dirs:
+                return cur / name
+            if cur / "docx" in dirs:
+                return cur / "docx" / name
 
-        if cur == notes_root:
-            break
-        if cur.parent == cur:
-            break
-        cur = cur.parent
+            if cur == self.notes_root:
+                break
+            if cur.parent == cur:
+                break
+            cur = cur.parent
 
-    return None
+        return None
 
 
 def _rel_link(dst: Path, target: Path) -> str:
@@ -376,6 +604,356 @@ def _render_reference_header(*, dst: Path, pdf: Optional[Path], docx: Optional[P
     return "\n".join(lines) + "\n"
 
 
+@dataclass(frozen=True)
+class ConversionOptions:
+    output_mode: str = "sibling"
+    media_dir_name: str = DEFAULT_MEDIA_DIR_NAME
+    front_matter: bool = False
+    redact_emails: bool = False
+    force: bool = False
+    pandoc_path: Optional[str] = None
+    jobs: Optional[int] = None
+    verbose: bool = False
+    # Additional per-line transforms (e.g. new redactions), applied after the
+    # built-ins. Each needs a stable identity (see transform_key).
+    extra_transforms: Tuple[LineTransform, ...] = ()
+
+    def __post_init__(self) -> None:
+        for transform in self.extra_transforms:
+            transform_key(transform)  # fail at construction, not at fingerprint time
+
+    @classmethod
+    def from_namespace(cls, ns: argparse.Namespace) -> "ConversionOptions":
+        return cls(
+            output_mode=ns.output_mode,
+            media_dir_name=ns.media_dir_name,
+            front_matter=bool(ns.front_matter),
+            redact_emails=bool(ns.redact_emails),
+            force=bool(ns.force),
+            pandoc_path=ns.pandoc_path,
+            jobs=ns.jobs,
+            verbose=bool(ns.verbose),
+        )
+
+    def fingerprint(self) -> Dict[str, Any]:
+        """Options that change the generated Markdown (a change forces reconversion)."""
+
+        return {
+            "output_mode": self.output_mode,
+            "media_dir_name": self.media_dir_name,
+            "front_matter": self.front_matter,
+            "redact_emails": self.redact_emails,
+            "gfm": True,
+            "wrap_none": True,
+            "extra_transforms": [transform_key(t) for t in self.extra_transforms],
+        }
+
+
+@dataclass(frozen=True)
+class ConversionItem:
+    src: Path
+    dst: Path
+    media_dir: Path
+    src_sha256: str
+    reason: str  # why it needs (re)conversion, e.g. "missing output"
+
+
+@dataclass
+class ConversionResult:
+    attempted: int = 0
+    ok: int = 0
+    errors: List[str] = field(default_factory=list)  # source-relative paths, in source order
+    exit_code: int = 0
+    # Paths this run may have written (Markdown, media dirs, ledger, own cache), for RepoIndex.update.
+    outputs: List[Path] = field(default_factory=list)
+
+
+@dataclass
+class _ConversionOutcome:
+    ok: bool
+    fatal: bool = False  # missing pandoc: stop and exit 2
+    messages: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ConversionPlan:
+    """The DOCX -> Markdown work for one notes root, discovered once.
+
+    Build it with ``plan_conversions``; ``report`` prints it (the dry-run
+    view), ``preflight`` checks prerequisites and ``execute`` runs it. All
+    three work from the same discovery, so callers that need more than one
+    (maintain.py) pay for planning exactly once.
+    """
+
+    repo_root: Path
+    notes_root: Path
+    options: ConversionOptions
+    docx_files: List[Path]
+    items: List[ConversionItem]
+    skipped: List[Tuple[Path, str]]  # (dst, "up to date" | "existing (untracked)")
+    toolchain: Optional[PandocToolchain]
+    ledger_path: Path
+    ledger: Dict[str, Any]
+    hash_cache: HashCache
+    related_assets: _RelatedAssetIndex
+    owns_cache: bool = False
+    state_store: Optional[StateStore] = None
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "docx_count": len(self.docx_files),
+            "planned": len(self.items),
+            "up_to_date": sum(1 for _dst, state in self.skipped if state == "up to date"),
+            "untracked": sum(1 for _dst, state in self.skipped if state != "up to date"),
+        }
+
+    def report(self) -> None:
+        verbose = self.options.verbose
+        if verbose:
+            for dst, state in self.skipped:
+                print(f"[convert] skip {state}: {_safe_relpath(dst, self.repo_root)}")
+        for item in self.items:
+            print(
+                f"[convert] would convert DOCX -> MD ({item.reason}): "
+                f"{_safe_relpath(item.src, self.repo_root)} -> {_safe_relpath(item.dst, self.repo_root)}"
+            )
+        if verbose:
+            print(f"[convert] attempted={len(self.items)} ok=0")
+
+    def preflight(self) -> Tuple[bool, str]:
+        """Check prerequisites without writing anything."""
+
+        if not self.docx_files:
+            return True, "no DOCX files"
+        if self.toolchain is None:
+            return False, "Pandoc not found (required for DOCX -> Markdown). Provide --pandoc-path or set PANDOC_PATH."
+        return True, f"pandoc={self.toolchain.path} version={self.toolchain.version or 'unknown'}"
+
+    def _line_transforms(self, dst: Path) -> List[LineTransform]:
+        # Pandoc sometimes emits Windows-absolute image src paths; rewrite them.
+        transforms: List[LineTransform] = [_img_src_rewriter(dst=dst, repo_root=self.repo_root)]
+        if self.options.redact_emails:
+            transforms.append(redact_emails)
+        transforms.extend(self.options.extra_transforms)
+        return transforms
+
+    def _convert_one(self, item: ConversionItem) -> _ConversionOutcome:
+        """Convert + post-process one DOCX.
+
+        Runs on a worker thread; all output is buffered in the outcome so the
+        caller can print it in source order.
+        """
+
+        opts = self.options
+        repo_root = self.repo_root
+        src, dst = item.src, item.dst
+        out = _ConversionOutcome(ok=False)
+
+        ok, msg, md = _convert_docx_to_md_with_pandoc(
+            src=src,
+            extract_media_dir=item.media_dir,
+            wrap_none=True,
+            gfm=True,
+            toolchain=self.toolchain,
+            verbose=opts.verbose,
+            log=out.messages,
+        )
+        if not ok:
+            out.messages.append(f"[convert] ERROR: {_safe_relpath(src, repo_root)}: {msg}")
+            # Missing pandoc is an actionable configuration issue.
+            out.fatal = "Pandoc not found" in msg
+            return out
+
+        # Post-process pandoc's stdout in memory, then write the final file once.
+        try:
+            md = _postprocess_md(md, self._line_transforms(dst))
+
+            # Add a small human header linking to the source artifacts.
+            related_pdf = self.related_assets.find(src=src, target_suffix=".pdf")
+            header = _render_reference_header(dst=dst, pdf=related_pdf, docx=src)
+            md = header + md
+
+            if opts.front_matter:
+                src_rel = _safe_relpath(src, repo_root)
+                md = _render_front_matter(src_rel, engine="pandoc") + md
+            _write_text_atomic(dst, md)
+        except Exception as e:
+            # Nothing was written: an unprocessed (e.g. unredacted) file never lands on disk.
+            out.messages.append(
+                f"[convert] ERROR: post-process failed for {_safe_relpath(dst, repo_root)}: {type(e).__name__}: {e}"
+            )
+            return out
+
+        out.ok = True
+        if opts.verbose:
+            out.messages.append(f"[convert] OK: {_safe_relpath(src, repo_root)} -> {_safe_relpath(dst, repo_root)}")
+        return out
+
+    def execute(self) -> ConversionResult:
+        """Run the planned conversions and record successes in the ledger."""
+
+        result = ConversionResult(attempted=len(self.items))
+        documents: Dict[str, Any] = self.ledger["documents"]
+        pandoc_version = self.toolchain.version if self.toolchain else None
+        fingerprint = self.options.fingerprint()
+        items = self.items
+
+        jobs = min(self.options.jobs or _default_jobs(), max(1, len(items)))
+        if self.options.verbose and items:
+            print(f"[convert] jobs={jobs}")
+
+        # Each DOCX writes only its own .md and media dir, so conversions are
+        # independent. Results are consumed in source order, keeping logs and
+        # error reporting deterministic regardless of completion order.
+        if jobs == 1:
+            outcomes: Iterable[_ConversionOutcome] = map(self._convert_one, items)
+            pool: Optional[ThreadPoolExecutor] = None
+        else:
+            pool = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="convert")
+            outcomes = pool.map(self._convert_one, items)
+
+        try:
+            for item, outcome in zip(items, outcomes):
+                result.outputs.extend([item.dst, item.media_dir])
+                for line in outcome.messages:
+                    print(line)
+                src_rel = _safe_relpath(item.src, self.repo_root)
+                if outcome.fatal:
+                    result.errors.append(src_rel)
+                    result.exit_code = 2
+                    break
+                if not outcome.ok:
+                    result.errors.append(src_rel)
+                    continue
+                result.ok += 1
+                documents[src_rel] = {
+                    "sha256": item.src_sha256,
+                    "pandoc_version": pandoc_version,
+                    "options": fingerprint,
+                    "output": _safe_relpath(item.dst, self.repo_root),
+                }
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+            # Forget sources that disappeared from this notes root; record the rest.
+            current = {_safe_relpath(src, self.repo_root) for src in self.docx_files}
+            notes_prefix = _safe_relpath(self.notes_root, self.repo_root).rstrip("/") + "/"
+            for key in [k for k in documents if k.startswith(notes_prefix) and k not in current]:
+                documents.pop(key, None)
+            _save_ledger(self.ledger_path, self.ledger, dry_run=False)
+            result.outputs.append(self.ledger_path)
+            if self.state_store is not None:
+                self.state_store.replace_conversions(documents)
+            if self.owns_cache:
+                self.hash_cache.save()
+                if self.hash_cache.path is not None:
+                    result.outputs.append(self.hash_cache.path)
+
+        if self.options.verbose and result.exit_code == 0:
+            print(f"[convert] attempted={result.attempted} ok={result.ok}")
+        return result
+
+
+def plan_conversions(
+    repo_root: Path,
+    *,
+    options: ConversionOptions,
+    notes_root: Optional[Path] = None,
+    index: Optional[RepoIndex] = None,
+    hash_cache: Optional[HashCache] = None,
+    toolchain: Optional[PandocToolchain] = None,
+    state_store: Optional[StateStore] = None,
+) -> ConversionPlan:
+    """Discover DOCX sources once and decide which need (re)conversion.
+
+    Pandoc is resolved (once per process) only when DOCX files exist and no
+    toolchain was supplied. A caller-supplied hash cache is saved by the
+    caller; otherwise ``execute`` saves the plan's own cache. With a
+    ``state_store`` the ledger is read from (and recorded to) the store.
+    """
+
+    notes_root = notes_root or (repo_root / DEFAULT_NOTES_DIR_NAME)
+    owns_cache = hash_cache is None
+    if hash_cache is None:
+        hash_cache = HashCache.for_repo(repo_root)
+
+    if index is None or index.relpath(notes_root) is None:
+        # Standalone: one walk of notes_root serves discovery, output checks
+        # and related-asset lookup.
+        index = scan_repo(notes_root)
+    docx_files = sorted(_iter_files(notes_root, suffixes=[".docx"], index=index)) if notes_root.exists() else []
+    if toolchain is None and docx_files:
+        toolchain = resolve_pandoc(options.pandoc_path)
+    pandoc_version = toolchain.version if toolchain else None
+
+    ledger_path = repo_root / "reports" / DEFAULT_LEDGER_NAME
+    ledger = _load_ledger(ledger_path)
+    if state_store is not None:
+        stored = state_store.load_conversions()
+        if stored:
+            ledger["documents"] = stored
+    documents: Dict[str, Any] = ledger["documents"]
+    fingerprint = options.fingerprint()
+
+    items: List[ConversionItem] = []
+    skipped: List[Tuple[Path, str]] = []
+    for src in docx_files:
+        dst = _default_dst_for_src(src, mode=options.output_mode)
+        src_rel = _safe_relpath(src, repo_root)
+        src_sha = hash_cache.sha256(src)
+
+        reason = _stale_reason(
+            entry=documents.get(src_rel),
+            output_exists=_output_exists(dst, index=index),
+            dst_rel=_safe_relpath(dst, repo_root),
+            src_sha256=src_sha,
+            pandoc_version=pandoc_version,
+            options=fingerprint,
+            force=options.force,
+        )
+        if reason is None:
+            skipped.append((dst, "up to date" if src_rel in documents else "existing (untracked)"))
+            continue
+
+        items.append(
+            ConversionItem(
+                src=src,
+                dst=dst,
+                media_dir=_default_media_dir_for_src(src, media_dir_name=options.media_dir_name),
+                src_sha256=src_sha,
+                reason=reason,
+            )
+        )
+
+    return ConversionPlan(
+        repo_root=repo_root,
+        notes_root=notes_root,
+        options=options,
+        docx_files=docx_files,
+        items=items,
+        skipped=skipped,
+        toolchain=toolchain,
+        ledger_path=ledger_path,
+        ledger=ledger,
+        hash_cache=hash_cache,
+        related_assets=_RelatedAssetIndex.from_index(notes_root, index, suffixes=[".pdf"]),
+        owns_cache=owns_cache,
+        state_store=state_store,
+    )
+
+
+def _default_jobs() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return n
+
+
 def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(
         description="Convert DOCX assets under notes/ into Markdown for GitHub rendering (best-effort)."
@@ -411,7 +989,11 @@ def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     )
     p.add_argument("--front-matter", action="store_true", help="Prepend minimal YAML front-matter to generated Markdown")
     p.add_argument("--redact-emails", action="store_true", help="Redact email addresses from generated Markdown")
-    p.add_argument("--force", action="store_true", help="Overwrite existing output .md files")
+    p.add_argument(
+        "--force",
+        action="store_true",
+        help="Reconvert every DOCX, even when the ledger says its output is up to date",
+    )
     p.add_argument(
         "--preflight",
         action="store_true",
@@ -420,12 +1002,36 @@ def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
             "Does not write files."
         ),
     )
+    p.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Number of concurrent pandoc conversions (default: CPU count). Use 1 for serial.",
+    )
+    p.add_argument(
+        "--state-db",
+        default=None,
+        help="SQLite state store (relative to repo root) holding the conversion ledger and digests",
+    )
     p.add_argument("--dry-run", action="store_true", help="Print actions but do not write files")
     p.add_argument("--verbose", action="store_true", help="Verbose logging")
     return p.parse_args(argv)
 
 
-def main(argv: Optional[List[str]] = None) -> int:
+def main(
+    argv: Optional[List[str]] = None,
+    *,
+    index: Optional[RepoIndex] = None,
+    hash_cache: Optional[HashCache] = None,
+    toolchain: Optional[PandocToolchain] = None,
+    state_store: Optional[StateStore] = None,
+) -> int:
+    """CLI entry point (thin wrapper over ``plan_conversions``).
+
+    In-process callers may pass a shared repo index, hash cache, resolved
+    pandoc toolchain and state store; the caller then owns saving/closing them.
+    """
+
     ns = _parse_args(argv)
 
     script_path = Path(__file__).resolve()
@@ -436,94 +1042,55 @@ def main(argv: Optional[List[str]] = None) -> int:
         print(f"[convert] notes root not found: {notes_root}")
         return 0
 
-    docx_files = sorted(_iter_files(notes_root, suffixes=[".docx"]))
-
-    if ns.preflight:
-        # Preflight should be safe/no-write and focused on actionable prerequisites.
-        if ns.verbose:
-            print(f"[convert] preflight: docx_count={len(docx_files)}")
-
-        if docx_files:
-            pandoc = _detect_pandoc(ns.pandoc_path)
-            if not pandoc:
-                print("[convert] ERROR: Pandoc not found (required for DOCX -> Markdown). Provide --pandoc-path or set PANDOC_PATH.")
-                return 2
-            if ns.verbose:
-                print(f"[convert] preflight OK: pandoc={pandoc}")
-
-        return 0
-
-    if ns.verbose:
-        print(f"[convert] repo_root={repo_root}")
-        print(f"[convert] notes_root={notes_root}")
-        print(f"[convert] docx_count={len(docx_files)}")
-        print(f"[convert] output_mode={ns.output_mode} dry_run={ns.dry_run} force={ns.force}")
-
-    # DOCX -> MD
-    conversions_attempted = 0
-    conversions_ok = 0
+    owns_store = state_store is None and ns.state_db is not None and not ns.dry_run
+    store_cache: Optional[HashCache] = None
+    if owns_store:
+        state_store = StateStore(repo_root / ns.state_db)
+        if hash_cache is None:
+            hash_cache = store_cache = HashCache.from_store(state_store, root=repo_root)
+    try:
+        plan = plan_conversions(
+            repo_root,
+            options=ConversionOptions.from_namespace(ns),
+            notes_root=notes_root,
+            index=index,
+            hash_cache=hash_cache,
+            toolchain=toolchain,
+            state_store=state_store,
+        )
 
-    for src in docx_files:
-        dst = _default_dst_for_src(src, mode=ns.output_mode)
-        if dst.exists() and not ns.force:
+        if ns.preflight:
+            # Preflight should be safe/no-write and focused on actionable prerequisites.
             if ns.verbose:
-                print(f"[convert] skip existing: {_safe_relpath(dst, repo_root)}")
-            continue
-
-        media_dir = _default_media_dir_for_src(src, media_dir_name=ns.media_dir_name)
-
-        conversions_attempted += 1
-        if ns.dry_run:
-            print(f"[convert] would convert DOCX -> MD: {_safe_relpath(src, repo_root)} -> {_safe_relpath(dst, repo_root)}")
-            continue
-
-        ok, msg = _convert_docx_to_md_with_pandoc(
-            src=src,
-            dst=dst,
-            extract_media_dir=media_dir,
-            wrap_none=True,
-            gfm=True,
-            pandoc_path=ns.pandoc_path,
-            verbose=ns.verbose,
-        )
-        if not ok:
-            print(f"[convert] ERROR: {_safe_relpath(src, repo_root)}: {msg}")
-            # Missing pandoc is an actionable configuration issue.
-            if "Pandoc not found" in msg:
+                print(f"[convert] preflight: docx_count={len(plan.docx_files)}")
+            ok, msg = plan.preflight()
+            if not ok:
+                print(f"[convert] ERROR: {msg}")
                 return 2
-            continue
-
-        # Optional: normalize + front matter.
-        try:
-            md = dst.read_text(encoding="utf-8")
-            md = _normalize_md(md)
-
-            # Pandoc sometimes emits Windows-absolute image src paths; rewrite them.
-            md = _rewrite_absolute_img_src(md, dst=dst, repo_root=repo_root)
-
-            if ns.redact_emails:
-                md = _redact_emails(md)
+            if ns.verbose and plan.docx_files:
+                print(f"[convert] preflight OK: {msg}")
+            return 0
 
-            # Add a small human header linking to the source artifacts.
-            related_pdf = _find_related_asset(src=src, notes_root=notes_root, target_suffix=".pdf")
-            header = _render_reference_header(dst=dst, pdf=related_pdf, docx=src)
-            md = header + md
-
-            if ns.front_matter:
-                src_rel = _safe_relpath(src, repo_root)
-                md = _render_front_matter(src_rel, engine="pandoc") + md
-            _write_text(dst, md, dry_run=False)
-        except Exception as e:
-            print(f"[convert] WARN: post-process failed for {_safe_relpath(dst, repo_root)}: {type(e).__name__}: {e}")
-
-        conversions_ok += 1
         if ns.verbose:
-            print(f"[convert] OK: {_safe_relpath(src, repo_root)} -> {_safe_relpath(dst, repo_root)}")
+            print(f"[convert] repo_root={repo_root}")
+            print(f"[convert] notes_root={notes_root}")
+            print(f"[convert] docx_count={len(plan.docx_files)}")
+            print(f"[convert] output_mode={ns.output_mode} dry_run={ns.dry_run} force={ns.force}")
 
-    if ns.verbose:
-        print(f"[convert] attempted={conversions_attempted} ok={conversions_ok}")
+        if ns.dry_run:
+            plan.report()
+            return 0
 
-    return 0
+        if ns.verbose:
+            for dst, state in plan.skipped:
+                print(f"[convert] skip {state}: {_safe_relpath(dst, repo_root)}")
+
+        return plan.execute().exit_code
+    finally:
+        if store_cache is not None:
+            store_cache.save()
+        if state_store is not None and owns_store:
+            state_store.close()
 
 
 if __name__ == "__main__":
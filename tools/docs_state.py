@@ -0,0 +1,164 @@
+"""docs_state.py
+
+Compact binary form of generate_repo_docs' manifest state
+(reports/_repo_docs_state.bin).
+
+Layout (little-endian):
+
+- header: magic ``b"RDS1"``, record count, path-blob length, generated_at
+  length (``<4sIII``), then generated_at as UTF-8
+- records, sorted by path: path offset, path length, size, mtime_ns, flags,
+  sha256 (32 bytes), tree_sha256 (32 bytes) (``<IIqqB3x32s32s``, 92 bytes)
+- path blob: the UTF-8 paths concatenated in record order
+
+The file is loaded with a single read. ``DocsState`` is a read-only mapping
+(path -> fingerprint dict, as produced by generate_repo_docs._file_fingerprint)
+that finds a path by bisecting the records; fingerprints are decoded only
+when looked up. UTF-8 byte order equals code point order, so records sorted
+by ``str`` can be searched by their encoded bytes. Callers that consult
+most paths (generate_repo_docs, once per run) use ``to_dict`` instead, which
+decodes every record in one sequential pass.
+
+Standard-library only.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+MAGIC = b"RDS1"
+_HEADER = struct.Struct("<4sIII")
+_RECORD = struct.Struct("<IIqqB3x32s32s")
+
+_HAS_SHA256 = 1
+_HAS_TREE_SHA256 = 2
+
+
+class DocsStateError(ValueError):
+    """The file is not a docs state file (or is truncated)."""
+
+
+class DocsState(Mapping):
+    """Read-only view over an encoded state file."""
+
+    def __init__(self, data: bytes = b"") -> None:
+        self.generated_at: Optional[str] = None
+        self._count = 0
+        self._records_at = 0
+        self._paths_at = 0
+        self._data = memoryview(data)
+        if not data:
+            return
+        if len(data) < _HEADER.size:
+            raise DocsStateError("truncated header")
+        magic, count, paths_len, gen_len = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise DocsStateError("bad magic")
+        self._records_at = _HEADER.size + gen_len
+        self._paths_at = self._records_at + count * _RECORD.size
+        if len(data) != self._paths_at + paths_len:
+            raise DocsStateError("size mismatch")
+        self.generated_at = bytes(self._data[_HEADER.size : self._records_at]).decode("utf-8") or None
+        self._count = count
+
+    @classmethod
+    def load(cls, path: Path) -> "DocsState":
+        return cls(path.read_bytes())
+
+    def _record(self, i: int) -> tuple:
+        return _RECORD.unpack_from(self._data, self._records_at + i * _RECORD.size)
+
+    def _path_bytes(self, i: int) -> bytes:
+        offset, length = struct.unpack_from("<II", self._data, self._records_at + i * _RECORD.size)
+        start = self._paths_at + offset
+        return bytes(self._data[start : start + length])
+
+    def _find(self, rel: str) -> int:
+        key = rel.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._path_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._path_bytes(lo) == key:
+            return lo
+        return -1
+
+    def _fingerprint(self, i: int) -> Dict[str, Any]:
+        _offset, _length, size, mtime_ns, flags, sha, tree = self._record(i)
+        fp: Dict[str, Any] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": sha.hex() if flags & _HAS_SHA256 else None,
+        }
+        if flags & _HAS_TREE_SHA256:
+            fp["tree_sha256"] = tree.hex()
+        return fp
+
+    def __getitem__(self, rel: str) -> Dict[str, Any]:
+        i = self._find(rel) if isinstance(rel, str) else -1
+        if i < 0:
+            raise KeyError(rel)
+        return self._fingerprint(i)
+
+    def __contains__(self, rel: object) -> bool:
+        return isinstance(rel, str) and self._find(rel) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._path_bytes(i).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Decode every record in file order (no lookups)."""
+
+        return {self._path_bytes(i).decode("utf-8"): self._fingerprint(i) for i in range(self._count)}
+
+
+def _digest_bytes(value: Any) -> Optional[bytes]:
+    if not isinstance(value, str) or len(value) != 64:
+        return None
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        return None
+
+
+def encode_docs_state(files: Mapping, *, generated_at: Optional[str]) -> bytes:
+    gen = (generated_at or "").encode("utf-8")
+    records = bytearray()
+    blob = bytearray()
+    for rel in sorted(files):
+        fp = files[rel]
+        path_bytes = rel.encode("utf-8")
+        sha = _digest_bytes(fp.get("sha256"))
+        tree = _digest_bytes(fp.get("tree_sha256"))
+        flags = (_HAS_SHA256 if sha else 0) | (_HAS_TREE_SHA256 if tree else 0)
+        records += _RECORD.pack(
+            len(blob),
+            len(path_bytes),
+            int(fp.get("size") or 0),
+            int(fp.get("mtime_ns") or 0),
+            flags,
+            sha or bytes(32),
+            tree or bytes(32),
+        )
+        blob += path_bytes
+    return _HEADER.pack(MAGIC, len(files), len(blob), len(gen)) + gen + bytes(records) + bytes(blob)
+
+
+def write_docs_state(path: Path, files: Mapping, *, generated_at: Optional[str]) -> None:
+    """Atomically replace ``path`` with the encoded state."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(encode_docs_state(files, generated_at=generated_at))
+    os.replace(tmp, path)
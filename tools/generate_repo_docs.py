@@ -15,6 +15,16 @@ This script uses only the Python standard library.
 
 Typical usage (from repo root):
   python tools/generate_repo_docs.py
+  python tools/generate_repo_docs.py --state-json
+
+Change detection state lives in reports/_repo_docs_state.bin (compact
+sorted records, see tools/docs_state.py). --state-json additionally writes
+the same state as reports/_repo_docs_state.json for inspection; a legacy
+JSON state is read once when no binary state exists yet.
+
+notes/INDEX.md is spliced from per-term/course fragments cached in
+reports/_repo_docs_index_fragments.json; a run re-renders only the courses
+whose subtree appears in the change diff.
 
 Exit codes
 - 0: success
@@ -26,12 +36,21 @@ from __future__ import annotations
 
 import argparse
 import datetime as _dt
-import hashlib
 import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+try:
+    from tools.docs_state import DocsState, DocsStateError, write_docs_state
+    from tools.hash_cache import HashCache
+    from tools.repo_scan import FileEntry, RepoIndex, scan_repo
+except ImportError:  # executed as a script: python tools/generate_repo_docs.py
+    from docs_state import DocsState, DocsStateError, write_docs_state
+    from hash_cache import HashCache
+    from repo_scan import FileEntry, RepoIndex, scan_repo
+
 
 AUTO_START = "<!-- AUTO-GENERATED:START (repo-docs) -->"
 AUTO_END = "<!-- AUTO-GENERATED:END (repo-docs) -->"
@@ -76,73 +95,172 @@ def _safe_relpath(path: Path, repo_root: Path) -> str:
     return rel.replace("\\", "/")
 
 
-def _iter_files(repo_root: Path, exclude_dirs: Set[str], exclude_files: Set[str]) -> Iterable[Path]:
-    for p in repo_root.rglob("*"):
-        if p.is_dir():
-            continue
-        rel_parts = p.relative_to(repo_root).parts
-        if any(part in exclude_dirs for part in rel_parts):
-            continue
-        rel = "/".join(rel_parts).replace("\\", "/")
-        if p.name in exclude_files or rel in exclude_files:
-            continue
-        yield p
+def _is_excluded(entry: FileEntry, exclude_dirs: Set[str], exclude_files: Set[str]) -> bool:
+    if any(part in exclude_dirs for part in entry.parts):
+        return True
+    return entry.name in exclude_files or entry.rel in exclude_files
 
 
-def _hash_file(path: Path, *, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
+def _iter_files(index: RepoIndex, exclude_dirs: Set[str], exclude_files: Set[str]) -> Iterable[FileEntry]:
+    for entry in index.files:
+        if not _is_excluded(entry, exclude_dirs, exclude_files):
+            yield entry
 
 
-def _file_fingerprint(path: Path, *, full_hash_threshold_bytes: int = 5 * 1024 * 1024) -> Dict[str, Any]:
+def _file_fingerprint(
+    path: Path,
+    *,
+    hash_cache: HashCache,
+    st: Optional[os.stat_result] = None,
+    full_hash_threshold_bytes: int = 5 * 1024 * 1024,
+) -> Dict[str, Any]:
     """Fingerprint a file.
 
-    For files <= threshold, compute sha256.
-    For larger files, store size + mtime_ns to avoid huge CPU cost.
+    For files <= threshold, compute sha256 (via the shared hash cache).
+    Larger files get a block tree hash (``tree_sha256``), hashed in parallel
+    blocks and cached the same way, so every file has a content fingerprint.
     """
 
-    st = path.stat()
+    if st is None:
+        st = path.stat()
     size = int(st.st_size)
     mtime_ns = int(st.st_mtime_ns)
 
     fp: Dict[str, Any] = {"size": size, "mtime_ns": mtime_ns}
     if size <= full_hash_threshold_bytes:
-        fp["sha256"] = _hash_file(path)
+        fp["sha256"] = hash_cache.sha256(path, st=st)
     else:
         fp["sha256"] = None
+        fp["tree_sha256"] = hash_cache.tree_sha256(path, st=st)
     return fp
 
 
-def _load_state(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {"version": 1, "generated_at": None, "files": {}}
-    try:
-        return json.loads(_read_text(path))
-    except Exception:
-        # Corrupt state should never block; start fresh.
-        return {"version": 1, "generated_at": None, "files": {}}
+def _load_state(path: Path, *, legacy_json: Optional[Path] = None) -> Dict[str, Any]:
+    """Load the binary state, decoding ``files`` into a plain dict once.
 
+    Falls back to a legacy JSON state when no binary state exists yet.
+    """
 
-def _save_state(path: Path, state: Dict[str, Any], dry_run: bool) -> None:
-    state_out = dict(state)
-    state_out["generated_at"] = _utc_now_iso()
-    _write_text(path, json.dumps(state_out, indent=2, sort_keys=True) + "\n", dry_run=dry_run)
+    empty: Dict[str, Any] = {"version": 1, "generated_at": None, "files": {}}
+    if path.exists():
+        try:
+            state = DocsState.load(path)
+            files = state.to_dict()
+        except (OSError, DocsStateError, UnicodeDecodeError):
+            # Corrupt state should never block; start fresh.
+            return empty
+        return {"version": 1, "generated_at": state.generated_at, "files": files}
+    if legacy_json is not None and legacy_json.exists():
+        try:
+            data = json.loads(_read_text(legacy_json))
+        except Exception:
+            return empty
+        if isinstance(data, dict) and isinstance(data.get("files"), dict):
+            return data
+    return empty
+
+
+def _save_state(
+    path: Path,
+    state: Dict[str, Any],
+    dry_run: bool,
+    *,
+    json_path: Optional[Path] = None,
+    generated_at: Optional[str] = None,
+) -> None:
+    """Write the state; ``generated_at`` defaults to now (pass the old one to keep it)."""
 
+    if dry_run:
+        return
+    generated_at = generated_at or _utc_now_iso()
+    write_docs_state(path, state.get("files") or {}, generated_at=generated_at)
+    if json_path is not None:
+        state_out = dict(state)
+        state_out["generated_at"] = generated_at
+        _write_text(json_path, json.dumps(state_out, indent=2, sort_keys=True) + "\n", dry_run=dry_run)
+
+
+def _stat_unchanged(prev: Any, entry: FileEntry) -> bool:
+    return isinstance(prev, dict) and prev.get("size") == entry.size and prev.get("mtime_ns") == entry.mtime_ns
+
+
+def _compute_manifest(
+    index: RepoIndex,
+    *,
+    exclude_dirs: Set[str],
+    exclude_files: Set[str],
+    hash_cache: HashCache,
+    prev_files: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Fingerprint every tracked file, stat first.
+
+    A file whose size and mtime_ns match its ``prev_files`` fingerprint keeps
+    that fingerprint as-is; only new or stat-changed files are hashed.
+    """
 
-def _compute_manifest(repo_root: Path, *, exclude_dirs: Set[str], exclude_files: Set[str]) -> Dict[str, Any]:
+    prev_files = prev_files or {}
     files: Dict[str, Any] = {}
-    for p in _iter_files(repo_root, exclude_dirs=exclude_dirs, exclude_files=exclude_files):
-        rel = _safe_relpath(p, repo_root)
-        files[rel] = _file_fingerprint(p)
+    for entry in _iter_files(index, exclude_dirs=exclude_dirs, exclude_files=exclude_files):
+        prev = prev_files.get(entry.rel)
+        if _stat_unchanged(prev, entry):
+            files[entry.rel] = prev
+        else:
+            files[entry.rel] = _file_fingerprint(entry.path, hash_cache=hash_cache, st=entry.stat)
+    return {"version": 1, "generated_at": _utc_now_iso(), "files": files}
+
+
+def _update_manifest(
+    manifest: Dict[str, Any],
+    index: RepoIndex,
+    paths: Iterable[Path],
+    *,
+    exclude_dirs: Set[str],
+    exclude_files: Set[str],
+    hash_cache: HashCache,
+) -> Dict[str, Any]:
+    """Copy of ``manifest`` with just ``paths`` re-fingerprinted from the (refreshed) index."""
+
+    files: Dict[str, Any] = dict(manifest.get("files") or {})
+    for path in paths:
+        rel = index.relpath(path)
+        if not rel:
+            continue
+        entry = index.get(path)
+        if entry is None:
+            files.pop(rel, None)
+        elif not _is_excluded(entry, exclude_dirs, exclude_files) and not _stat_unchanged(files.get(rel), entry):
+            files[rel] = _file_fingerprint(entry.path, hash_cache=hash_cache, st=entry.stat)
     return {"version": 1, "generated_at": _utc_now_iso(), "files": files}
 
 
+def _stat_refreshed(prev_files: Dict[str, Any], curr_files: Dict[str, Any]) -> bool:
+    """True when some file's size/mtime fingerprint differs from the previous state."""
+
+    for rel, curr in curr_files.items():
+        prev = prev_files.get(rel)
+        if isinstance(prev, dict) and (prev.get("size"), prev.get("mtime_ns")) != (
+            curr.get("size"),
+            curr.get("mtime_ns"),
+        ):
+            return True
+    return False
+
+
+def _fingerprint_changed(prev: Any, curr: Any) -> bool:
+    """Content comparison: a touched-but-identical file is not a modification."""
+
+    if not isinstance(prev, dict) or not isinstance(curr, dict):
+        return prev != curr
+    if prev.get("size") != curr.get("size"):
+        return True
+    for key in ("sha256", "tree_sha256"):
+        prev_sha, curr_sha = prev.get(key), curr.get(key)
+        if prev_sha and curr_sha:
+            return prev_sha != curr_sha
+    # No comparable digest (e.g. state written before large files were tree-hashed).
+    return prev.get("mtime_ns") != curr.get("mtime_ns")
+
+
 def _diff_manifests(prev: Dict[str, Any], curr: Dict[str, Any]) -> Dict[str, List[str]]:
     prev_files = prev.get("files", {}) or {}
     curr_files = curr.get("files", {}) or {}
@@ -155,59 +273,82 @@ def _diff_manifests(prev: Dict[str, Any], curr: Dict[str, Any]) -> Dict[str, Lis
 
     modified: List[str] = []
     for k in sorted(prev_keys & curr_keys):
-        if prev_files.get(k) != curr_files.get(k):
+        if _fingerprint_changed(prev_files.get(k), curr_files.get(k)):
             modified.append(k)
 
     return {"added": added, "removed": removed, "modified": modified}
 
 
-def _discover_notes_tree(notes_root: Path) -> Dict[str, Any]:
-    """Discover notes under notes/<Term>/<Course>/<WeekXX>/..."""
+# Asset types counted in the health report (helps strict-mode readiness).
+NOTES_ASSET_SUFFIXES: Set[str] = {".pdf", ".docx", ".pptx", ".ppt", ".xlsx", ".xls", ".png", ".jpg", ".jpeg", ".gif", ".svg"}
 
-    tree: Dict[str, Any] = {"terms": {}}
-    if not notes_root.exists():
-        return tree
 
-    repo_root = notes_root.parent
+# Bump when the INDEX.md fragment layout changes (invalidates cached fragments).
+INDEX_FRAGMENTS_VERSION = 1
 
-    for term_dir in sorted([p for p in notes_root.iterdir() if p.is_dir()]):
-        term = term_dir.name
-        term_entry = tree["terms"].setdefault(term, {"courses": {}})
 
-        for course_dir in sorted([p for p in term_dir.iterdir() if p.is_dir()]):
-            course = course_dir.name
-            course_entry = term_entry["courses"].setdefault(course, {"weeks": {}})
+@dataclass
+class NotesModel:
+    """notes/<Term>/<Course>/<WeekXX>/ tree plus asset counts.
 
-            for week_dir in sorted([p for p in course_dir.iterdir() if p.is_dir()]):
-                week = week_dir.name
-                md_files = sorted([f for f in week_dir.rglob("*.md") if f.is_file()])
+    ``tree`` keeps the shape written to repo_inventory.json:
+    ``{"terms": {term: {"courses": {course: {"weeks": {week: {"path", "readme", "md_count"}}}}}}}``.
+    """
 
-                # Prefer week README if present.
-                readme = week_dir / "README.md"
-                readme_rel = _safe_relpath(readme, repo_root) if readme.exists() else None
+    tree: Dict[str, Any]
+    asset_suffix_counts: Dict[str, int]
 
-                course_entry["weeks"][week] = {
-                    "path": _safe_relpath(week_dir, repo_root),
-                    "readme": readme_rel,
-                    "md_count": len(md_files),
-                }
+    def iter_weeks(self) -> Iterable[Tuple[str, str, str, Dict[str, Any]]]:
+        """Yield (term, course, week, week_entry) in name order."""
 
-    return tree
+        for term, term_entry in self.tree["terms"].items():
+            for course, course_entry in term_entry["courses"].items():
+                for week, week_entry in course_entry["weeks"].items():
+                    yield term, course, week, week_entry
 
 
-def _iter_week_dirs(notes_root: Path) -> Iterable[Tuple[str, str, str, Path]]:
-    """Yield (term, course, week, week_dir) for notes/<Term>/<Course>/<WeekXX>/..."""
+def _build_notes_model(index: RepoIndex, notes_root: Path) -> NotesModel:
+    """Build the notes model from the repo index (one scandir walk, no re-listing).
 
-    if not notes_root.exists():
-        return
+    Directories one to three levels below notes/ form the term/course/week
+    tree; a single pass over the files below notes/ then fills in the week
+    README, the per-week Markdown count (any depth) and the asset counts.
+    """
+
+    tree: Dict[str, Any] = {"terms": {}}
+    suffix_counts: Dict[str, int] = {}
+    rel_root = index.relpath(notes_root)
+    if not rel_root:
+        return NotesModel(tree, suffix_counts)
+    prefix = rel_root + "/"
+
+    # index.dirs is sorted, so each level is inserted in name order.
+    terms = tree["terms"]
+    for d in index.dirs:
+        if not d.startswith(prefix):
+            continue
+        parts = d[len(prefix) :].split("/")
+        if len(parts) > 3:
+            continue
+        courses = terms.setdefault(parts[0], {"courses": {}})["courses"]
+        if len(parts) == 1:
+            continue
+        weeks = courses.setdefault(parts[1], {"weeks": {}})["weeks"]
+        if len(parts) == 3:
+            weeks[parts[2]] = {"path": d, "readme": None, "md_count": 0}
+
+    for entry in index.files_under(notes_root) or []:
+        if entry.suffix in NOTES_ASSET_SUFFIXES:
+            suffix_counts[entry.suffix] = suffix_counts.get(entry.suffix, 0) + 1
+        parts = entry.rel[len(prefix) :].split("/")
+        if len(parts) < 4 or not parts[-1].endswith(".md"):
+            continue
+        week_entry = terms[parts[0]]["courses"][parts[1]]["weeks"][parts[2]]
+        week_entry["md_count"] += 1
+        if len(parts) == 4 and parts[3] == "README.md":
+            week_entry["readme"] = entry.rel
 
-    for term_dir in sorted([p for p in notes_root.iterdir() if p.is_dir()]):
-        term = term_dir.name
-        for course_dir in sorted([p for p in term_dir.iterdir() if p.is_dir()]):
-            course = course_dir.name
-            for week_dir in sorted([p for p in course_dir.iterdir() if p.is_dir()]):
-                week = week_dir.name
-                yield term, course, week, week_dir
+    return NotesModel(tree, dict(sorted(suffix_counts.items())))
 
 
 def _render_week_readme_md(term: str, course: str, week: str) -> str:
@@ -231,63 +372,50 @@ def _render_week_readme_md(term: str, course: str, week: str) -> str:
     return "\n".join(lines) + "\n"
 
 
-def _scaffold_missing_week_readmes(repo_root: Path, notes_root: Path, *, dry_run: bool) -> Dict[str, Any]:
+def _scaffold_missing_week_readmes(repo_root: Path, model: NotesModel, *, dry_run: bool) -> Dict[str, Any]:
+    """Create missing week READMEs and record them in ``model``."""
+
     created: List[str] = []
     skipped: List[str] = []
 
-    for term, course, week, week_dir in _iter_week_dirs(notes_root):
-        readme = week_dir / "README.md"
-        if readme.exists():
-            skipped.append(_safe_relpath(readme, repo_root))
+    for term, course, week, week_entry in model.iter_weeks():
+        if week_entry["readme"]:
+            skipped.append(week_entry["readme"])
             continue
-        _write_text(readme, _render_week_readme_md(term, course, week), dry_run=dry_run)
-        created.append(_safe_relpath(readme, repo_root))
+        readme_rel = f"{week_entry['path']}/README.md"
+        _write_text(repo_root / readme_rel, _render_week_readme_md(term, course, week), dry_run=dry_run)
+        created.append(readme_rel)
+        if not dry_run:
+            week_entry["readme"] = readme_rel
+            week_entry["md_count"] += 1
 
     return {"created": created, "skipped": skipped}
 
 
-def _collect_notes_health(repo_root: Path, notes_root: Path, notes_tree: Dict[str, Any]) -> Dict[str, Any]:
-    terms = notes_tree.get("terms", {}) or {}
-    term_count = len(terms)
+def _collect_notes_health(model: NotesModel) -> Dict[str, Any]:
     course_count = 0
     week_count = 0
     weeks_missing_readme: List[str] = []
     weeks_empty_md: List[str] = []
 
-    for term, term_entry in terms.items():
-        courses = (term_entry or {}).get("courses", {}) or {}
-        course_count += len(courses)
-        for course, course_entry in courses.items():
-            weeks = (course_entry or {}).get("weeks", {}) or {}
-            week_count += len(weeks)
-            for week, w in weeks.items():
-                week_path = w.get("path")
-                if not w.get("readme") and week_path:
-                    weeks_missing_readme.append(week_path)
-                if int(w.get("md_count") or 0) == 0 and week_path:
-                    weeks_empty_md.append(week_path)
-
-    # Asset counts inside notes/ (helps strict-mode readiness).
-    suffix_counts: Dict[str, int] = {}
-    if notes_root.exists():
-        for p in notes_root.rglob("*"):
-            if not p.is_file():
-                continue
-            suf = p.suffix.lower()
-            if not suf:
-                continue
-            if suf in {".pdf", ".docx", ".pptx", ".ppt", ".xlsx", ".xls", ".png", ".jpg", ".jpeg", ".gif", ".svg"}:
-                suffix_counts[suf] = suffix_counts.get(suf, 0) + 1
+    for term_entry in model.tree["terms"].values():
+        course_count += len(term_entry["courses"])
+    for _term, _course, _week, w in model.iter_weeks():
+        week_count += 1
+        if not w["readme"]:
+            weeks_missing_readme.append(w["path"])
+        if w["md_count"] == 0:
+            weeks_empty_md.append(w["path"])
 
     return {
-        "term_count": term_count,
+        "term_count": len(model.tree["terms"]),
         "course_count": course_count,
         "week_count": week_count,
         "weeks_missing_readme_count": len(weeks_missing_readme),
         "weeks_missing_readme_sample": weeks_missing_readme[:25],
         "weeks_empty_md_count": len(weeks_empty_md),
         "weeks_empty_md_sample": weeks_empty_md[:25],
-        "notes_asset_suffix_counts": dict(sorted(suffix_counts.items())),
+        "notes_asset_suffix_counts": dict(model.asset_suffix_counts),
     }
 
 
@@ -359,7 +487,109 @@ def _strip_notes_prefix(repo_rel_path: str) -> str:
     return p.as_posix()
 
 
-def _render_notes_index_md(repo_root: Path, notes_tree: Dict[str, Any]) -> str:
+def _lines_md(lines: List[str]) -> str:
+    return "".join(line + "\n" for line in lines)
+
+
+def _render_course_fragment(course: str, course_entry: Dict[str, Any]) -> str:
+    lines: List[str] = [f"### {course}"]
+    weeks = (course_entry or {}).get("weeks", {})
+    if not weeks:
+        lines.extend(["", "(No weeks found)", ""])
+        return _lines_md(lines)
+
+    lines.append("")
+    for week, w_entry in weeks.items():
+        week_repo_rel = w_entry.get("path")
+        readme_repo_rel = w_entry.get("readme")
+
+        week_rel = _strip_notes_prefix(week_repo_rel) if week_repo_rel else None
+        readme_rel = _strip_notes_prefix(readme_repo_rel) if readme_repo_rel else None
+
+        label = week
+        if readme_rel:
+            lines.append(f"- {_md_link(label, readme_rel)}")
+        elif week_rel:
+            lines.append(f"- {_md_link(label, week_rel + '/')}")
+        else:
+            lines.append(f"- {label}")
+    lines.append("")
+    return _lines_md(lines)
+
+
+def _dirty_courses(paths: Iterable[str]) -> Set[str]:
+    """"Term/Course" keys whose notes subtree contains any of ``paths``."""
+
+    keys: Set[str] = set()
+    for rel in paths:
+        parts = rel.split("/")
+        if len(parts) >= 4 and parts[0] == "notes":
+            keys.add(f"{parts[1]}/{parts[2]}")
+    return keys
+
+
+def _render_index_fragments(
+    notes_tree: Dict[str, Any],
+    cached: Dict[str, Any],
+    dirty: Set[str],
+) -> Tuple[Dict[str, Any], int]:
+    """Per-term and per-course INDEX.md fragments; returns (fragments, courses_rendered).
+
+    A cached course fragment is reused unless its subtree is ``dirty`` or its
+    week list changed (empty week folders never reach the file manifest). A
+    term fragment is re-joined only when one of its courses was re-rendered
+    or its course list changed.
+    """
+
+    cached_terms = cached.get("terms", {}) if isinstance(cached.get("terms"), dict) else {}
+    terms_out: Dict[str, Any] = {}
+    rendered = 0
+    for term, term_entry in (notes_tree.get("terms", {}) or {}).items():
+        courses = (term_entry or {}).get("courses", {}) or {}
+        prev_term = cached_terms.get(term) if isinstance(cached_terms.get(term), dict) else {}
+        prev_courses = prev_term.get("courses") if isinstance(prev_term.get("courses"), dict) else {}
+
+        courses_out: Dict[str, Any] = {}
+        term_changed = list(courses) != list(prev_courses) or not isinstance(prev_term.get("md"), str)
+        for course, course_entry in courses.items():
+            weeks = list(((course_entry or {}).get("weeks", {}) or {}).keys())
+            hit = prev_courses.get(course)
+            if (
+                f"{term}/{course}" in dirty
+                or not isinstance(hit, dict)
+                or hit.get("weeks") != weeks
+                or not isinstance(hit.get("md"), str)
+            ):
+                hit = {"weeks": weeks, "md": _render_course_fragment(course, course_entry)}
+                rendered += 1
+                term_changed = True
+            courses_out[course] = hit
+
+        if term_changed:
+            body = "".join(c["md"] for c in courses_out.values()) if courses_out else _lines_md(["(No courses found)", ""])
+            term_md = _lines_md([f"## {term}", ""]) + body
+        else:
+            term_md = prev_term["md"]
+        terms_out[term] = {"md": term_md, "courses": courses_out}
+
+    return {"version": INDEX_FRAGMENTS_VERSION, "terms": terms_out}, rendered
+
+
+def _load_index_fragments(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(_read_text(path))
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_FRAGMENTS_VERSION:
+        return {}
+    return data
+
+
+def _render_notes_index_md(repo_root: Path, notes_tree: Dict[str, Any], fragments: Optional[Dict[str, Any]] = None) -> str:
+    """Splice notes/INDEX.md from per-term fragments (all rendered fresh when ``fragments`` is None)."""
+
     lines: List[str] = []
     lines.append("# Notes Index")
     lines.append("")
@@ -372,44 +602,11 @@ def _render_notes_index_md(repo_root: Path, notes_tree: Dict[str, Any]) -> str:
     if not terms:
         lines.append("No notes found under `notes/`.")
         lines.append("")
-        return "\n".join(lines) + "\n"
+        return _lines_md(lines)
 
-    for term, term_entry in terms.items():
-        lines.append(f"## {term}")
-        lines.append("")
-        courses = (term_entry or {}).get("courses", {})
-        if not courses:
-            lines.append("(No courses found)")
-            lines.append("")
-            continue
-
-        for course, course_entry in courses.items():
-            lines.append(f"### {course}")
-            weeks = (course_entry or {}).get("weeks", {})
-            if not weeks:
-                lines.append("")
-                lines.append("(No weeks found)")
-                lines.append("")
-                continue
-
-            lines.append("")
-            for week, w_entry in weeks.items():
-                week_repo_rel = w_entry.get("path")
-                readme_repo_rel = w_entry.get("readme")
-
-                week_rel = _strip_notes_prefix(week_repo_rel) if week_repo_rel else None
-                readme_rel = _strip_notes_prefix(readme_repo_rel) if readme_repo_rel else None
-
-                label = week
-                if readme_rel:
-                    lines.append(f"- {_md_link(label, readme_rel)}")
-                elif week_rel:
-                    lines.append(f"- {_md_link(label, week_rel + '/')}")
-                else:
-                    lines.append(f"- {label}")
-            lines.append("")
-
-    return "\n".join(lines) + "\n"
+    if fragments is None:
+        fragments, _rendered = _render_index_fragments(notes_tree, {}, set())
+    return _lines_md(lines) + "".join(fragments["terms"][term]["md"] for term in terms)
 
 
 def _replace_or_append_autoblock(existing: str, new_block: str) -> str:
@@ -470,30 +667,65 @@ def _validate_repo_layout(repo_root: Path) -> Tuple[bool, str]:
     return True, "ok"
 
 
-def run(repo_root: Path, *, dry_run: bool, verbose: bool, scaffold_week_readmes: bool = False) -> int:
+def run(
+    repo_root: Path,
+    *,
+    dry_run: bool,
+    verbose: bool,
+    scaffold_week_readmes: bool = False,
+    index: Optional[RepoIndex] = None,
+    hash_cache: Optional[HashCache] = None,
+    state_json: bool = False,
+) -> int:
+    """Generate docs/reports.
+
+    ``index`` and ``hash_cache`` let an in-process caller (maintain.py) share
+    one tree scan and one hash cache across steps. Files written by this run
+    are refreshed in the index so later steps see them; a caller-supplied
+    cache is saved by the caller.
+    """
+
     ok, msg = _validate_repo_layout(repo_root)
     if not ok:
         print(f"[repo-docs] ERROR: {msg}")
         return 2
 
     reports_dir = repo_root / "reports"
-    state_path = reports_dir / "_repo_docs_state.json"
+    state_path = reports_dir / "_repo_docs_state.bin"
+    state_json_path = reports_dir / "_repo_docs_state.json"
+    fragments_path = reports_dir / "_repo_docs_index_fragments.json"
 
     # Exclude generated artifacts from the manifest itself.
     exclude_dirs = set(DEFAULT_EXCLUDE_DIRS)
     exclude_files = {
         state_path.name,
+        state_json_path.name,
+        fragments_path.name,
         # Generated index should not drive change detection.
         "notes/INDEX.md",
     }
 
-    prev_state = _load_state(state_path)
+    prev_state = _load_state(state_path, legacy_json=state_json_path)
     prev_generated_at = prev_state.get("generated_at")
 
+    # Shared with the validator/approval helper; warm runs are stat-only.
+    owns_cache = hash_cache is None
+    if hash_cache is None:
+        hash_cache = HashCache.for_repo(repo_root)
+    if index is None:
+        index = scan_repo(repo_root)
+
     # Optional scaffolding may create new files; decide based on current layout.
     notes_root = repo_root / "notes"
 
-    curr_state_pre = _compute_manifest(repo_root, exclude_dirs=exclude_dirs, exclude_files=exclude_files)
+    prev_files = prev_state.get("files") if isinstance(prev_state.get("files"), dict) else {}
+    curr_state_pre = _compute_manifest(
+        index,
+        exclude_dirs=exclude_dirs,
+        exclude_files=exclude_files,
+        hash_cache=hash_cache,
+        prev_files=prev_files,
+    )
     diff_pre = _diff_manifests(prev_state, curr_state_pre)
 
     any_changes = bool(diff_pre["added"] or diff_pre["removed"] or diff_pre["modified"]) or (prev_generated_at is None)
@@ -510,19 +742,40 @@ def run(repo_root: Path, *, dry_run: bool, verbose: bool, scaffold_week_readmes:
     if not any_changes and not scaffold_week_readmes:
         if verbose:
             print("[repo-docs] No changes detected; nothing to do.")
+        if _stat_refreshed(prev_files, curr_state_pre["files"]):
+            # Touched but identical files: persist their new stat (keeping the
+            # last generation time) so later runs stay on the stat fast path.
+            _save_state(state_path, curr_state_pre, dry_run=dry_run, generated_at=prev_generated_at)
+            index.update([state_path])
+        if owns_cache:
+            hash_cache.save(dry_run=dry_run)
         return 0
 
+    # One model of notes/ (from the index) drives scaffolding, INDEX.md and
+    # the health report.
+    notes_model = _build_notes_model(index, notes_root)
+    notes_tree = notes_model.tree
+
     scaffold_result: Dict[str, Any] = {"created": [], "skipped": []}
     if scaffold_week_readmes:
-        scaffold_result = _scaffold_missing_week_readmes(repo_root, notes_root, dry_run=dry_run)
+        scaffold_result = _scaffold_missing_week_readmes(repo_root, notes_model, dry_run=dry_run)
         if verbose and scaffold_result.get("created"):
             print(f"[repo-docs] scaffolded week READMEs: {len(scaffold_result['created'])}")
 
-    # Generate docs.
-    notes_tree = _discover_notes_tree(notes_root)
+    # Generate docs. INDEX.md is spliced from cached per-term/course fragments;
+    # only courses touched by this run's changes are re-rendered. Without a
+    # previous state the diff is meaningless, so everything is rendered.
+    cached_fragments = _load_index_fragments(fragments_path) if prev_generated_at else {}
+    dirty = _dirty_courses(
+        [*diff_pre["added"], *diff_pre["removed"], *diff_pre["modified"], *scaffold_result.get("created", [])]
+    )
+    fragments, rendered = _render_index_fragments(notes_tree, cached_fragments, dirty)
+    if verbose:
+        total = sum(len(t["courses"]) for t in fragments["terms"].values())
+        print(f"[repo-docs] INDEX.md: re-rendered {rendered}/{total} course fragments")
 
     notes_index_path = notes_root / "INDEX.md"
-    notes_index_md = _render_notes_index_md(repo_root, notes_tree)
+    notes_index_md = _render_notes_index_md(repo_root, notes_tree, fragments)
     _write_text(notes_index_path, notes_index_md, dry_run=dry_run)
 
     # Root README: update/append autoblock
@@ -534,13 +787,32 @@ def run(repo_root: Path, *, dry_run: bool, verbose: bool, scaffold_week_readmes:
         _write_text(root_readme_path, updated_root_readme, dry_run=dry_run)
 
     # Health report (useful for auditing completeness and strict-mode readiness).
-    health = _collect_notes_health(repo_root, notes_root, notes_tree)
+    health = _collect_notes_health(notes_model)
     _write_text(reports_dir / "repo_health_report.md", _render_health_report_md(health), dry_run=dry_run)
 
-    # Persist state last so a partial run doesn't hide failures.
-    curr_state_post = _compute_manifest(repo_root, exclude_dirs=exclude_dirs, exclude_files=exclude_files)
+    # Refresh only what this run wrote instead of walking the tree again.
+    written = [
+        notes_index_path,
+        root_readme_path,
+        *[repo_root / rel for rel in scaffold_result.get("created", [])],
+    ]
+    index.update(written)
+
+    # Persist state last so a partial run doesn't hide failures. Only the
+    # files written above can differ from the pre-write manifest.
+    curr_state_post = _update_manifest(
+        curr_state_pre,
+        index,
+        written,
+        exclude_dirs=exclude_dirs,
+        exclude_files=exclude_files,
+        hash_cache=hash_cache,
+    )
     diff_post = _diff_manifests(prev_state, curr_state_post)
-    _save_state(state_path, curr_state_post, dry_run=dry_run)
+    _write_text(fragments_path, json.dumps(fragments, indent=2, sort_keys=True) + "\n", dry_run=dry_run)
+    _save_state(state_path, curr_state_post, dry_run=dry_run, json_path=state_json_path if state_json else None)
+    if owns_cache:
+        hash_cache.save(dry_run=dry_run)
 
     # Reports: inventory + change report
     inventory = {
@@ -555,6 +827,16 @@ def run(repo_root: Path, *, dry_run: bool, verbose: bool, scaffold_week_readmes:
 
     change_report_md = _render_change_report_md(diff_post, prev_generated_at=prev_generated_at)
     _write_text(reports_dir / "repo_change_report.md", change_report_md, dry_run=dry_run)
+    index.update(
+        [
+            state_path,
+            *([state_json_path] if state_json else []),
+            fragments_path,
+            reports_dir / "repo_health_report.md",
+            reports_dir / "repo_inventory.json",
+            reports_dir / "repo_change_report.md",
+        ]
+    )
 
     if verbose:
         print("[repo-docs] Generated/updated:")
@@ -564,6 +846,7 @@ def run(repo_root: Path, *, dry_run: bool, verbose: bool, scaffold_week_readmes:
         print(f"  - reports/repo_inventory.json")
         print(f"  - reports/repo_change_report.md")
         print(f"  - reports/{state_path.name}")
+        print(f"  - reports/{fragments_path.name}")
 
     return 0
 
@@ -582,6 +865,11 @@ def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Create missing notes/<Term>/<Course>/<WeekXX>/README.md files (additive; never overwrites).",
     )
+    p.add_argument(
+        "--state-json",
+        action="store_true",
+        help="Also export the change-detection state as reports/_repo_docs_state.json.",
+    )
     return p.parse_args(argv)
 
 
@@ -596,7 +884,13 @@ def main(argv: Optional[List[str]] = None) -> int:
         repo_root = script_path.parent.parent
 
     try:
-        return run(repo_root, dry_run=ns.dry_run, verbose=ns.verbose, scaffold_week_readmes=ns.scaffold_week_readmes)
+        return run(
+            repo_root,
+            dry_run=ns.dry_run,
+            verbose=ns.verbose,
+            scaffold_week_readmes=ns.scaffold_week_readmes,
+            state_json=ns.state_json,
+        )
     except Exception as e:
         print(f"[repo-docs] ERROR: {type(e).__name__}: {e}")
         return 3
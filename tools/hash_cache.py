@@ -0,0 +1,267 @@
+"""hash_cache.py
+
+Persistent content-hash cache shared by the repo maintenance tools.
+
+The validator, the docs generator and the approval helper all need SHA256
+digests of the same files (mostly images under notes/). Hashing is the only
+step that has to read file bytes, so we remember each digest together with the
+file's stat signature and reuse it while the signature is unchanged.
+
+Cache key
+- path (repo-relative POSIX when under the cache root, absolute otherwise)
+- size, mtime_ns, inode (from os.stat)
+
+If any stat field differs, the file is re-hashed and the entry replaced.
+
+Large files
+- ``tree_sha256`` fingerprints big binaries (lecture PDFs/DOCX) by hashing
+  fixed-size blocks on a thread pool (hashlib releases the GIL) and hashing
+  the ordered block digests. It is a different digest from ``sha256`` and is
+  cached alongside it in the same entry; approvals always use plain sha256.
+
+Default location: reports/_hash_cache.json (generated; never drives change
+detection because reports/ is excluded by every tool). With a StateStore
+(tools/state_store.py) the entries live in its ``fingerprints`` table
+instead, and ``save`` writes only the entries changed or pruned this run.
+
+Standard-library only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+
+if TYPE_CHECKING:
+    from tools.state_store import StateStore
+
+
+DEFAULT_CACHE_NAME = "_hash_cache.json"
+CACHE_VERSION = 1
+
+TREE_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+def sha256_file(path: Path, *, chunk_size: int = 1024 * 1024) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def tree_sha256_file(path: Path, *, block_size: int = TREE_BLOCK_SIZE, jobs: Optional[int] = None) -> str:
+    """Block tree hash: sha256 over the ordered sha256 digests of fixed-size blocks.
+
+    Blocks are read and hashed concurrently on ``jobs`` threads (default:
+    up to 8), so at most ``jobs`` blocks are in memory at once. The block
+    size is part of the root, so digests made with different sizes never
+    compare equal.
+    """
+
+    n_blocks = max(1, -(-path.stat().st_size // block_size))
+
+    def block_digest(i: int) -> bytes:
+        with path.open("rb") as f:
+            f.seek(i * block_size)
+            return hashlib.sha256(f.read(block_size)).digest()
+
+    workers = jobs or min(8, os.cpu_count() or 1)
+    if workers == 1 or n_blocks == 1:
+        digests = [block_digest(i) for i in range(n_blocks)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, n_blocks), thread_name_prefix="tree-hash") as pool:
+            digests = list(pool.map(block_digest, range(n_blocks)))
+
+    root = hashlib.sha256(b"tree-sha256:%d:" % block_size)
+    for d in digests:
+        root.update(d)
+    return root.hexdigest()
+
+
+def _stat_matches(entry: Optional[Dict[str, Any]], st: os.stat_result) -> bool:
+    return (
+        entry is not None
+        and entry.get("size") == st.st_size
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and entry.get("inode") == st.st_ino
+    )
+
+
+def default_cache_path(repo_root: Path) -> Path:
+    return repo_root / "reports" / DEFAULT_CACHE_NAME
+
+
+class HashCache:
+    """SHA256 cache keyed by (path, size, mtime_ns, inode).
+
+    A cache constructed without a path or store is memory-only (useful for
+    library callers and tests); ``save`` is then a no-op.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        root: Optional[Path] = None,
+        store: Optional["StateStore"] = None,
+    ) -> None:
+        self.path = path
+        self.root = root
+        self.store = store
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._touched: Set[str] = set()
+        self._changed: Set[str] = set()
+        self._removed: Set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path, *, root: Optional[Path] = None) -> "HashCache":
+        cache = cls(path, root=root)
+        if not path.exists():
+            return cache
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            # Corrupt cache should never block; start fresh.
+            return cache
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return cache
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            cache._entries = {k: v for k, v in entries.items() if isinstance(v, dict)}
+        return cache
+
+    @classmethod
+    def for_repo(cls, repo_root: Path) -> "HashCache":
+        return cls.load(default_cache_path(repo_root), root=repo_root)
+
+    @classmethod
+    def from_store(cls, store: "StateStore", *, root: Optional[Path] = None) -> "HashCache":
+        cache = cls(root=root, store=store)
+        cache._entries = store.load_fingerprints()
+        return cache
+
+    def _key(self, path: Path) -> str:
+        if self.root is not None:
+            try:
+                return path.relative_to(self.root).as_posix()
+            except ValueError:
+                pass
+        return path.as_posix()
+
+    def lookup(self, path: Path, *, st: os.stat_result) -> Optional[str]:
+        """Return the cached digest when the stat signature still matches, else None.
+
+        Never reads file bytes. Callers that hash elsewhere (e.g. in worker
+        processes) report the result back with ``record``.
+        """
+
+        key = self._key(path)
+        self._touched.add(key)
+        entry = self._entries.get(key)
+        if _stat_matches(entry, st) and isinstance(entry.get("sha256"), str):
+            self.hits += 1
+            return entry["sha256"]
+        return None
+
+    def record(self, path: Path, *, st: os.stat_result, sha256: str) -> None:
+        key = self._key(path)
+        self._touched.add(key)
+        self.misses += 1
+        self._entries[key] = {
+            "size": int(st.st_size),
+            "mtime_ns": int(st.st_mtime_ns),
+            "inode": int(st.st_ino),
+            "sha256": sha256,
+        }
+        self._changed.add(key)
+        self._removed.discard(key)
+        self._dirty = True
+
+    def sha256(self, path: Path, *, st: Optional[os.stat_result] = None) -> str:
+        """Return the SHA256 hex digest of ``path``, reading bytes only on a miss.
+
+        Callers that already hold an ``os.stat`` result may pass it as ``st`` to
+        avoid a second stat call.
+        """
+
+        if st is None:
+            st = path.stat()
+        digest = self.lookup(path, st=st)
+        if digest is None:
+            digest = sha256_file(path)
+            self.record(path, st=st, sha256=digest)
+        return digest
+
+    def tree_sha256(self, path: Path, *, st: Optional[os.stat_result] = None, block_size: int = TREE_BLOCK_SIZE) -> str:
+        """Return the block tree hash of ``path`` (see ``tree_sha256_file``), cached like ``sha256``."""
+
+        if st is None:
+            st = path.stat()
+        key = self._key(path)
+        self._touched.add(key)
+        entry = self._entries.get(key)
+        if _stat_matches(entry, st) and isinstance(entry.get("tree_sha256"), str):
+            self.hits += 1
+            return entry["tree_sha256"]
+
+        digest = tree_sha256_file(path, block_size=block_size)
+        self.misses += 1
+        updated: Dict[str, Any] = dict(entry) if _stat_matches(entry, st) else {
+            "size": int(st.st_size),
+            "mtime_ns": int(st.st_mtime_ns),
+            "inode": int(st.st_ino),
+        }
+        updated["tree_sha256"] = digest
+        self._entries[key] = updated
+        self._changed.add(key)
+        self._removed.discard(key)
+        self._dirty = True
+        return digest
+
+    def _prune_missing(self) -> None:
+        # Entries consulted this run are known to exist; only stat the rest.
+        for key in [k for k in self._entries if k not in self._touched]:
+            p = Path(key)
+            if not p.is_absolute() and self.root is not None:
+                p = self.root / p
+            try:
+                exists = p.is_file()
+            except OSError:
+                exists = False
+            if not exists:
+                self._entries.pop(key, None)
+                self._removed.add(key)
+                self._dirty = True
+
+    def save(self, *, dry_run: bool = False) -> None:
+        if dry_run:
+            return
+        if self.store is not None:
+            self._prune_missing()
+            if self._dirty:
+                changed = {k: self._entries[k] for k in self._changed if k in self._entries}
+                self.store.save_fingerprints(changed, removed=self._removed)
+                self._changed.clear()
+                self._removed.clear()
+                self._dirty = False
+            return
+        if self.path is None:
+            return
+        self._prune_missing()
+        if not self._dirty and self.path.exists():
+            return
+        payload = {"version": CACHE_VERSION, "entries": self._entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8", newline="\n")
+        self._dirty = False
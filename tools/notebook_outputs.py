@@ -0,0 +1,212 @@
+"""notebook_outputs.py
+
+Jupyter notebook (.ipynb) reader shared by the validator and approval tools.
+
+A notebook is JSON: cell sources and text outputs are the content worth
+scanning, while image outputs are large base64 payloads that only need a
+privacy review. This module splits the two:
+
+- ``iter_notebook_parts`` yields the text parts (notebook and cell
+  metadata, cell sources, stream / text/* / JSON / SVG / error outputs) and
+  the image parts (decoded output images and cell attachments, any image/*
+  type), one cell at a time.
+- Image parts are addressed by virtual repo paths with a fragment, e.g.
+  ``notes/.../lab.ipynb#cell3-output1.png`` (1-based cell/output numbers), so
+  they can be pinned in approved_artifacts.json like standalone images.
+
+Standard-library only.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+# Output/attachment MIME types treated as images (routed to approval).
+IMAGE_MIME_EXTENSIONS: Dict[str, str] = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+# Image MIME types that are markup, scanned as text instead.
+TEXT_IMAGE_MIMES = {"image/svg+xml"}
+
+_VIRTUAL_RE = re.compile(r"^(?P<file>.+\.ipynb)#(?P<fragment>cell\d+-[^/#]+)$", re.I)
+
+
+@dataclass(frozen=True)
+class NotebookText:
+    fragment: str  # e.g. "metadata", "cell2" (source), "cell2-metadata" or "cell2-output1"
+    text: str
+
+
+@dataclass(frozen=True)
+class NotebookImage:
+    fragment: str  # e.g. "cell2-output1.png" or "cell4-attachment1.png"
+    mime: str
+    sha256: str
+
+
+NotebookPart = Union[NotebookText, NotebookImage]
+
+
+def split_virtual_path(rel: str) -> Optional[Tuple[str, str]]:
+    """Split ``<file>.ipynb#<fragment>`` into (file, fragment); None for plain paths."""
+
+    m = _VIRTUAL_RE.match(rel)
+    if not m:
+        return None
+    return m.group("file"), m.group("fragment")
+
+
+def load_notebook(path: Path) -> Optional[Dict[str, Any]]:
+    """Parse an nbformat 4 notebook; None if the file is not one.
+
+    The whole file is parsed with ``json.load`` (the stdlib has no streaming
+    JSON parser), so peak memory grows with the notebook's size, base64 image
+    payloads included. Unlike plain text files, notebooks are not scanned in
+    bounded windows; only the per-part scanning that follows is incremental.
+    """
+
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            nb = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(nb, dict) or not isinstance(nb.get("cells"), list):
+        return None
+    return nb
+
+
+def _join(value: Any) -> str:
+    # nbformat stores multiline strings either as a str or a list of lines.
+    if isinstance(value, list):
+        return "".join(v for v in value if isinstance(v, str))
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ""
+    return json.dumps(value, sort_keys=True)
+
+
+def _image_extension(mime: str) -> str:
+    # Types outside the table still get a stable, approvable fragment (image/tiff -> .tiff).
+    ext = IMAGE_MIME_EXTENSIONS.get(mime)
+    if ext:
+        return ext
+    subtype = re.sub(r"[^a-z0-9]+", "-", mime.split("/", 1)[1].lower()).strip("-")
+    return "." + (subtype or "bin")
+
+
+def _image(fragment: str, mime: str, payload: Any) -> Optional[NotebookImage]:
+    try:
+        raw = base64.b64decode(_join(payload))
+    except (binascii.Error, ValueError):
+        return None
+    return NotebookImage(
+        fragment=fragment + _image_extension(mime),
+        mime=mime,
+        sha256=hashlib.sha256(raw).hexdigest(),
+    )
+
+
+def _metadata_text(fragment: str, metadata: Any) -> Iterator[NotebookText]:
+    # Author names, emails and tool settings live here; scan them as text.
+    if isinstance(metadata, dict) and metadata:
+        yield NotebookText(fragment, json.dumps(metadata, indent=1, sort_keys=True, ensure_ascii=False))
+
+
+def _iter_bundle(prefix: str, bundle: Dict[str, Any]) -> Iterator[NotebookPart]:
+    # A MIME bundle may carry both an image and its text/plain repr.
+    for mime, value in bundle.items():
+        if mime.startswith("image/") and mime not in TEXT_IMAGE_MIMES:
+            img = _image(prefix, mime, value)
+            if img is not None:
+                yield img
+                continue
+            # Not base64 (a malformed output): scan it rather than drop it.
+        elif not (
+            mime.startswith("text/")
+            or mime in TEXT_IMAGE_MIMES
+            or mime == "application/json"
+            or mime.endswith("+json")
+        ):
+            continue
+        text = _join(value)
+        if text:
+            yield NotebookText(prefix, text)
+
+
+def iter_notebook_parts(nb: Dict[str, Any]) -> Iterator[NotebookPart]:
+    """Yield text and image parts cell by cell, in notebook order.
+
+    Notebook-level metadata comes first (fragment ``metadata``), then per
+    cell its source, metadata (``cellN-metadata``), attachments and outputs.
+    """
+
+    yield from _metadata_text("metadata", nb.get("metadata"))
+
+    for ci, cell in enumerate(nb.get("cells") or [], start=1):
+        if not isinstance(cell, dict):
+            continue
+        cell_id = f"cell{ci}"
+
+        source = _join(cell.get("source"))
+        if source:
+            yield NotebookText(cell_id, source)
+
+        yield from _metadata_text(f"{cell_id}-metadata", cell.get("metadata"))
+
+        attachments = cell.get("attachments")
+        if isinstance(attachments, dict):
+            for ai, name in enumerate(sorted(attachments), start=1):
+                bundle = attachments[name]
+                if isinstance(bundle, dict):
+                    yield from _iter_bundle(f"{cell_id}-attachment{ai}", bundle)
+
+        outputs = cell.get("outputs")
+        if not isinstance(outputs, list):
+            continue
+        for oi, out in enumerate(outputs, start=1):
+            if not isinstance(out, dict):
+                continue
+            prefix = f"{cell_id}-output{oi}"
+            kind = out.get("output_type")
+            if kind == "stream":
+                text = _join(out.get("text"))
+                if text:
+                    yield NotebookText(prefix, text)
+            elif kind in {"execute_result", "display_data"}:
+                data = out.get("data")
+                if isinstance(data, dict):
+                    yield from _iter_bundle(prefix, data)
+            elif kind == "error":
+                lines: List[str] = [f"{_join(out.get('ename'))}: {_join(out.get('evalue'))}"]
+                tb = out.get("traceback")
+                if isinstance(tb, list):
+                    lines.extend(t for t in tb if isinstance(t, str))
+                yield NotebookText(prefix, "\n".join(lines))
+
+
+def notebook_image_hashes(path: Path) -> Dict[str, str]:
+    """Map fragment -> SHA256 for every image part of the notebook at ``path``."""
+
+    nb = load_notebook(path)
+    if nb is None:
+        return {}
+    return {part.fragment: part.sha256 for part in iter_notebook_parts(nb) if isinstance(part, NotebookImage)}
+
+
+def notebook_image_sha256(path: Path, fragment: str) -> Optional[str]:
+    """SHA256 of one image part (by fragment) of the notebook at ``path``."""
+
+    return notebook_image_hashes(path).get(fragment)
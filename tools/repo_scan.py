@@ -0,0 +1,219 @@
+"""repo_scan.py
+
+Single-pass repository scanner shared by the maintenance tools.
+
+One ``os.scandir`` traversal builds an in-memory index of every file (path,
+stat result, lowercased suffix, top-level root) plus every directory. The
+wrapper (maintain.py) scans once and hands the index to each step; each tool
+still builds its own index when run standalone.
+
+Only directories that no tool ever wants are pruned during the walk
+(``SCAN_PRUNE_DIRS``). Tool-specific excludes (e.g. reports/, archive/) are
+applied by the consumers as filters over the index, so every tool keeps its
+existing selection semantics.
+
+Standard-library only.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Directories pruned during the walk (excluded by every consumer).
+SCAN_PRUNE_DIRS: Set[str] = {
+    ".git",
+    "__pycache__",
+    ".venv",
+    ".ruff_cache",
+}
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    path: Path
+    rel: str  # repo-relative POSIX path
+    stat: os.stat_result
+    suffix: str  # lowercased, including the dot ("" if none)
+    root: str  # first component of rel ("" for top-level files)
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def size(self) -> int:
+        return int(self.stat.st_size)
+
+    @property
+    def mtime_ns(self) -> int:
+        return int(self.stat.st_mtime_ns)
+
+    @property
+    def parts(self) -> List[str]:
+        return self.rel.split("/")
+
+
+def _make_entry(path: Path, rel: str, st: os.stat_result) -> FileEntry:
+    first, sep, _rest = rel.partition("/")
+    return FileEntry(
+        path=path,
+        rel=rel,
+        stat=st,
+        suffix=path.suffix.lower(),
+        root=first if sep else "",
+    )
+
+
+class RepoIndex:
+    """In-memory file index for one directory tree."""
+
+    def __init__(self, root: Path, *, prune_dirs: Optional[Set[str]] = None) -> None:
+        self.root = root
+        self.prune_dirs = SCAN_PRUNE_DIRS if prune_dirs is None else prune_dirs
+        self._files: Dict[str, FileEntry] = {}
+        self._dirs: Set[str] = set()
+        self._sorted: Optional[List[FileEntry]] = None
+
+    @property
+    def files(self) -> List[FileEntry]:
+        """All file entries, sorted by repo-relative path."""
+
+        if self._sorted is None:
+            self._sorted = [self._files[k] for k in sorted(self._files)]
+        return self._sorted
+
+    @property
+    def dirs(self) -> List[str]:
+        """All directories (repo-relative POSIX), sorted."""
+
+        return sorted(self._dirs)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def relpath(self, path: Path) -> Optional[str]:
+        try:
+            rel = path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        return "" if rel == "." else rel
+
+    def get(self, path: Path) -> Optional[FileEntry]:
+        rel = self.relpath(path)
+        return self._files.get(rel) if rel else None
+
+    def has_file(self, path: Path) -> bool:
+        return self.get(path) is not None
+
+    def files_under(self, directory: Path) -> Optional[List[FileEntry]]:
+        """Entries below ``directory``; None when it lies outside the indexed root."""
+
+        rel = self.relpath(directory)
+        if rel is None:
+            return None
+        if not rel:
+            return list(self.files)
+        prefix = rel + "/"
+        return [e for e in self.files if e.rel.startswith(prefix)]
+
+    def iter_suffixes(self, suffixes: Iterable[str], *, under: Optional[Path] = None) -> Optional[List[FileEntry]]:
+        sufset = {s.lower() for s in suffixes}
+        entries = self.files if under is None else self.files_under(under)
+        if entries is None:
+            return None
+        return [e for e in entries if e.suffix in sufset]
+
+    def _add(self, entry: FileEntry) -> None:
+        self._files[entry.rel] = entry
+        parts = entry.rel.split("/")[:-1]
+        for i in range(1, len(parts) + 1):
+            self._dirs.add("/".join(parts[:i]))
+        self._sorted = None
+
+    def _drop_tree(self, rel: str) -> None:
+        prefix = rel + "/"
+        for key in [k for k in self._files if k.startswith(prefix)]:
+            del self._files[key]
+        self._dirs = {d for d in self._dirs if d != rel and not d.startswith(prefix)}
+        self._sorted = None
+
+    def update(self, paths: Iterable[Path]) -> None:
+        """Re-stat specific paths (added, rewritten or removed) in place.
+
+        Used by tools that write outputs during a run so later steps see the
+        current tree without a second traversal. A directory path refreshes
+        its whole subtree (e.g. a media folder a converter extracted).
+        """
+
+        for p in paths:
+            rel = self.relpath(p)
+            if not rel:
+                continue
+            try:
+                st = p.stat()
+                is_file = p.is_file()
+                is_dir = p.is_dir() and not p.is_symlink()
+            except OSError:
+                is_file = is_dir = False
+            if is_file:
+                self._add(_make_entry(p, rel, st))
+            elif is_dir:
+                if p.name in self.prune_dirs:
+                    continue
+                self._drop_tree(rel)
+                parts = rel.split("/")
+                for i in range(1, len(parts) + 1):
+                    self._dirs.add("/".join(parts[:i]))
+                sub = scan_repo(p, prune_dirs=self.prune_dirs)
+                for d in sub._dirs:
+                    self._dirs.add(f"{rel}/{d}")
+                for e in sub._files.values():
+                    self._files[f"{rel}/{e.rel}"] = _make_entry(e.path, f"{rel}/{e.rel}", e.stat)
+            elif rel in self._files:
+                self._files.pop(rel, None)
+                self._sorted = None
+            elif rel in self._dirs:
+                self._drop_tree(rel)
+
+
+def scan_repo(root: Path, *, prune_dirs: Optional[Set[str]] = None) -> RepoIndex:
+    """Walk ``root`` once with os.scandir and return its index.
+
+    Symlinked directories are not descended (matching os.walk/rglob defaults);
+    unreadable directories are skipped.
+    """
+
+    prune = SCAN_PRUNE_DIRS if prune_dirs is None else prune_dirs
+    index = RepoIndex(root, prune_dirs=prune)
+    if not root.is_dir():
+        return index
+
+    stack: List[Tuple[str, str]] = [(str(root), "")]
+    while stack:
+        abs_dir, rel_dir = stack.pop()
+        try:
+            it = os.scandir(abs_dir)
+        except OSError:
+            continue
+        with it:
+            for de in it:
+                rel = f"{rel_dir}/{de.name}" if rel_dir else de.name
+                try:
+                    if de.is_dir(follow_symlinks=False):
+                        if de.name in prune:
+                            continue
+                        index._dirs.add(rel)
+                        stack.append((de.path, rel))
+                        continue
+                    if not de.is_file():
+                        continue
+                    st = de.stat()
+                except OSError:
+                    continue
+                index._files[rel] = _make_entry(Path(de.path), rel, st)
+
+    return index
@@ -0,0 +1,206 @@
+"""state_store.py
+
+Optional SQLite-backed repository state shared by the maintenance tools.
+
+Without a store, each tool keeps its own JSON state file and every run
+loads, mutates and rewrites it whole. With ``--state-db`` (maintain.py and
+the individual tools) the same state lives in one SQLite database, written in
+one transaction per step and queried through indexes:
+
+- ``fingerprints``: the content-hash cache (path, size, mtime_ns, inode,
+  sha256, tree_sha256)
+- ``findings``: the latest validator findings; maintain.py queries the
+  unapproved images here instead of re-parsing compliance_report.json
+- ``approvals``: a mirror of approved_artifacts.json (+ journal), indexed by
+  sha256. The tracked manifest stays the source of truth.
+- ``conversions``: the DOCX -> Markdown conversion ledger
+
+The JSON/Markdown reports are still written; they are exports for people and
+CI, not the state the next run depends on.
+
+Default location: reports/_state.sqlite3 (generated; reports/ is excluded by
+every tool).
+
+Standard-library only.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+DEFAULT_STATE_DB_NAME = "_state.sqlite3"
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    sha256 TEXT,
+    tree_sha256 TEXT
+);
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    severity TEXT NOT NULL,
+    path TEXT NOT NULL,
+    rule TEXT NOT NULL,
+    line INTEGER,
+    col INTEGER,
+    message TEXT NOT NULL,
+    hint TEXT
+);
+CREATE INDEX IF NOT EXISTS findings_rule_severity ON findings (rule, severity);
+CREATE INDEX IF NOT EXISTS findings_path ON findings (path);
+CREATE TABLE IF NOT EXISTS approvals (
+    path TEXT PRIMARY KEY,
+    sha256 TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS approvals_sha256 ON approvals (sha256);
+CREATE TABLE IF NOT EXISTS conversions (
+    src TEXT PRIMARY KEY,
+    entry TEXT NOT NULL
+);
+"""
+
+
+def default_state_db_path(repo_root: Path) -> Path:
+    return repo_root / "reports" / DEFAULT_STATE_DB_NAME
+
+
+class StateStore:
+    """One SQLite connection; every public write is a single transaction."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            # Generated state from another schema: start fresh.
+            with self._conn:
+                for table in ("fingerprints", "findings", "approvals", "conversions"):
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    @classmethod
+    def for_repo(cls, repo_root: Path) -> "StateStore":
+        return cls(default_state_db_path(repo_root))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "StateStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # Content-hash cache (tools/hash_cache.py)
+
+    def load_fingerprints(self) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        rows = self._conn.execute("SELECT path, size, mtime_ns, inode, sha256, tree_sha256 FROM fingerprints")
+        for path, size, mtime_ns, inode, sha, tree_sha in rows:
+            entry: Dict[str, Any] = {"size": size, "mtime_ns": mtime_ns, "inode": inode}
+            if sha is not None:
+                entry["sha256"] = sha
+            if tree_sha is not None:
+                entry["tree_sha256"] = tree_sha
+            out[path] = entry
+        return out
+
+    def save_fingerprints(self, entries: Mapping[str, Mapping[str, Any]], *, removed: Iterable[str] = ()) -> None:
+        """Upsert ``entries`` and delete ``removed`` paths."""
+
+        with self._conn:
+            self._conn.executemany("DELETE FROM fingerprints WHERE path = ?", [(p,) for p in removed])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fingerprints (path, size, mtime_ns, inode, sha256, tree_sha256)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (path, int(e["size"]), int(e["mtime_ns"]), int(e["inode"]), e.get("sha256"), e.get("tree_sha256"))
+                    for path, e in entries.items()
+                ],
+            )
+
+    # Validator findings (tools/validate_notes_repo.py)
+
+    def replace_findings(self, findings: Iterable[Any]) -> None:
+        """Replace the stored findings with ``findings`` (validator Finding objects)."""
+
+        with self._conn:
+            self._conn.execute("DELETE FROM findings")
+            self._conn.executemany(
+                "INSERT INTO findings (severity, path, rule, line, col, message, hint) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(f.severity, f.path, f.rule, f.line, f.col, f.message, f.hint) for f in findings],
+            )
+
+    def finding_paths(self, *, rule: str, severity: str) -> List[str]:
+        rows = self._conn.execute(
+            "SELECT DISTINCT path FROM findings WHERE rule = ? AND severity = ? ORDER BY path",
+            (rule, severity),
+        )
+        return [path for (path,) in rows]
+
+    # Approval mirror (tools/approvals.py)
+
+    def replace_approvals(self, approved: Mapping[str, Any]) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM approvals")
+            self._conn.executemany(
+                "INSERT INTO approvals (path, sha256, entry) VALUES (?, ?, ?)",
+                [
+                    (path, (entry.get("sha256") or "").lower() or None, json.dumps(entry, sort_keys=True))
+                    for path, entry in approved.items()
+                    if isinstance(entry, dict)
+                ],
+            )
+
+    def apply_approval_changes(self, changes: Iterable[Tuple[str, Optional[Mapping[str, Any]]]]) -> None:
+        """Upsert (path, entry) pairs; an entry of None removes the path."""
+
+        with self._conn:
+            for path, entry in changes:
+                if entry is None:
+                    self._conn.execute("DELETE FROM approvals WHERE path = ?", (path,))
+                else:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO approvals (path, sha256, entry) VALUES (?, ?, ?)",
+                        (path, (entry.get("sha256") or "").lower() or None, json.dumps(entry, sort_keys=True)),
+                    )
+
+    def approved_paths_for_sha(self, sha256: str) -> List[str]:
+        rows = self._conn.execute("SELECT path FROM approvals WHERE sha256 = ? ORDER BY path", (sha256.lower(),))
+        return [path for (path,) in rows]
+
+    # Conversion ledger (tools/convert_assets_to_markdown.py)
+
+    def load_conversions(self) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        for src, entry in self._conn.execute("SELECT src, entry FROM conversions"):
+            try:
+                value = json.loads(entry)
+            except ValueError:
+                continue
+            if isinstance(value, dict):
+                out[src] = value
+        return out
+
+    def replace_conversions(self, documents: Mapping[str, Any]) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM conversions")
+            self._conn.executemany(
+                "INSERT INTO conversions (src, entry) VALUES (?, ?)",
+                [(src, json.dumps(entry, sort_keys=True)) for src, entry in documents.items()],
+            )
+
@@ -10,7 +10,12 @@ Focus areas:
 
 This validator supports an approval manifest (default: approved_artifacts.json)
 to record CodeSentinel-reviewed artifacts (especially images). Approved items are
-pinned by SHA256; if the file changes, it must be re-approved.
+pinned by SHA256; if the file changes, it must be re-approved. An image whose
+SHA256 matches any approved entry (e.g. a moved or duplicated file) counts as
+approved by content; tools/approve_artifacts.py --carry-forward pins it under
+its new path.
+The manifest is read together with its append-only journal
+(approved_artifacts.journal.jsonl); see tools/approvals.py.
 
 Reference guidance:
 - Consult your institution's academic integrity / conduct policies.
@@ -19,6 +24,29 @@ Reference guidance:
 Usage:
     python tools/validate_notes_repo.py --path <repo_root>
     python tools/validate_notes_repo.py --path <repo_root> --strict
+    python tools/validate_notes_repo.py --path <repo_root> --jobs 8
+    python tools/validate_notes_repo.py --path <repo_root> --no-findings-cache
+    python tools/validate_notes_repo.py --path <repo_root> --all-matches
+    python tools/validate_notes_repo.py --path <repo_root> --state-db reports/_state.sqlite3
+
+By default each text rule reports its first hit per file; --all-matches
+reports every hit. Text findings carry 1-based line/column either way.
+
+Notebooks (.ipynb) are parsed rather than scanned as raw JSON: cell sources
+and text outputs go through the text rules, and image outputs are routed to
+SHA256 approval under virtual paths such as nb.ipynb#cell3-output1.png.
+
+Text-file findings are cached in <report-dir>/_validate_cache.json, keyed by
+(path, size, mtime_ns, sha256) plus a hash of the rule set; unchanged files
+reuse their cached findings, and editing PATTERNS / EMAIL_RE / PHONE_RE
+invalidates the whole cache.
+
+With --state-db, digests are read from and findings (plus a mirror of the
+approvals) written to the SQLite state store (tools/state_store.py); the
+compliance reports are still written as exports.
+
+Findings are reported sorted by path, then rule id, so output is identical
+whether files are validated in-process or fanned out to worker processes.
 
 Exit codes:
 - 0: PASS (no ERROR findings; WARN findings allowed unless --strict)
@@ -29,15 +57,29 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
 import json
-import os
 from pathlib import Path
 import re
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Pattern, Set, Tuple, Union
+
+try:
+    from tools.approvals import ApprovalIndex, load_approval_manifest
+    from tools.hash_cache import HashCache, sha256_file
+    from tools.notebook_outputs import NotebookImage, NotebookText, iter_notebook_parts, load_notebook
+    from tools.repo_scan import FileEntry, RepoIndex, scan_repo
+    from tools.state_store import StateStore
+except ImportError:  # executed as a script: python tools/validate_notes_repo.py
+    from approvals import ApprovalIndex, load_approval_manifest
+    from hash_cache import HashCache, sha256_file
+    from notebook_outputs import NotebookImage, NotebookText, iter_notebook_parts, load_notebook
+    from repo_scan import FileEntry, RepoIndex, scan_repo
+    from state_store import StateStore
 
 
 @dataclass(frozen=True)
@@ -46,6 +88,9 @@ class Finding:
     path: str
     message: str
     hint: Optional[str] = None
+    rule: str = ""  # stable rule id (e.g. "email", "image"); second sort key after path
+    line: Optional[int] = None  # 1-based, text findings only
+    col: Optional[int] = None  # 1-based
 
 
 def _mask_email(value: str) -> str:
@@ -72,20 +117,24 @@ PRESENTATION_RISK_EXTENSIONS: Set[str] = {".ppt", ".pptx", ".key"}
 DOCUMENT_BINARY_EXTENSIONS: Set[str] = {".pdf", ".doc", ".docx"}
 
 # Heuristic patterns (keep intentionally small and explainable)
-PATTERNS: List[Tuple[str, Pattern[str], str, str]] = [
+# (rule id, severity, pattern, message, hint)
+PATTERNS: List[Tuple[str, str, Pattern[str], str, str]] = [
     (
+        "answer_key",
         "ERROR",
         re.compile(r"\b(answer\s*key|official\s*solutions?|solutions?\s*manual)\b", re.I),
         "Possible answer key / solutions content.",
         "Remove it unless explicitly permitted for public sharing.",
     ),
     (
+        "exam_content",
         "WARN",
         re.compile(r"\b(midterm|final\s*exam|exam\s*questions?|test\s*questions?)\b", re.I),
         "Possible exam/test content reference.",
         "Avoid posting assessment questions/answers or details from recent assessments.",
     ),
     (
+        "student_record",
         "WARN",
         re.compile(r"\b(canvas\s*grade|gradebook|student\s*id|pid\b)\b", re.I),
         "Possible grade/identifier reference.",
@@ -157,25 +206,15 @@ def should_apply_integrity_patterns(root: Path, path: Path) -> bool:
     return is_under_roots(root, path, CONTENT_ROOTS)
 
 
-def iter_files(root: Path) -> Iterable[Path]:
-    for dirpath, dirnames, filenames in os.walk(root):
-        # In-place prune
-        dirnames[:] = [d for d in dirnames if d not in DEFAULT_EXCLUDES]
-        for fn in filenames:
-            yield Path(dirpath) / fn
-
+def iter_files(root: Path, *, index: Optional[RepoIndex] = None) -> Iterable[FileEntry]:
+    """Yield indexed files, skipping any directory named in DEFAULT_EXCLUDES."""
 
-def read_text_safely(path: Path) -> Optional[str]:
-    try:
-        return path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        # Try a permissive decode; if it still looks binary, skip
-        try:
-            return path.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            return None
-    except Exception:
-        return None
+    if index is None:
+        index = scan_repo(root)
+    for entry in index.files:
+        if any(part in DEFAULT_EXCLUDES for part in entry.parts[:-1]):
+            continue
+        yield entry
 
 
 def add_finding(
@@ -185,6 +224,10 @@ def add_finding(
     path: Path,
     message: str,
     hint: Optional[str] = None,
+    *,
+    rule: str = "",
+    line: Optional[int] = None,
+    col: Optional[int] = None,
 ) -> None:
     try:
         rel_path = path.relative_to(root).as_posix()
@@ -196,21 +239,13 @@ def add_finding(
             path=str(rel_path),
             message=message,
             hint=hint,
+            rule=rule,
+            line=line,
+            col=col,
         )
     )
 
 
-def _sha256_file(path: Path, *, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def _safe_relpath(root: Path, path: Path) -> str:
     try:
         return path.relative_to(root).as_posix()
@@ -219,37 +254,30 @@ def _safe_relpath(root: Path, path: Path) -> str:
 
 
 def _load_approval_manifest(root: Path, *, manifest_path: Optional[Path] = None) -> Dict[str, Any]:
-    """Load the approval manifest.
-
-    Format:
-      {
-        "version": 1,
-        "approved": {
-          "notes/.../image.png": {
-            "sha256": "...",
-            "category": "image",
-            "approved_utc": "...",
-            "notes": "..." (optional)
-          }
-        }
-      }
-    """
+    """Load the approval manifest (format: see tools/approvals.py)."""
 
-    mp = manifest_path or (root / APPROVAL_MANIFEST_DEFAULT)
-    if not mp.exists():
-        return {"version": 1, "approved": {}}
-    try:
-        data = json.loads(mp.read_text(encoding="utf-8"))
-    except Exception:
-        return {"version": 1, "approved": {}}
+    return load_approval_manifest(manifest_path or (root / APPROVAL_MANIFEST_DEFAULT))
 
-    if not isinstance(data, dict):
-        return {"version": 1, "approved": {}}
 
-    approved = data.get("approved")
-    if not isinstance(approved, dict):
-        approved = {}
-    return {"version": int(data.get("version", 1) or 1), "approved": approved}
+# Approvals as passed around the validator: a plain {path: entry} mapping
+# (callers/tests) or a prebuilt index (validate_repo).
+Approvals = Union[Mapping[str, Any], ApprovalIndex]
+
+
+def _approval_source(
+    *,
+    root: Path,
+    path: Path,
+    sha256: str,
+    approvals: Approvals,
+) -> Tuple[Optional[str], Optional[str]]:
+    """Return (approved_path, reason_if_not).
+
+    ``approved_path`` is the file's own repo-relative path when its entry
+    matches, or another approved path with identical SHA256 content.
+    """
+
+    return ApprovalIndex.coerce(approvals).match(_safe_relpath(root, path), sha256)
 
 
 def _is_approved(
@@ -257,25 +285,16 @@ def _is_approved(
     root: Path,
     path: Path,
     sha256: str,
-    approvals: Dict[str, Any],
+    approvals: Approvals,
 ) -> Tuple[bool, Optional[str]]:
     """Return (is_approved, reason_if_not).
 
-    Approvals are keyed by repo-relative POSIX paths and pinned by SHA256.
+    Approvals are keyed by repo-relative POSIX paths and pinned by SHA256;
+    content already approved under another path also counts.
     """
 
-    rel = _safe_relpath(root, path)
-    entry = approvals.get(rel)
-    if entry is None:
-        return False, "not listed"
-    if not isinstance(entry, dict):
-        return False, "invalid entry"
-    expected = entry.get("sha256")
-    if not expected or not isinstance(expected, str):
-        return False, "missing sha256"
-    if expected.lower() != sha256.lower():
-        return False, "sha256 mismatch"
-    return True, None
+    source, reason = _approval_source(root=root, path=path, sha256=sha256, approvals=approvals)
+    return source is not None, reason
 
 
 def validate_required_files(root: Path, findings: List[Finding]) -> None:
@@ -296,162 +315,765 @@ def validate_required_files(root: Path, findings: List[Finding]) -> None:
                 p,
                 f"Missing recommended file: {rel}",
                 "Add it to make expectations explicit for public readers.",
+                rule="required_file",
             )
         else:
             # Basic sanity check
             try:
                 if p.is_file() and p.stat().st_size == 0:
-                    add_finding(root, findings, "WARN", p, f"File is empty: {rel}")
+                    add_finding(root, findings, "WARN", p, f"File is empty: {rel}", rule="required_file")
             except Exception:
                 pass
 
 
-def validate_text_file(
+# Scoped inline flags usable inside a combined pattern: (?i:...), (?m:...), ...
+_INLINE_FLAGS: List[Tuple[int, str]] = [(re.A, "a"), (re.I, "i"), (re.M, "m"), (re.S, "s"), (re.X, "x")]
+
+_COMBINED_RE_CACHE: Dict[Tuple[Any, ...], Pattern[str]] = {}
+
+
+def _text_rules(apply_integrity_patterns: bool) -> List[Tuple[str, Pattern[str]]]:
+    rules: List[Tuple[str, Pattern[str]]] = [("email", EMAIL_RE), ("phone", PHONE_RE)]
+    if apply_integrity_patterns:
+        rules.extend((rule, pattern) for rule, _sev, pattern, _msg, _hint in PATTERNS)
+    return rules
+
+
+def combined_text_regex(apply_integrity_patterns: bool) -> Pattern[str]:
+    """Compile the text rules into one alternation of zero-width lookaheads.
+
+    Each branch is ``(?=(?P<rule>...))`` with the rule's own flags as a
+    scoped inline group. A match consumes no text, so ``finditer`` yields
+    every position where some rule matches and ``lastgroup`` names the first
+    such rule; hits of different rules may overlap (see validate_text_file).
+    Recompiled automatically if PATTERNS / EMAIL_RE / PHONE_RE change.
+    """
+
+    rules = _text_rules(apply_integrity_patterns)
+    key = tuple((rule, pattern.pattern, pattern.flags) for rule, pattern in rules)
+    combined = _COMBINED_RE_CACHE.get(key)
+    if combined is None:
+        parts = []
+        for rule, pattern in rules:
+            flags = "".join(c for flag, c in _INLINE_FLAGS if pattern.flags & flag)
+            body = f"(?{flags}:{pattern.pattern})" if flags else pattern.pattern
+            parts.append(f"(?=(?P<{rule}>{body}))")
+        combined = re.compile("|".join(parts))
+        _COMBINED_RE_CACHE[key] = combined
+    return combined
+
+
+class _LineIndex:
+    """Offsets of line starts, built on first use; lookups are a binary search."""
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._starts: Optional[List[int]] = None
+
+    def locate(self, offset: int) -> Tuple[int, int]:
+        """Return 1-based (line, col) for a character offset."""
+
+        if self._starts is None:
+            starts = [0]
+            find = self._text.find
+            i = find("\n")
+            while i != -1:
+                starts.append(i + 1)
+                i = find("\n", i + 1)
+            self._starts = starts
+        line = bisect_right(self._starts, offset)
+        return line, offset - self._starts[line - 1] + 1
+
+
+# Streaming scan: text is decoded once, in windows of SCAN_WINDOW_CHARS. The
+# last SCAN_OVERLAP_CHARS of each window are rescanned with the next one, so
+# any match shorter than the overlap is found exactly as in a whole-file scan.
+SCAN_WINDOW_CHARS = 1 << 20
+SCAN_OVERLAP_CHARS = 4096
+_SCAN_CONTEXT_CHARS = 16  # kept before the scan position so \b sees its left neighbour
+
+# (rule, matched text, line, col)
+_TextHit = Tuple[str, str, int, int]
+
+
+def _scan_text_stream(
+    chunks: Iterable[str],
+    *,
+    apply_integrity_patterns: bool,
+    all_matches: bool,
+    seen: Optional[Set[str]] = None,
+) -> List[_TextHit]:
+    """Run the combined regex over consecutive text chunks in a single pass.
+
+    Hits match per-rule ``search``/``finditer`` semantics: at each candidate
+    position the rules after ``lastgroup`` are tried too, so overlapping hits
+    of different rules are all reported, and a rule only hits again at or
+    after the end of its previous hit.
+
+    ``seen`` (rules already reported) may be shared across several texts of
+    one file so first-hit mode still reports each rule once per file.
+    """
+
+    regex = combined_text_regex(apply_integrity_patterns)
+    rules = _text_rules(apply_integrity_patterns)
+    rule_order = {rule: i for i, (rule, _pattern) in enumerate(rules)}
+    wanted = len(rules)
+    if seen is None:
+        seen = set()
+    hits: List[_TextHit] = []
+    if not all_matches and len(seen) == wanted:
+        return hits
+
+    buf = ""
+    pos = 0  # scanning resumes here; buf[:pos] is lookbehind context only
+    resume: Dict[str, int] = {}  # rule -> buf offset where its previous hit ended
+    base_line = 1  # line number of buf[0]
+    base_col = 0  # 0-based column of buf[0]
+    it = iter(chunks)
+    while True:
+        chunk = next(it, None)
+        final = chunk is None
+        if chunk:
+            buf += chunk
+        limit = len(buf) if final else len(buf) - SCAN_OVERLAP_CHARS
+        if not final and limit <= pos:
+            continue
+
+        lines = _LineIndex(buf)
+        for m in regex.finditer(buf, pos):
+            start = m.start()
+            if not final and start >= limit:
+                break
+            first = m.lastgroup
+            if first is None:
+                continue
+            for rule, pattern in rules[rule_order[first] :]:
+                if (rule in seen and not all_matches) or start < resume.get(rule, 0):
+                    continue
+                if rule == first:
+                    value = m.group(rule)
+                else:
+                    other = pattern.match(buf, start)
+                    if other is None:
+                        continue
+                    value = other.group(0)
+                seen.add(rule)
+                resume[rule] = start + len(value)
+                line, col = lines.locate(start)
+                hits.append((rule, value, base_line + line - 1, col + base_col if line == 1 else col))
+                if not all_matches and len(seen) == wanted:
+                    return hits
+        if final:
+            return hits
+
+        # Drop scanned text, keeping a little context for the next window.
+        cut = max(0, limit - _SCAN_CONTEXT_CHARS)
+        newlines = buf.count("\n", 0, cut)
+        if newlines:
+            base_line += newlines
+            base_col = cut - (buf.rfind("\n", 0, cut) + 1)
+        else:
+            base_col += cut
+        buf = buf[cut:]
+        pos = limit - cut
+        resume = {rule: end - cut for rule, end in resume.items()}
+
+
+def _add_text_findings(
     root: Path,
     path: Path,
-    text: str,
     findings: List[Finding],
+    hits: List[_TextHit],
     *,
     apply_integrity_patterns: bool,
 ) -> None:
+    by_rule: Dict[str, List[Tuple[str, int, int]]] = {}
+    for rule, value, line, col in hits:
+        by_rule.setdefault(rule, []).append((value, line, col))
+
     # PII heuristics: emails and phone-like strings are disallowed for this repo.
-    m = EMAIL_RE.search(text)
-    if m:
+    for value, line, col in by_rule.get("email", []):
         add_finding(
             root,
             findings,
             "ERROR",
             path,
-            f"Found an email address: {_mask_email(m.group(0))}",
+            f"Found an email address: {_mask_email(value)}",
             "Remove email addresses from tracked content.",
+            rule="email",
+            line=line,
+            col=col,
         )
 
-    m = PHONE_RE.search(text)
-    if m:
+    for value, line, col in by_rule.get("phone", []):
         add_finding(
             root,
             findings,
             "ERROR",
             path,
-            f"Found a phone-number-like string: {_mask_phone(m.group(0))}",
+            f"Found a phone-number-like string: {_mask_phone(value)}",
             "Remove phone numbers from tracked content.",
+            rule="phone",
+            line=line,
+            col=col,
         )
 
     if apply_integrity_patterns:
-        for severity, pattern, msg, hint in PATTERNS:
-            if pattern.search(text):
-                add_finding(root, findings, severity, path, msg, hint)
+        for rule, severity, _pattern, msg, hint in PATTERNS:
+            for _value, line, col in by_rule.get(rule, []):
+                add_finding(root, findings, severity, path, msg, hint, rule=rule, line=line, col=col)
 
 
-def validate_repo(root: Path, *, approvals: Optional[Dict[str, Any]] = None) -> List[Finding]:
-    findings: List[Finding] = []
+def validate_text_file(
+    root: Path,
+    path: Path,
+    text: str,
+    findings: List[Finding],
+    *,
+    apply_integrity_patterns: bool,
+    all_matches: bool = False,
+) -> None:
+    """Scan ``text`` once with the combined rule regex.
 
-    if not root.exists() or not root.is_dir():
-        return [Finding("ERROR", ".", "Path does not exist or is not a directory.")]
+    By default only the first hit per rule is reported; with ``all_matches``
+    every hit is, each with its line/column.
+    """
 
-    validate_required_files(root, findings)
+    hits = _scan_text_stream([text], apply_integrity_patterns=apply_integrity_patterns, all_matches=all_matches)
+    _add_text_findings(root, path, findings, hits, apply_integrity_patterns=apply_integrity_patterns)
 
-    manifest = _load_approval_manifest(root)
-    approved_map: Dict[str, Any] = dict(manifest.get("approved") or {})
-    if approvals is not None:
-        # Allow callers/tests to inject/override approvals.
-        approved_map = approvals
 
-    for path in iter_files(root):
-        # Do not scan the validator itself for integrity keywords.
-        if path.name == Path(__file__).name:
-            continue
+def validate_text_path(
+    root: Path,
+    path: Path,
+    findings: List[Finding],
+    *,
+    apply_integrity_patterns: bool,
+    all_matches: bool = False,
+) -> bool:
+    """Stream a text file through the scanner; False if it cannot be read.
 
-        suffix = path.suffix.lower()
+    The file is decoded once (UTF-8, undecodable bytes replaced) in fixed-size
+    windows, so peak memory is bounded by the window size rather than the
+    file size.
+    """
 
-        # Flag images for manual review unless explicitly approved in the manifest.
-        # NOTE: If an image is approved, it should not fail in strict mode.
-        if suffix in IMAGE_EXTENSIONS:
-            try:
-                sha = _sha256_file(path)
-            except Exception:
-                sha = ""
+    try:
+        with path.open("r", encoding="utf-8", errors="replace") as f:
+            hits = _scan_text_stream(
+                iter(lambda: f.read(SCAN_WINDOW_CHARS), ""),
+                apply_integrity_patterns=apply_integrity_patterns,
+                all_matches=all_matches,
+            )
+    except (OSError, ValueError):
+        return False
+    _add_text_findings(root, path, findings, hits, apply_integrity_patterns=apply_integrity_patterns)
+    return True
 
-            is_ok, reason = _is_approved(root=root, path=path, sha256=sha, approvals=approved_map)
-            if is_ok:
-                add_finding(
-                    root,
-                    findings,
-                    "INFO",
-                    path,
-                    "Image present and approved (pinned by SHA256).",
-                    "No further scrutiny required unless the file changes.",
-                )
-            else:
-                if SUSPICIOUS_IMAGE_NAME_RE.search(path.name):
-                    add_finding(
-                        root,
-                        findings,
-                        "ERROR",
-                        path,
-                        "Image filename suggests it may contain private info (email/grades/roster).",
-                        "Do not store screenshots of email/Canvas/grades in the repository unless reviewed and approved.",
-                    )
-                else:
-                    add_finding(
-                        root,
-                        findings,
-                        "WARN",
-                        path,
-                        "Image file present; manual privacy review required.",
-                        "If approved by CodeSentinel, add it to approved_artifacts.json so it won't warn again.",
-                    )
+
+# Suffixes whose findings depend on the file's SHA256 (approval pinning).
+HASHED_EXTENSIONS: Set[str] = IMAGE_EXTENSIONS | PRESENTATION_RISK_EXTENSIONS
+
+# A unit of per-file work: (absolute path, lowercased suffix, cached sha256 or
+# None, whether the digest is needed).
+_FileTask = Tuple[str, str, Optional[str], bool]
+
+# Per-file result: (absolute path, findings, notebook image parts as (fragment, sha256)).
+_FileResult = Tuple[str, List[Finding], List[Tuple[str, str]]]
+
+
+def _add_image_findings(
+    root: Path,
+    path: Path,
+    findings: List[Finding],
+    *,
+    sha256: str,
+    approvals: Approvals,
+    name: str,
+) -> None:
+    """Approval-based findings for one image; ``name`` feeds the filename heuristic."""
+
+    # Flag images for manual review unless explicitly approved in the manifest.
+    # NOTE: If an image is approved, it should not fail in strict mode.
+    source, _reason = _approval_source(root=root, path=path, sha256=sha256, approvals=approvals)
+    if source is not None and source == _safe_relpath(root, path):
+        add_finding(
+            root,
+            findings,
+            "INFO",
+            path,
+            "Image present and approved (pinned by SHA256).",
+            "No further scrutiny required unless the file changes.",
+            rule="image",
+        )
+    elif source is not None:
+        add_finding(
+            root,
+            findings,
+            "INFO",
+            path,
+            f"Image present and approved by content (same SHA256 as {source}).",
+            "Run tools/approve_artifacts.py --carry-forward to pin it under this path.",
+            rule="image",
+        )
+    elif SUSPICIOUS_IMAGE_NAME_RE.search(name):
+        add_finding(
+            root,
+            findings,
+            "ERROR",
+            path,
+            "Image filename suggests it may contain private info (email/grades/roster).",
+            "Do not store screenshots of email/Canvas/grades in the repository unless reviewed and approved.",
+            rule="image",
+        )
+    else:
+        add_finding(
+            root,
+            findings,
+            "WARN",
+            path,
+            "Image file present; manual privacy review required.",
+            "If approved by CodeSentinel, add it to approved_artifacts.json so it won't warn again.",
+            rule="image",
+        )
+
+
+def _notebook_part_path(path: Path, fragment: str) -> Path:
+    return path.with_name(f"{path.name}#{fragment}")
+
+
+def add_notebook_image_findings(
+    root: Path,
+    path: Path,
+    findings: List[Finding],
+    images: Iterable[Tuple[str, str]],
+    *,
+    approvals: Approvals,
+) -> None:
+    """Route notebook image outputs, given as (fragment, sha256), through approval."""
+
+    for fragment, sha in images:
+        _add_image_findings(
+            root,
+            _notebook_part_path(path, fragment),
+            findings,
+            sha256=sha,
+            approvals=approvals,
+            name=fragment,
+        )
+
+
+def validate_notebook(
+    root: Path,
+    path: Path,
+    findings: List[Finding],
+    *,
+    approvals: Approvals,
+    all_matches: bool = False,
+) -> Optional[List[Tuple[str, str]]]:
+    """Validate a notebook cell by cell; None if it is not nbformat JSON.
+
+    Cell sources and text outputs are scanned with the text rules (findings
+    use virtual paths like ``nb.ipynb#cell2-output1``); base64 image outputs
+    are never scanned, only hashed and checked against approvals. Returns
+    the (fragment, sha256) image parts found.
+    """
+
+    nb = load_notebook(path)
+    if nb is None:
+        return None
+
+    apply_integrity = should_apply_integrity_patterns(root, path)
+    seen: Set[str] = set()
+    images: List[Tuple[str, str]] = []
+    for part in iter_notebook_parts(nb):
+        if isinstance(part, NotebookImage):
+            images.append((part.fragment, part.sha256))
             continue
+        assert isinstance(part, NotebookText)
+        hits = _scan_text_stream(
+            [part.text], apply_integrity_patterns=apply_integrity, all_matches=all_matches, seen=seen
+        )
+        if hits:
+            _add_text_findings(
+                root,
+                _notebook_part_path(path, part.fragment),
+                findings,
+                hits,
+                apply_integrity_patterns=apply_integrity,
+            )
+
+    add_notebook_image_findings(root, path, findings, images, approvals=approvals)
+    return images
+
+
+def validate_file(
+    root: Path,
+    path: Path,
+    suffix: str,
+    findings: List[Finding],
+    *,
+    sha256: str,
+    approvals: Approvals,
+    all_matches: bool = False,
+) -> List[Tuple[str, str]]:
+    """Validate one file. ``sha256`` is only consulted for HASHED_EXTENSIONS.
+
+    Returns the (fragment, sha256) image parts of a notebook, else [].
+    """
+
+    if suffix in IMAGE_EXTENSIONS:
+        _add_image_findings(root, path, findings, sha256=sha256, approvals=approvals, name=path.name)
+        return []
+
+    # Binary formats:
+    # - Presentations are higher risk for redistribution (often instructor decks).
+    # - PDF/DOCX are allowed for a notes repo, but should be reviewed for privacy.
+    if suffix in PRESENTATION_RISK_EXTENSIONS:
+        sev = "INFO" if is_under_roots(root, path, EXPORT_ROOTS) else "WARN"
+        # If explicitly approved, suppress WARN.
+        is_ok, _reason = _is_approved(root=root, path=path, sha256=sha256, approvals=approvals)
+        if is_ok:
+            sev = "INFO"
+        add_finding(
+            root,
+            findings,
+            sev,
+            path,
+            f"Presentation file present: {suffix}",
+            "If public, ensure this is your own work or you have permission to share it.",
+            rule="presentation",
+        )
+        return []
+
+    if suffix in DOCUMENT_BINARY_EXTENSIONS:
+        sev = "INFO" if is_under_roots(root, path, EXPORT_ROOTS) else "INFO"
+        add_finding(
+            root,
+            findings,
+            sev,
+            path,
+            f"Document file present: {suffix}",
+            "If public, review for personal information before committing.",
+            rule="document",
+        )
+        return []
+
+    if suffix == ".ipynb":
+        images = validate_notebook(root, path, findings, approvals=approvals, all_matches=all_matches)
+        if images is not None:
+            return images
+        # Not nbformat JSON: fall through to a plain text scan.
 
-        # Binary formats:
-        # - Presentations are higher risk for redistribution (often instructor decks).
-        # - PDF/DOCX are allowed for a notes repo, but should be reviewed for privacy.
-        if suffix in PRESENTATION_RISK_EXTENSIONS:
-            sev = "INFO" if is_under_roots(root, path, EXPORT_ROOTS) else "WARN"
-            # If explicitly approved, suppress WARN.
+    if suffix in BROAD_TEXT_EXTENSIONS:
+        ok = validate_text_path(
+            root,
+            path,
+            findings,
+            apply_integrity_patterns=should_apply_integrity_patterns(root, path),
+            all_matches=all_matches,
+        )
+        if not ok:
+            add_finding(root, findings, "WARN", path, "Could not read text file reliably.", rule="unreadable")
+    return []
+
+
+def _validate_chunk(
+    root: Path,
+    tasks: List[_FileTask],
+    approvals: Approvals,
+    all_matches: bool = False,
+) -> Tuple[List[_FileResult], Dict[str, str]]:
+    """Validate a batch of files; returns (per-file results, digests computed here).
+
+    Module-level so it can run in a worker process. Digests missing from the
+    caller's hash cache are computed here and handed back for recording.
+    """
+
+    results: List[_FileResult] = []
+    new_hashes: Dict[str, str] = {}
+    for path_str, suffix, sha, want_hash in tasks:
+        path = Path(path_str)
+        if want_hash and sha is None:
             try:
-                sha = _sha256_file(path)
+                sha = sha256_file(path)
+                new_hashes[path_str] = sha
             except Exception:
                 sha = ""
-            is_ok, _reason = _is_approved(root=root, path=path, sha256=sha, approvals=approved_map)
-            if is_ok:
-                sev = "INFO"
-            add_finding(
-                root,
-                findings,
-                sev,
-                path,
-                f"Presentation file present: {suffix}",
-                "If public, ensure this is your own work or you have permission to share it.",
-            )
-            continue
+        findings: List[Finding] = []
+        images = validate_file(
+            root, path, suffix, findings, sha256=sha or "", approvals=approvals, all_matches=all_matches
+        )
+        results.append((path_str, findings, images))
+    return results, new_hashes
 
-        if suffix in DOCUMENT_BINARY_EXTENSIONS:
-            sev = "INFO" if is_under_roots(root, path, EXPORT_ROOTS) else "INFO"
-            add_finding(
-                root,
-                findings,
-                sev,
-                path,
-                f"Document file present: {suffix}",
-                "If public, review for personal information before committing.",
+
+# Per-worker-process state, set once by the pool initializer so the approval
+# index is pickled once per worker rather than once per chunk.
+_WORKER_STATE: Optional[Tuple[Path, Approvals, bool]] = None
+
+
+def _init_worker(root: Path, approvals: Approvals, all_matches: bool) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (root, approvals, all_matches)
+
+
+def _validate_worker_chunk(tasks: List[_FileTask]) -> Tuple[List[_FileResult], Dict[str, str]]:
+    assert _WORKER_STATE is not None, "worker not initialized"
+    root, approvals, all_matches = _WORKER_STATE
+    return _validate_chunk(root, tasks, approvals, all_matches)
+
+
+def _chunked(tasks: List[_FileTask], *, jobs: int) -> List[List[_FileTask]]:
+    # A few chunks per worker keeps workers busy when file costs are uneven.
+    size = max(1, -(-len(tasks) // (jobs * 4)))
+    return [tasks[i : i + size] for i in range(0, len(tasks), size)]
+
+
+def _sort_findings(findings: List[Finding]) -> List[Finding]:
+    # Stable: findings for the same (path, rule) keep their discovery order.
+    return sorted(findings, key=lambda f: (f.path, f.rule))
+
+
+FINDINGS_CACHE_NAME = "_validate_cache.json"
+FINDINGS_CACHE_VERSION = 4
+
+
+def rules_fingerprint(*, all_matches: bool = False) -> str:
+    """Hash of everything that decides text-file findings.
+
+    Any edit to PATTERNS, EMAIL_RE or PHONE_RE (or a change of reporting
+    mode) changes it, which invalidates the findings cache.
+    """
+
+    def _pat(p: Pattern[str]) -> List[Any]:
+        return [p.pattern, int(p.flags)]
+
+    payload = {
+        "version": FINDINGS_CACHE_VERSION,
+        "email": _pat(EMAIL_RE),
+        "phone": _pat(PHONE_RE),
+        "patterns": [[rule, sev, *_pat(pat), msg, hint] for rule, sev, pat, msg, hint in PATTERNS],
+        "content_roots": sorted(CONTENT_ROOTS),
+        "all_matches": all_matches,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class FindingsCache:
+    """Per-file text findings keyed by (rel path, size, mtime_ns, sha256, rules hash).
+
+    A cache constructed without a path is memory-only; ``save`` is then a no-op.
+    Entries for files not seen in the current run are dropped on save.
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, all_matches: bool = False) -> None:
+        self.path = path
+        self.rules = rules_fingerprint(all_matches=all_matches)
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._seen: Set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path, *, all_matches: bool = False) -> "FindingsCache":
+        cache = cls(path, all_matches=all_matches)
+        if not path.exists():
+            return cache
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            # Corrupt cache should never block; start fresh.
+            return cache
+        if not isinstance(data, dict) or data.get("version") != FINDINGS_CACHE_VERSION:
+            return cache
+        if data.get("rules") != cache.rules:
+            cache._dirty = True
+            return cache
+        files = data.get("files")
+        if isinstance(files, dict):
+            cache._files = {k: v for k, v in files.items() if isinstance(v, dict)}
+        return cache
+
+    def matches_stat(self, rel: str, st: Any) -> bool:
+        entry = self._files.get(rel)
+        return entry is not None and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns
+
+    def get(self, rel: str, *, st: Any, sha256: str) -> Optional[Tuple[List[Finding], List[Tuple[str, str]]]]:
+        """Cached (text findings, notebook image parts) for an unchanged file.
+
+        Image parts are returned rather than their findings because approval
+        state can change while the file does not.
+        """
+
+        self._seen.add(rel)
+        entry = self._files.get(rel)
+        if (
+            entry is None
+            or entry.get("size") != st.st_size
+            or entry.get("mtime_ns") != st.st_mtime_ns
+            or entry.get("sha256") != sha256
+            or not isinstance(entry.get("findings"), list)
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        findings = [
+            Finding(
+                severity=f["severity"],
+                path=f.get("path", rel),
+                message=f["message"],
+                hint=f.get("hint"),
+                rule=f.get("rule", ""),
+                line=f.get("line"),
+                col=f.get("col"),
             )
+            for f in entry["findings"]
+        ]
+        images = [(str(fragment), str(sha)) for fragment, sha in entry.get("images") or []]
+        return findings, images
+
+    def put(
+        self,
+        rel: str,
+        *,
+        st: Any,
+        sha256: str,
+        findings: List[Finding],
+        images: Iterable[Tuple[str, str]] = (),
+    ) -> None:
+        self._seen.add(rel)
+        self._files[rel] = {
+            "size": int(st.st_size),
+            "mtime_ns": int(st.st_mtime_ns),
+            "sha256": sha256,
+            "findings": [
+                {
+                    "severity": f.severity,
+                    "path": f.path,
+                    "message": f.message,
+                    "hint": f.hint,
+                    "rule": f.rule,
+                    "line": f.line,
+                    "col": f.col,
+                }
+                for f in findings
+                if f.rule != "image"
+            ],
+            "images": [list(part) for part in images],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        for rel in [k for k in self._files if k not in self._seen]:
+            self._files.pop(rel, None)
+            self._dirty = True
+        if not self._dirty and self.path.exists():
+            return
+        payload = {"version": FINDINGS_CACHE_VERSION, "rules": self.rules, "files": self._files}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8", newline="\n")
+        self._dirty = False
+
+
+def validate_repo(
+    root: Path,
+    *,
+    approvals: Optional[Approvals] = None,
+    hash_cache: Optional[HashCache] = None,
+    index: Optional[RepoIndex] = None,
+    jobs: int = 1,
+    findings_cache: Optional[FindingsCache] = None,
+    all_matches: bool = False,
+) -> List[Finding]:
+    """Validate every indexed file under ``root``.
+
+    With ``jobs > 1`` files are validated in chunks on a process pool; the
+    merged findings are sorted by (path, rule) in both modes. With a
+    ``findings_cache``, unchanged text files reuse their cached findings
+    (the cache must have been built for the same ``all_matches`` mode).
+    """
+
+    findings: List[Finding] = []
+    if hash_cache is None:
+        hash_cache = HashCache(root=root)
+
+    if not root.exists() or not root.is_dir():
+        return [Finding("ERROR", ".", "Path does not exist or is not a directory.", rule="root")]
+
+    validate_required_files(root, findings)
+
+    if approvals is None:
+        approvals = _load_approval_manifest(root).get("approved") or {}
+    # Callers/tests may inject approvals; either way build the sha256 reverse index once.
+    approved_map = ApprovalIndex.coerce(approvals)
+
+    tasks: List[_FileTask] = []
+    stats: Dict[str, Any] = {}
+    cacheable: Dict[str, str] = {}  # abs path -> finding path, for text files to (re)cache
+    for entry in iter_files(root, index=index):
+        # Do not scan the validator itself for integrity keywords.
+        if entry.name == Path(__file__).name:
             continue
+        cache_text = findings_cache is not None and entry.suffix in BROAD_TEXT_EXTENSIONS
+        want_hash = entry.suffix in HASHED_EXTENSIONS or cache_text
+        sha: Optional[str] = None
+        if want_hash:
+            sha = hash_cache.lookup(entry.path, st=entry.stat)
+            stats[str(entry.path)] = entry.stat
+        if cache_text:
+            assert findings_cache is not None
+            rel = _safe_relpath(root, entry.path)
+            if findings_cache.matches_stat(rel, entry.stat):
+                if sha is None:
+                    try:
+                        sha = hash_cache.sha256(entry.path, st=entry.stat)
+                    except Exception:
+                        sha = None
+                cached = findings_cache.get(rel, st=entry.stat, sha256=sha) if sha else None
+                if cached is not None:
+                    cached_findings, cached_images = cached
+                    findings.extend(cached_findings)
+                    add_notebook_image_findings(root, entry.path, findings, cached_images, approvals=approved_map)
+                    continue
+            cacheable[str(entry.path)] = rel
+        tasks.append((str(entry.path), entry.suffix, sha, want_hash))
+
+    results: Iterable[Tuple[List[_FileResult], Dict[str, str]]]
+    if jobs > 1 and len(tasks) > 1:
+        chunks = _chunked(tasks, jobs=jobs)
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(chunks)),
+            initializer=_init_worker,
+            initargs=(root, approved_map, all_matches),
+        ) as pool:
+            results = list(pool.map(_validate_worker_chunk, chunks))
+    else:
+        results = [_validate_chunk(root, tasks, approved_map, all_matches)]
+
+    digests: Dict[str, str] = {path_str: sha for path_str, _suffix, sha, _want in tasks if sha}
+    for file_results, new_hashes in results:
+        for path_str, digest in new_hashes.items():
+            hash_cache.record(Path(path_str), st=stats[path_str], sha256=digest)
+        digests.update(new_hashes)
+        for path_str, file_findings, images in file_results:
+            findings.extend(file_findings)
+            rel = cacheable.get(path_str)
+            if findings_cache is not None and rel is not None and path_str in digests:
+                findings_cache.put(
+                    rel, st=stats[path_str], sha256=digests[path_str], findings=file_findings, images=images
+                )
+
+    return _sort_findings(findings)
 
-        if suffix in BROAD_TEXT_EXTENSIONS:
-            text = read_text_safely(path)
-            if text is None:
-                add_finding(root, findings, "WARN", path, "Could not read text file reliably.")
-                continue
-            validate_text_file(
-                root,
-                path,
-                text,
-                findings,
-                apply_integrity_patterns=should_apply_integrity_patterns(root, path),
-            )
 
-    return findings
+def _format_location(f: Finding) -> str:
+    if f.line is None:
+        return f.path
+    return f"{f.path}:{f.line}:{f.col}"
 
 
 def write_reports(root: Path, findings: List[Finding], report_dir: Path) -> None:
@@ -488,7 +1110,7 @@ def write_reports(root: Path, findings: List[Finding], report_dir: Path) -> None
         md_lines.append("No findings. [OK]")
     else:
         for f in findings:
-            md_lines.append(f"- [{f.severity}] `{f.path}` — {f.message}")
+            md_lines.append(f"- [{f.severity}] `{_format_location(f)}` — {f.message}")
             if f.hint:
                 md_lines.append(f"  - hint: {f.hint}")
 
@@ -500,7 +1122,15 @@ def write_reports(root: Path, findings: List[Finding], report_dir: Path) -> None
         "status": status,
         "counts": {"total": len(findings), "error": len(errors), "warn": len(warns)},
         "findings": [
-            {"severity": f.severity, "path": f.path, "message": f.message, "hint": f.hint}
+            {
+                "severity": f.severity,
+                "path": f.path,
+                "rule": f.rule,
+                "line": f.line,
+                "col": f.col,
+                "message": f.message,
+                "hint": f.hint,
+            }
             for f in findings
         ],
         "notes": "Automated scan; indicates risk signals only.",
@@ -508,18 +1138,96 @@ def write_reports(root: Path, findings: List[Finding], report_dir: Path) -> None
     json_path.write_text(json.dumps(json_payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
-def main(argv: List[str]) -> int:
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return n
+
+
+def main(
+    argv: List[str],
+    *,
+    index: Optional[RepoIndex] = None,
+    hash_cache: Optional[HashCache] = None,
+    state_store: Optional[StateStore] = None,
+) -> int:
+    """CLI entry point.
+
+    In-process callers (maintain.py) may pass a shared repo index, hash
+    cache and state store; the caller then owns saving/closing them.
+    """
+
     ap = argparse.ArgumentParser(description="Validate a notes repo for common public-sharing risks.")
     ap.add_argument("--path", default=".", help="Repository root path")
     ap.add_argument("--strict", action="store_true", help="Fail on WARN findings as well as ERROR")
     ap.add_argument("--report-dir", default="reports", help="Directory (relative to root) to write compliance reports")
+    ap.add_argument(
+        "--all-matches",
+        action="store_true",
+        help="Report every email/phone/pattern hit in a text file (default: first hit per rule)",
+    )
+    ap.add_argument(
+        "--no-findings-cache",
+        action="store_true",
+        help="Rescan every text file instead of reusing cached findings for unchanged files",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Validate files on N worker processes (default: 1, in-process)",
+    )
+    ap.add_argument(
+        "--state-db",
+        default=None,
+        help="SQLite state store (relative to root) for digests, findings and the approval mirror",
+    )
     args = ap.parse_args(argv)
 
     root = Path(args.path).resolve()
-    findings = validate_repo(root)
+    report_dir = root / args.report_dir
+
+    owns_store = state_store is None and args.state_db is not None
+    if owns_store:
+        state_store = StateStore(root / args.state_db)
+
+    # Image/presentation digests are reused across runs while their stat is
+    # unchanged; the cache lives at the repo-wide location whatever --report-dir is.
+    owns_cache = hash_cache is None
+    if hash_cache is None:
+        if state_store is not None:
+            hash_cache = HashCache.from_store(state_store, root=root)
+        else:
+            hash_cache = HashCache.for_repo(root)
+    findings_cache = (
+        None
+        if args.no_findings_cache
+        else FindingsCache.load(report_dir / FINDINGS_CACHE_NAME, all_matches=args.all_matches)
+    )
+    approvals: Optional[Dict[str, Any]] = None
+    if state_store is not None:
+        approvals = _load_approval_manifest(root).get("approved") or {}
+    findings = validate_repo(
+        root,
+        approvals=approvals,
+        hash_cache=hash_cache,
+        index=index,
+        jobs=args.jobs,
+        findings_cache=findings_cache,
+        all_matches=args.all_matches,
+    )
+    if findings_cache is not None:
+        findings_cache.save()
+    if owns_cache:
+        hash_cache.save()
+    if state_store is not None:
+        state_store.replace_findings(findings)
+        state_store.replace_approvals(approvals or {})
+        if owns_store:
+            state_store.close()
 
     # Always write a sanitized compliance report.
-    report_dir = root / args.report_dir
     write_reports(root, findings, report_dir)
 
     # Print a simple report (sanitized)
@@ -532,7 +1240,7 @@ def main(argv: List[str]) -> int:
     print("")
 
     for f in findings:
-        print(f"[{f.severity}] {f.path}: {f.message}")
+        print(f"[{f.severity}] {_format_location(f)}: {f.message}")
         if f.hint:
             print(f"        hint: {f.hint}")
 
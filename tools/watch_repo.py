@@ -0,0 +1,306 @@
+"""watch_repo.py
+
+Filesystem change notification for ``maintain.py --watch``.
+
+Two backends share one interface (``wait(timeout) -> WatchBatch``):
+
+- ``InotifyWatcher`` (Linux): inotify through ctypes, one watch per
+  directory under the watched roots (new directories are picked up as they
+  appear). Event latency is immediate. If a new directory cannot be watched
+  (e.g. ``fs.inotify.max_user_watches`` is exhausted), it switches to
+  polling and reports an overflow batch so callers rescan.
+- ``PollingWatcher`` (everywhere else, or when inotify is unavailable):
+  re-stats the watched trees every ``poll_interval`` seconds and diffs
+  (size, mtime_ns).
+
+``wait`` debounces: after the first change it keeps collecting until the
+tree has been quiet for ``debounce`` seconds, so an editor's
+write-rename-chmod sequence becomes one batch.
+
+Standard-library only.
+"""
+
+from __future__ import annotations
+
+import abc
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+try:
+    from tools.repo_scan import SCAN_PRUNE_DIRS, scan_repo
+except ImportError:  # executed as a script: python tools/watch_repo.py
+    from repo_scan import SCAN_PRUNE_DIRS, scan_repo
+
+
+DEFAULT_DEBOUNCE_S = 0.25
+DEFAULT_POLL_INTERVAL_S = 1.0
+
+
+@dataclass
+class WatchBatch:
+    paths: Set[Path] = field(default_factory=set)
+    # The backend lost events (inotify queue overflow); callers should rescan.
+    overflow: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.paths) or self.overflow
+
+    def merge(self, other: "WatchBatch") -> None:
+        self.paths |= other.paths
+        self.overflow = self.overflow or other.overflow
+
+
+class _Watcher(abc.ABC):
+    @abc.abstractmethod
+    def _poll(self, timeout: float) -> WatchBatch:
+        """Return the changes seen within ``timeout`` seconds (may be empty)."""
+
+    def close(self) -> None:
+        pass
+
+    def wait(self, timeout: Optional[float] = None, *, debounce: float = DEFAULT_DEBOUNCE_S) -> WatchBatch:
+        """Block until something changes (or ``timeout``), then debounce."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        batch = WatchBatch()
+        while not batch:
+            remaining = 1.0 if deadline is None else deadline - time.monotonic()
+            if remaining <= 0:
+                return batch
+            batch.merge(self._poll(min(remaining, 1.0)))
+        while True:
+            more = self._poll(debounce)
+            if not more:
+                return batch
+            batch.merge(more)
+
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class InotifyWatcher(_Watcher):
+    """Recursive inotify watcher (Linux only).
+
+    Raises OSError if inotify is unavailable or a directory under the roots
+    cannot be watched (e.g. the per-user watch limit is reached).
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        *,
+        recursive_roots: Iterable[Path] = (),
+        poll_interval: float = DEFAULT_POLL_INTERVAL_S,
+    ) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self._roots = list(roots)
+        self._recursive_roots = list(recursive_roots)
+        self._poll_interval = poll_interval
+        # Set once a watch could not be added at runtime; _poll delegates to it.
+        self._fallback: Optional[PollingWatcher] = None
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._dirs: Dict[int, Path] = {}
+        self._recursive: Set[Path] = set()
+        try:
+            for root in self._roots:
+                self._watch_dir(root)
+            for root in self._recursive_roots:
+                self._watch_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    @property
+    def polling(self) -> bool:
+        """True once the watcher has fallen back to stat polling."""
+
+        return self._fallback is not None
+
+    def _watch_dir(self, directory: Path) -> None:
+        wd = self._add_watch(self._fd, os.fsencode(str(directory)), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return  # removed before the watch was added; its parent's event covers it
+            raise OSError(err, f"inotify_add_watch: {os.strerror(err)}", str(directory))
+        self._dirs[wd] = directory
+
+    def _watch_tree(self, root: Path) -> None:
+        if not root.is_dir():
+            return
+        self._recursive.add(root)
+        self._watch_dir(root)
+        for rel in scan_repo(root).dirs:
+            self._watch_dir(root / rel)
+
+    def _in_recursive_root(self, path: Path) -> bool:
+        return any(path == r or r in path.parents for r in self._recursive)
+
+    def _poll(self, timeout: float) -> WatchBatch:
+        if self._fallback is not None:
+            return self._fallback._poll(timeout)
+        batch = WatchBatch()
+        ready, _w, _x = select.select([self._fd], [], [], max(0.0, timeout))
+        if not ready:
+            return batch
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return batch
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = data[offset : offset + name_len].rstrip(b"\0")
+            offset += name_len
+
+            if mask & _IN_Q_OVERFLOW:
+                batch.overflow = True
+                continue
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(raw_name) if raw_name else directory
+            if mask & _IN_ISDIR:
+                if path.name in SCAN_PRUNE_DIRS:
+                    continue
+                if mask & (_IN_CREATE | _IN_MOVED_TO) and self._in_recursive_root(path):
+                    # Watch the new subtree; files created before the watch
+                    # existed are covered by reporting the directory itself.
+                    try:
+                        self._watch_tree(path)
+                    except OSError:
+                        # Out of watches: a partly watched tree would miss
+                        # events silently, so poll everything from now on.
+                        self._fall_back_to_polling()
+                        return WatchBatch(overflow=True)
+            batch.paths.add(path)
+        return batch
+
+    def _fall_back_to_polling(self) -> None:
+        self.close()
+        self._dirs.clear()
+        self._fallback = PollingWatcher(
+            self._roots, recursive_roots=self._recursive_roots, poll_interval=self._poll_interval
+        )
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher(_Watcher):
+    """Portable fallback: stat the watched trees and diff (size, mtime_ns)."""
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        *,
+        recursive_roots: Iterable[Path] = (),
+        poll_interval: float = DEFAULT_POLL_INTERVAL_S,
+    ) -> None:
+        self._roots = list(roots)
+        self._recursive = list(recursive_roots)
+        self.poll_interval = poll_interval
+        self._snapshot = self._take()
+
+    def _take(self) -> Dict[Path, Tuple[int, int]]:
+        snap: Dict[Path, Tuple[int, int]] = {}
+        for root in self._roots:
+            try:
+                it = os.scandir(root)
+            except OSError:
+                continue
+            with it:
+                for de in it:
+                    try:
+                        if de.is_file():
+                            st = de.stat()
+                            snap[Path(de.path)] = (st.st_size, st.st_mtime_ns)
+                    except OSError:
+                        continue
+        for root in self._recursive:
+            for e in scan_repo(root).files:
+                snap[e.path] = (e.size, e.mtime_ns)
+        return snap
+
+    def _poll(self, timeout: float) -> WatchBatch:
+        time.sleep(max(0.0, min(timeout, self.poll_interval)))
+        current = self._take()
+        prev, self._snapshot = self._snapshot, current
+        changed = {p for p in prev.keys() | current.keys() if prev.get(p) != current.get(p)}
+        return WatchBatch(paths=changed)
+
+
+def open_watcher(
+    roots: Iterable[Path],
+    *,
+    recursive_roots: Iterable[Path] = (),
+    poll_interval: float = DEFAULT_POLL_INTERVAL_S,
+    force_polling: bool = False,
+) -> _Watcher:
+    """Watch ``roots`` (top level only) and ``recursive_roots`` (whole trees).
+
+    Uses inotify when available, otherwise polling.
+    """
+
+    roots = list(roots)
+    recursive_roots = list(recursive_roots)
+    if not force_polling:
+        try:
+            return InotifyWatcher(roots, recursive_roots=recursive_roots, poll_interval=poll_interval)
+        except (OSError, AttributeError):
+            # No inotify (non-Linux, missing libc symbol, or watch limit reached).
+            pass
+    return PollingWatcher(roots, recursive_roots=recursive_roots, poll_interval=poll_interval)
+
+
+def describe(watcher: _Watcher) -> str:
+    return "inotify" if isinstance(watcher, InotifyWatcher) and not watcher.polling else "polling"
+